@@ -0,0 +1,159 @@
+import abc
+import json
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+
+class CacheBackend(abc.ABC):
+    """캐시 저장소 인터페이스 (값은 JSON 직렬화 가능한 객체)"""
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def add(self, key: str, value: Any, ttl: float) -> bool:
+        """키가 없을 때만 저장합니다 (저장했으면 True)."""
+        raise NotImplementedError
+
+
+class LocalTTLCache:
+    """
+    프로세스 내 TTL + LRU 캐시 (동기 API, 스레드 안전)
+    max_size를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    max_bytes를 지정하면 sizeof로 잰 값 크기의 합도 그 이하로 유지합니다 (max_bytes보다 큰 값은 저장하지 않음).
+    """
+
+    def __init__(self, max_size: int = 10000, max_bytes: Optional[int] = None,
+                 sizeof: Optional[Callable[[Any], int]] = None):
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof or (lambda value: 0)
+        self.total_bytes = 0
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at, size = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        size = self.sizeof(value)
+        with self._lock:
+            self._store(key, value, ttl, size)
+
+    def add(self, key: str, value: Any, ttl: float) -> bool:
+        """키가 없거나 만료되었을 때만 저장합니다 (저장했으면 True)."""
+        size = self.sizeof(value)
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[1] > time.monotonic():
+                return False
+            self._store(key, value, ttl, size)
+            return True
+
+    def _store(self, key: str, value: Any, ttl: float, size: int) -> None:
+        self._remove(key)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        self._data[key] = (value, time.monotonic() + ttl, size)
+        self.total_bytes += size
+        while len(self._data) > self.max_size or (
+            self.max_bytes is not None and self.total_bytes > self.max_bytes
+        ):
+            _, (_, _, evicted) = self._data.popitem(last=False)
+            self.total_bytes -= evicted
+
+    def _remove(self, key: str) -> None:
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry[2]
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class LocalCacheBackend(CacheBackend):
+    """프로세스 내 캐시 저장소 (단일 워커용 기본값)"""
+
+    def __init__(self, max_size: int = 10000):
+        self.cache = LocalTTLCache(max_size)
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self.cache.get(key)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self.cache.set(key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        self.cache.delete(key)
+
+    async def add(self, key: str, value: Any, ttl: float) -> bool:
+        return self.cache.add(key, value, ttl)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Redis 공유 캐시 저장소 (여러 uvicorn 워커 간 무효화 공유)
+    redis 패키지는 이 저장소를 사용할 때만 필요합니다.
+    """
+
+    def __init__(self, url: str, prefix: str = "policy-insight:"):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("RedisCacheBackend를 사용하려면 redis 패키지를 설치해야 합니다") from e
+        self.client = redis.from_url(url)
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self.client.get(self.prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        await self.client.set(self.prefix + key, json.dumps(value, ensure_ascii=False), px=int(ttl * 1000))
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self.prefix + key)
+
+    async def add(self, key: str, value: Any, ttl: float) -> bool:
+        stored = await self.client.set(
+            self.prefix + key, json.dumps(value, ensure_ascii=False), px=int(ttl * 1000), nx=True
+        )
+        return bool(stored)
+
+
+def create_cache_backend(kind: str, max_size: int = 10000, redis_url: Optional[str] = None) -> CacheBackend:
+    """설정값(kind: local | redis)에 따라 캐시 저장소를 생성합니다."""
+    if kind == "redis":
+        if not redis_url:
+            raise RuntimeError("redis 캐시 저장소에는 Redis URL 설정이 필요합니다")
+        return RedisCacheBackend(redis_url)
+    return LocalCacheBackend(max_size)
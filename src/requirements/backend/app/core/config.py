@@ -8,10 +8,101 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30  # 30분
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7  # 7일
+    REFRESH_TOKEN_MAX_SESSIONS: int = 10  # 회원당 동시에 유지하는 리프레시 토큰(세션) 수
+    REFRESH_TOKEN_PURGE_INTERVAL_SECONDS: int = 3600  # 만료된 리프레시 토큰 일괄 삭제 주기 (초)
+    
+    # 비밀번호 해시 설정 (scrypt, N=2^LOG_N, 메모리 사용량 = 128 * R * N 바이트)
+    PASSWORD_SCRYPT_LOG_N: int = 14  # 16MiB, 약 50ms (값을 올리면 기존 해시는 로그인 시 재해시)
+    PASSWORD_SCRYPT_R: int = 8
+    PASSWORD_SCRYPT_P: int = 1
+    PASSWORD_HASH_WORKERS: Optional[int] = None  # 해시 스레드 수 (기본값: CPU 코어 수)
+    PASSWORD_HASH_MAX_QUEUE: int = 64  # 스레드를 기다릴 수 있는 최대 작업 수 (초과 시 503)
     
     # 데이터베이스 설정
     DATABASE_URL: Optional[str] = None
     
+    # 데이터베이스 커넥션 풀 설정 (uvicorn 워커 프로세스당, 동기/비동기 엔진 각각 적용)
+    DB_POOL_SIZE: int = 5  # 상시 유지 커넥션 수
+    DB_MAX_OVERFLOW: int = 10  # 풀 크기를 넘어 임시로 여는 최대 커넥션 수
+    DB_POOL_TIMEOUT: float = 30.0  # 커넥션 대기 최대 시간 (초)
+    DB_POOL_RECYCLE: int = 1800  # 커넥션 재생성 주기 (초, 유휴 커넥션 정리)
+    DB_POOL_PRE_PING: bool = True  # 체크아웃 시 커넥션 유효성 확인
+    DB_STATEMENT_TIMEOUT_MS: int = 10000  # 쿼리 실행 제한 시간 (ms, 0이면 제한 없음)
+    
+    # 읽기 전용 복제본 설정 (GET 엔드포인트의 조회 분산)
+    DB_REPLICA_URLS: str = ""  # 쉼표로 구분한 복제본 URL 목록 (비어 있으면 모두 primary 사용)
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5.0  # 복제 지연이 이 값을 넘는 복제본은 사용하지 않음
+    DB_REPLICA_CHECK_INTERVAL_SECONDS: int = 5  # 복제 지연 확인 주기 (초)
+    DB_REPLICA_CHECK_TIMEOUT_SECONDS: float = 2.0  # 복제 지연 확인 제한 시간 (초)
+    DB_READ_YOUR_WRITES_SECONDS: int = 30  # 정보를 수정한 회원은 이 시간 동안 primary에서 읽음
+    # 앱 시작 시 스키마 처리 방식
+    # migrate: 미적용 마이그레이션만 적용 / none: 스키마 확인 안 함 (python -m app.migrations upgrade 로 별도 적용) / create_all: 기존 방식
+    DB_SCHEMA_MODE: str = "migrate"
+    
+    # 로그인 기록 write-behind 큐 설정 (uvicorn 워커 프로세스당)
+    LOGIN_HISTORY_QUEUE_SIZE: int = 10000  # 큐 최대 이벤트 수 (가득 차면 요청 안에서 바로 기록)
+    LOGIN_HISTORY_BATCH_SIZE: int = 500  # 한 번에 기록하는 최대 이벤트 수
+    LOGIN_HISTORY_FLUSH_INTERVAL: float = 1.0  # 배치를 모으는 최대 대기 시간 (초)
+    LOGIN_HISTORY_SPILL_PATH: str = "login_history_spill.jsonl"  # 기록하지 못한 이벤트 보관 파일
+    
+    # 로그인 기록 월별 파티션 설정
+    LOGIN_HISTORY_PARTITION_MONTHS_AHEAD: int = 2  # 미리 만들어 두는 다음 달 파티션 수
+    LOGIN_HISTORY_RETENTION_MONTHS: int = 12  # 보관 기간 (개월, 지난 파티션은 압축 보관 후 삭제, 0이면 무기한)
+    LOGIN_HISTORY_ARCHIVE_DIR: str = "login_history_archive"  # 보관 파일(csv.gz) 저장 디렉터리
+    LOGIN_HISTORY_MAINTENANCE_INTERVAL_SECONDS: int = 86400  # 파티션 관리 주기 (초)
+    
+    # 뉴스 검색 설정
+    SEARCH_MAX_CANDIDATES: int = 1000  # 순위를 계산할 최대 후보 수 (최신 게시일 순으로 제한)
+    SEARCH_MAX_SCAN: int = 5000  # 바이그램 인덱스 후보 중 본문(ILIKE)을 확인할 최대 수 (최신 게시일 순으로 제한)
+    
+    # 응답 압축 설정
+    COMPRESSION_MINIMUM_SIZE: int = 1024  # 이 크기(bytes) 미만 응답은 압축하지 않음
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4  # 0-11 (높을수록 느리지만 작음)
+    
+    # 실시간 뉴스 스트림(SSE) 설정
+    NEWS_STREAM_ENABLED: bool = True
+    NEWS_STREAM_CLIENT_BUFFER: int = 100  # 구독자별 대기 이벤트 수 (초과하면 연결을 끊고 재연결 시 이어 받음)
+    NEWS_STREAM_REPLAY_SIZE: int = 1000  # 재연결 시 이어 보내기 위해 워커가 보관하는 최근 이벤트 수
+    NEWS_STREAM_RESUME_MAX: int = 500  # 재연결 시 DB에서 이어 보내는 최대 뉴스 수 (초과 시 reset 이벤트)
+    NEWS_STREAM_RESCAN_IDS: int = 1000  # 마지막으로 전달한 news_id 아래로 다시 확인하는 범위 (ID를 먼저 받고 늦게 커밋된 뉴스 전달)
+    NEWS_STREAM_MAX_SUBSCRIBERS: int = 5000  # 워커당 최대 구독자 수
+    NEWS_STREAM_HEARTBEAT_SECONDS: int = 15  # keep-alive 주석 전송 간격 (초)
+    NEWS_STREAM_POLL_SECONDS: int = 60  # 알림을 놓친 경우를 대비한 새 뉴스 확인 주기 (초)
+    NEWS_STREAM_RETRY_MS: int = 3000  # 클라이언트 재연결 대기 시간 (SSE retry)
+    
+    # 뉴스 내보내기 설정
+    EXPORT_BATCH_SIZE: int = 1000  # 서버 측 커서에서 한 번에 가져와 인코딩하는 행 수
+    EXPORT_STATEMENT_TIMEOUT_MS: int = 600000  # 내보내기 쿼리 실행 제한 시간 (ms, 0이면 제한 없음)
+    EXPORT_MAX_RANGE_DAYS: int = 366  # API로 한 번에 내보낼 수 있는 최대 게시일 기간 (일)
+    
+    # 요청 프로파일링 설정
+    PROFILING_ENABLED: bool = True
+    PROFILING_N_PLUS_ONE_THRESHOLD: int = 5  # 한 요청에서 같은 SELECT가 이 횟수 이상 실행되면 N+1 의심으로 기록
+    PROFILING_SERVER_TIMING: bool = False  # 응답에 Server-Timing 헤더 추가
+    
+    # 캐시 설정
+    CACHE_REDIS_URL: Optional[str] = None  # redis 캐시 저장소 사용 시 접속 URL
+    MEMBER_CACHE_BACKEND: str = "local"  # local(워커 프로세스 내) | redis(워커 간 공유)
+    MEMBER_CACHE_TTL_SECONDS: int = 30  # 회원 인증 상태 캐시 유지 시간 (초)
+    MEMBER_CACHE_MAX_SIZE: int = 10000  # 워커당 최대 캐시 항목 수 (local)
+    MEMBER_CACHE_TOMBSTONE_SECONDS: int = 10  # 무효화 후 캐시를 다시 채우지 않는 시간 (진행 중이던 조회가 끝날 때까지)
+    RESPONSE_CACHE_MAX_SIZE: int = 5000  # 직렬화된 GET 응답 캐시 항목 수 (워커당)
+    RESPONSE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # 직렬화된 GET 응답 캐시 본문 크기 합계 상한 (워커당, 바이트)
+    NEWS_DETAIL_CACHE_SECONDS: int = 3600  # 뉴스 상세 응답 캐시 시간 (Cache-Control max-age)
+    NEWS_LIST_CACHE_SECONDS: int = 30  # 뉴스 목록/검색 응답 캐시 시간 (새 기사 반영 지연 허용 범위)
+    TOKEN_CACHE_MAX_SIZE: int = 10000  # 검증된 액세스 토큰 페이로드 캐시 크기 (0이면 사용 안 함)
+    
+    # 인증 엔드포인트 요청 제한 (로그인, 회원가입, 아이디 찾기, 비밀번호 재설정)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "local"  # local(워커 프로세스 내) | redis(워커 간 공유, CACHE_REDIS_URL 사용)
+    RATE_LIMIT_WINDOW_SECONDS: int = 60  # 슬라이딩 윈도우 길이 (초)
+    RATE_LIMIT_IP_MAX_REQUESTS: int = 30  # 윈도우당 IP별 최대 요청 수 (엔드포인트별)
+    RATE_LIMIT_EMAIL_MAX_REQUESTS: int = 5  # 윈도우당 이메일별 최대 요청 수 (엔드포인트별)
+    RATE_LIMIT_MAX_KEYS: int = 100000  # local 저장소 최대 키 수
+    RATE_LIMIT_TRUST_PROXY_HEADER: bool = False  # 신뢰하는 프록시에서 온 요청만 X-Real-IP 헤더를 클라이언트 IP로 사용
+    RATE_LIMIT_TRUSTED_PROXIES: str = ""  # X-Real-IP를 신뢰할 프록시 주소/대역 (쉼표로 구분, 예: 172.16.0.0/12)
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -1,13 +1,65 @@
 import os
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker
+from .config import settings
+from .pool import InstrumentedQueuePool, InstrumentedAsyncQueuePool, pool_metrics
 
 SQLALCHEMY_DATABASE_URL = os.getenv("POSTGRES_URL")
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+
+def to_async_url(url: str) -> str:
+    """동기 드라이버(psycopg2) URL을 asyncpg URL로 변환합니다."""
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+# 커넥션 풀 공통 설정 (Settings)
+POOL_OPTIONS = {
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+    "pool_pre_ping": settings.DB_POOL_PRE_PING,
+}
+
+# 쿼리 실행 제한 시간 (드라이버별 전달 방식이 다름)
+SYNC_CONNECT_ARGS = {}
+ASYNC_CONNECT_ARGS = {}
+if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+    SYNC_CONNECT_ARGS["options"] = f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+    ASYNC_CONNECT_ARGS["server_settings"] = {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}
+
+# 동기 엔진 - 스키마 생성 및 스크립트용
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    poolclass=InstrumentedQueuePool,
+    connect_args=SYNC_CONNECT_ARGS,
+    **POOL_OPTIONS
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 엔진 - API 요청 처리용 (이벤트 루프를 막지 않음)
+async_engine = create_async_engine(
+    to_async_url(SQLALCHEMY_DATABASE_URL),
+    poolclass=InstrumentedAsyncQueuePool,
+    connect_args=ASYNC_CONNECT_ARGS,
+    **POOL_OPTIONS
+)
+
+# 풀 지표에 실제 풀 연결 (/health/db 에서 조회)
+pool_metrics["sync"].pool = engine.pool
+pool_metrics["async"].pool = async_engine.sync_engine.pool
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 Base = declarative_base()
 
 def get_db():
@@ -17,12 +69,17 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
 # 모델을 사용할 수 있도록 import
 # 이 import는 Base 정의 후에 와야 합니다
 # 회원 관련 모델
 from app.models.member import Member
 from app.models.login_history import LoginHistory
 from app.models.social_account import SocialAccount
+from app.models.refresh_token import RefreshToken
 
 # 정책 인사이트 관련 모델
 from app.models.news import News
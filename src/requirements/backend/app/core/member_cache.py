@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+from typing import Optional
+from .cache import create_cache_backend
+from .config import settings
+from .db import async_engine
+
+
+# 인증에 필요한 회원 상태와 내 정보 조회 응답 필드만 캐시
+CACHED_FIELDS = (
+    "member_id",
+    "email",
+    "member_name",
+    "phone",
+    "profile_image",
+    "token_version",
+    "account_status",
+)
+
+member_cache = create_cache_backend(
+    settings.MEMBER_CACHE_BACKEND,
+    max_size=settings.MEMBER_CACHE_MAX_SIZE,
+    redis_url=settings.CACHE_REDIS_URL
+)
+
+
+def _key(member_id: int) -> str:
+    return f"member:{member_id}"
+
+
+# invalidate_member가 남기는 표시 - 무효화 전에 시작한 조회가 이전 상태를 다시 캐시하지 못하게 함
+TOMBSTONE = {"invalidated": True}
+
+
+async def get_cached_member(member_id: int) -> Optional[SimpleNamespace]:
+    """캐시된 회원 상태를 반환합니다 (Member와 같은 속성 이름으로 접근)."""
+    data = await member_cache.get(_key(member_id))
+    if data is None or data.get("invalidated"):
+        return None
+    return SimpleNamespace(**data)
+
+
+async def cache_member(member, db) -> None:
+    """
+    조회한 회원의 상태를 캐시에 저장합니다.
+
+    - primary에서 읽은 회원만 저장합니다 (복제본은 지연된 이전 상태일 수 있음).
+    - 키가 비어 있을 때만 저장하므로, 조회 도중 invalidate_member가 실행되었으면
+      그 표시가 남아 있는 동안 조회 결과(이전 상태)를 저장하지 않습니다.
+    """
+    if db.bind is not async_engine:
+        return
+    data = {field: getattr(member, field) for field in CACHED_FIELDS}
+    await member_cache.add(_key(member.member_id), data, settings.MEMBER_CACHE_TTL_SECONDS)
+
+
+async def invalidate_member(member_id: int) -> None:
+    """
+    회원 상태가 바뀌었을 때 캐시를 즉시 무효화합니다.
+    (토큰 버전 증가, 토큰 무효화, 회원 정보 수정, 탈퇴)
+
+    캐시를 지우는 대신 MEMBER_CACHE_TOMBSTONE_SECONDS 동안 무효화 표시를 남깁니다 (그동안은 DB에서 조회).
+    """
+    await member_cache.set(_key(member_id), TOMBSTONE, settings.MEMBER_CACHE_TOMBSTONE_SECONDS)
@@ -0,0 +1,125 @@
+import gzip
+import os
+import re
+from datetime import date
+from typing import List, Tuple
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+
+def month_start(d: date) -> date:
+    return date(d.year, d.month, 1)
+
+
+def add_months(d: date, months: int) -> date:
+    index = d.year * 12 + (d.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """월별 파티션 이름 (예: login_history_p202610)"""
+    return f"{table}_p{month:%Y%m}"
+
+
+def create_month_partition(conn: Connection, table: str, month: date) -> str:
+    """[month, 다음 달) 범위의 파티션을 만듭니다 (이미 있으면 건너뜀)."""
+    name = partition_name(table, month)
+    conn.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+    ))
+    return name
+
+
+def ensure_month_partitions(conn: Connection, table: str, start: date, months_ahead: int) -> List[str]:
+    """start가 속한 달부터 이번 달 + months_ahead 까지의 파티션을 준비합니다."""
+    month = month_start(start)
+    last = add_months(month_start(date.today()), months_ahead)
+    names = []
+    while month <= last:
+        names.append(create_month_partition(conn, table, month))
+        month = add_months(month, 1)
+    return names
+
+
+def list_month_partitions(conn: Connection, table: str) -> List[Tuple[str, date]]:
+    """부모 테이블에 연결된 월별 파티션 (이름, 시작 월) 목록을 오래된 순으로 반환합니다."""
+    rows = conn.execute(text("""
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = :table
+    """), {"table": table}).scalars()
+
+    pattern = re.compile(rf"^{re.escape(table)}_p(\d{{4}})(\d{{2}})$")
+    partitions = []
+    for name in rows:
+        match = pattern.match(name)
+        if match:
+            partitions.append((name, date(int(match.group(1)), int(match.group(2)), 1)))
+    return sorted(partitions, key=lambda p: p[1])
+
+
+def list_detached_month_partitions(conn: Connection, table: str) -> List[Tuple[str, date]]:
+    """
+    부모 테이블에서 분리되었지만 아직 삭제되지 않은 월별 파티션 목록 (보관 도중 중단된 경우)
+    """
+    rows = conn.execute(text("""
+        SELECT relname
+        FROM pg_class
+        WHERE relkind = 'r' AND NOT relispartition AND relname LIKE :prefix
+    """), {"prefix": f"{table}\\_p%"}).scalars()
+
+    pattern = re.compile(rf"^{re.escape(table)}_p(\d{{4}})(\d{{2}})$")
+    partitions = []
+    for name in rows:
+        match = pattern.match(name)
+        if match:
+            partitions.append((name, date(int(match.group(1)), int(match.group(2)), 1)))
+    return sorted(partitions, key=lambda p: p[1])
+
+
+def detach_partition(conn: Connection, table: str, partition: str) -> None:
+    """
+    파티션을 부모 테이블에서 분리합니다.
+
+    DETACH PARTITION ... CONCURRENTLY(PostgreSQL 14+)는 부모 테이블에 SHARE UPDATE EXCLUSIVE 잠금만 잡으므로
+    분리하는 동안에도 로그인/로그아웃 기록 쓰기가 막히지 않습니다.
+    트랜잭션 블록 안에서는 실행할 수 없으므로 conn은 AUTOCOMMIT 커넥션이어야 합니다.
+    이전 분리가 중단되어 대기(pending) 상태로 남은 파티션은 FINALIZE로 마무리합니다.
+    """
+    pending = conn.execute(
+        text("SELECT inhdetachpending FROM pg_inherits WHERE inhrelid = CAST(:partition AS regclass)"),
+        {"partition": partition}
+    ).scalar()
+    mode = "FINALIZE" if pending else "CONCURRENTLY"
+    conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {partition} {mode}"))
+
+
+def archive_detached_partition(conn: Connection, partition: str, archive_dir: str) -> str:
+    """
+    분리된 파티션 테이블을 CSV(gzip)로 보관한 뒤 삭제합니다.
+    대량 DELETE 없이 파티션 단위로 정리되며, 보관 파일이 완전히 기록된 뒤에만 DROP 합니다.
+    분리된 테이블에만 잠금을 잡으므로 부모 테이블 쓰기에는 영향이 없습니다.
+    (COPY는 psycopg2 드라이버를 사용하는 동기 엔진 커넥션에서 실행)
+
+    Returns:
+        보관 파일 경로
+    """
+    os.makedirs(archive_dir, exist_ok=True)
+    path = os.path.join(archive_dir, f"{partition}.csv.gz")
+    tmp_path = path + ".tmp"
+
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        with gzip.open(tmp_path, "wb") as f:
+            cursor.copy_expert(f"COPY {partition} TO STDOUT WITH (FORMAT csv, HEADER)", f)
+    finally:
+        cursor.close()
+    with open(tmp_path, "rb") as f:
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+    conn.execute(text(f"DROP TABLE {partition}"))
+    return path
@@ -0,0 +1,114 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+from fastapi import HTTPException, status
+from .config import settings
+from .security import hash_password, verify_password, verify_dummy_password
+
+
+class PasswordHasher:
+    """
+    비밀번호 해시/검증 전용 스레드 풀
+
+    hashlib.scrypt는 계산 중 GIL을 해제하므로 스레드 풀로도 코어 수만큼 병렬 처리되며,
+    이벤트 루프는 해시 계산(수십 ms) 동안에도 다른 요청을 계속 처리합니다.
+    실행 중 + 대기 중인 작업이 workers + max_queue를 넘으면 대기열을 늘리지 않고 바로 503으로 거부합니다.
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_queue: int = 64):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = self.workers + max_queue
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # 지표
+        self.pending = 0  # 실행 중 + 대기 중
+        self.completed = 0
+        self.rejected = 0
+        self.wait_seconds = 0.0  # 대기열에서 기다린 시간 합계
+        self.run_seconds = 0.0  # 해시 계산 시간 합계
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hasher")
+        return self._executor
+
+    @property
+    def queued(self) -> int:
+        return max(0, self.pending - self.workers)
+
+    async def _submit(self, func: Callable, *args):
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server busy",
+                headers={"Retry-After": "1"}
+            )
+
+        submitted = time.perf_counter()
+        started = []
+
+        def run():
+            started.append(time.perf_counter())
+            return func(*args)
+
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, run)
+        finally:
+            self.pending -= 1
+            finished = time.perf_counter()
+            if started:
+                self.completed += 1
+                self.wait_seconds += started[0] - submitted
+                self.run_seconds += finished - started[0]
+
+    async def hash(self, password: str) -> str:
+        """비밀번호를 해시화합니다 (스레드 풀에서 실행)."""
+        return await self._submit(hash_password, password)
+
+    async def verify(self, password: str, hashed_password: Optional[str]) -> Tuple[bool, bool]:
+        """비밀번호를 검증합니다 (스레드 풀에서 실행). (일치 여부, 재해시 필요 여부)"""
+        return await self._submit(verify_password, password, hashed_password)
+
+    async def verify_dummy(self, password: str) -> bool:
+        """회원이 없을 때 실제 검증과 같은 비용으로 더미 해시를 검증합니다 (스레드 풀에서 실행, 항상 False)."""
+        return await self._submit(verify_dummy_password, password)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 형식으로 지표를 반환합니다."""
+        lines = [
+            "# HELP password_hasher_workers 비밀번호 해시 스레드 수",
+            "# TYPE password_hasher_workers gauge",
+            f"password_hasher_workers {self.workers}",
+            "# HELP password_hasher_queue_depth 스레드를 기다리는 해시 작업 수",
+            "# TYPE password_hasher_queue_depth gauge",
+            f"password_hasher_queue_depth {self.queued}",
+            "# HELP password_hasher_in_flight 실행 중 + 대기 중인 해시 작업 수",
+            "# TYPE password_hasher_in_flight gauge",
+            f"password_hasher_in_flight {self.pending}",
+            "# HELP password_hasher_completed_total 완료된 해시 작업 수",
+            "# TYPE password_hasher_completed_total counter",
+            f"password_hasher_completed_total {self.completed}",
+            "# HELP password_hasher_rejected_total 대기열이 가득 차 거부된 해시 작업 수",
+            "# TYPE password_hasher_rejected_total counter",
+            f"password_hasher_rejected_total {self.rejected}",
+            "# HELP password_hasher_wait_seconds_total 대기열에서 기다린 시간 합계",
+            "# TYPE password_hasher_wait_seconds_total counter",
+            f"password_hasher_wait_seconds_total {self.wait_seconds:.6f}",
+            "# HELP password_hasher_run_seconds_total 해시 계산 시간 합계",
+            "# TYPE password_hasher_run_seconds_total counter",
+            f"password_hasher_run_seconds_total {self.run_seconds:.6f}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+password_hasher = PasswordHasher(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_QUEUE)
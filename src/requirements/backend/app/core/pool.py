@@ -0,0 +1,90 @@
+import time
+import threading
+from typing import Dict
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+
+class PoolMetrics:
+    """커넥션 풀 사용 현황 지표 (엔진별)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.pool = None
+        self.checkouts = 0
+        self.overflow_events = 0
+        self.timeouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def record_checkout(self, wait_seconds: float, overflowed: bool):
+        with self._lock:
+            self.checkouts += 1
+            self.wait_time_total += wait_seconds
+            if wait_seconds > self.wait_time_max:
+                self.wait_time_max = wait_seconds
+            if overflowed:
+                self.overflow_events += 1
+
+    def record_timeout(self, wait_seconds: float):
+        with self._lock:
+            self.timeouts += 1
+            self.wait_time_total += wait_seconds
+            if wait_seconds > self.wait_time_max:
+                self.wait_time_max = wait_seconds
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            pool = self.pool
+            return {
+                "pool_size": pool.size() if pool else 0,
+                "checked_out": pool.checkedout() if pool else 0,
+                "checked_in": pool.checkedin() if pool else 0,
+                "overflow": pool.overflow() if pool else 0,
+                "checkouts": self.checkouts,
+                "overflow_events": self.overflow_events,
+                "timeouts": self.timeouts,
+                "wait_time_avg_ms": round(self.wait_time_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                "wait_time_max_ms": round(self.wait_time_max * 1000, 3),
+            }
+
+
+# 엔진 이름 -> 지표
+pool_metrics: Dict[str, PoolMetrics] = {
+    "sync": PoolMetrics("sync"),
+    "async": PoolMetrics("async"),
+}
+
+
+class _InstrumentedPoolMixin:
+    """커넥션 체크아웃 대기 시간과 오버플로 발생을 기록하는 풀"""
+
+    metrics: PoolMetrics = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        overflow_before = self.overflow()
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_timeout(time.perf_counter() - start)
+            raise
+        # 풀 크기를 넘어 새 커넥션을 연 경우 overflow 값이 증가함
+        self.metrics.record_checkout(time.perf_counter() - start, self.overflow() > overflow_before and self.overflow() > 0)
+        return conn
+
+    def recreate(self):
+        # 풀 재생성(dispose 등) 시에도 같은 지표를 이어서 사용
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        self.metrics.pool = pool
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    metrics = pool_metrics["sync"]
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    metrics = pool_metrics["async"]
@@ -0,0 +1,205 @@
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+
+# 요청 처리 시간 히스토그램 버킷 (ms)
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class RequestProfile:
+    """요청 하나에서 실행된 SQL 통계"""
+
+    __slots__ = ("statements", "db_time", "statement_counts", "lazy_loads")
+
+    def __init__(self):
+        self.statements = 0
+        self.db_time = 0.0
+        # SQL 문(파라미터 제외) -> 실행 횟수 (N+1 감지용)
+        self.statement_counts: Dict[str, int] = {}
+        # 관계 이름(예: Member.login_histories) -> lazy load 횟수
+        self.lazy_loads: Dict[str, int] = {}
+
+    def record(self, statement: str, elapsed: float):
+        self.statements += 1
+        self.db_time += elapsed
+        self.statement_counts[statement] = self.statement_counts.get(statement, 0) + 1
+
+    def repeated_statements(self, threshold: int) -> List[Tuple[str, int]]:
+        """threshold회 이상 반복된 SELECT 문 (관계 lazy load 등 N+1 패턴)"""
+        return [
+            (statement, count)
+            for statement, count in self.statement_counts.items()
+            if count >= threshold and statement.lstrip().upper().startswith("SELECT")
+        ]
+
+    def repeated_lazy_loads(self, threshold: int) -> List[Tuple[str, int]]:
+        """threshold회 이상 lazy load된 관계"""
+        return [(name, count) for name, count in self.lazy_loads.items() if count >= threshold]
+
+
+# 현재 요청의 프로파일 (비동기 엔진 이벤트도 같은 컨텍스트에서 실행됨)
+_current_profile: ContextVar[Optional[RequestProfile]] = ContextVar("current_profile", default=None)
+
+
+class RouteStats:
+    """라우트별 누적 지표"""
+
+    __slots__ = ("bucket_counts", "count", "latency_sum_ms", "statements", "db_time_ms", "n_plus_one", "lazy_loads")
+
+    def __init__(self):
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.latency_sum_ms = 0.0
+        self.statements = 0
+        self.db_time_ms = 0.0
+        self.n_plus_one = 0
+        self.lazy_loads: Dict[str, int] = {}
+
+
+class ProfilingMetrics:
+    """워커 프로세스 내 라우트별 지표 집계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.routes: Dict[Tuple[str, str], RouteStats] = {}
+
+    def record(self, method: str, route: str, latency_ms: float, profile: RequestProfile, n_plus_one: bool):
+        with self._lock:
+            stats = self.routes.get((method, route))
+            if stats is None:
+                stats = self.routes[(method, route)] = RouteStats()
+            stats.bucket_counts[bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+            stats.count += 1
+            stats.latency_sum_ms += latency_ms
+            stats.statements += profile.statements
+            stats.db_time_ms += profile.db_time * 1000
+            if n_plus_one:
+                stats.n_plus_one += 1
+            for name, count in profile.lazy_loads.items():
+                stats.lazy_loads[name] = stats.lazy_loads.get(name, 0) + count
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 형식으로 지표를 반환합니다."""
+        lines = [
+            "# HELP http_request_duration_ms 요청 처리 시간 (ms)",
+            "# TYPE http_request_duration_ms histogram",
+        ]
+        with self._lock:
+            routes = sorted(self.routes.items())
+            for (method, route), stats in routes:
+                labels = f'method="{method}",route="{route}"'
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS_MS, stats.bucket_counts):
+                    cumulative += count
+                    lines.append(f'http_request_duration_ms_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'http_request_duration_ms_bucket{{{labels},le="+Inf"}} {stats.count}')
+                lines.append(f"http_request_duration_ms_sum{{{labels}}} {stats.latency_sum_ms:.3f}")
+                lines.append(f"http_request_duration_ms_count{{{labels}}} {stats.count}")
+
+            lines += ["# HELP http_request_db_statements_total 요청 중 실행된 SQL 문 수", "# TYPE http_request_db_statements_total counter"]
+            for (method, route), stats in routes:
+                lines.append(f'http_request_db_statements_total{{method="{method}",route="{route}"}} {stats.statements}')
+
+            lines += ["# HELP http_request_db_time_ms_total 요청 중 SQL 실행 시간 합계 (ms)", "# TYPE http_request_db_time_ms_total counter"]
+            for (method, route), stats in routes:
+                lines.append(f'http_request_db_time_ms_total{{method="{method}",route="{route}"}} {stats.db_time_ms:.3f}')
+
+            lines += ["# HELP http_request_n_plus_one_total 같은 SELECT가 반복 실행된(N+1 의심) 요청 수", "# TYPE http_request_n_plus_one_total counter"]
+            for (method, route), stats in routes:
+                lines.append(f'http_request_n_plus_one_total{{method="{method}",route="{route}"}} {stats.n_plus_one}')
+
+            lines += ["# HELP orm_lazy_loads_total 관계(relationship) lazy load 횟수", "# TYPE orm_lazy_loads_total counter"]
+            for (method, route), stats in routes:
+                for name, count in sorted(stats.lazy_loads.items()):
+                    lines.append(
+                        f'orm_lazy_loads_total{{method="{method}",route="{route}",relationship="{name}"}} {count}'
+                    )
+        return "\n".join(lines) + "\n"
+
+
+profiling_metrics = ProfilingMetrics()
+
+
+def instrument_engine(engine: Engine):
+    """엔진의 SQL 실행 시간을 현재 요청 프로파일에 기록하도록 이벤트를 등록합니다."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        start = conn.info["query_start_time"].pop()
+        profile = _current_profile.get()
+        if profile is not None:
+            profile.record(statement, time.perf_counter() - start)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_lazy_load(orm_execute_state):
+    """관계 lazy load(예: Member.login_histories, Issue.news)를 현재 요청 프로파일에 기록합니다."""
+    if not orm_execute_state.is_relationship_load or orm_execute_state.lazy_loaded_from is None:
+        return
+    profile = _current_profile.get()
+    if profile is None:
+        return
+    path = orm_execute_state.loader_strategy_path
+    name = str(path.path[-1]) if path is not None and path.path else "unknown"
+    profile.lazy_loads[name] = profile.lazy_loads.get(name, 0) + 1
+
+
+class ProfilingMiddleware:
+    """
+    요청 프로파일링 (ASGI 미들웨어)
+
+    - 라우트별 처리 시간 히스토그램, SQL 문 수, DB 시간을 집계합니다 (/metrics).
+    - 한 요청에서 같은 SELECT가 n_plus_one_threshold회 이상 실행되거나 같은 관계가 그만큼 lazy load되면
+      N+1 의심으로 기록하고 로그를 남깁니다.
+    - server_timing이 켜져 있으면 Server-Timing 헤더(app, db)를 응답에 추가합니다.
+    """
+
+    def __init__(self, app, n_plus_one_threshold: int = 5, server_timing: bool = False):
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.server_timing = server_timing
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile()
+        token = _current_profile.set(profile)
+        start = time.perf_counter()
+
+        async def profiling_send(message):
+            if self.server_timing and message["type"] == "http.response.start":
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                value = (
+                    f'app;dur={elapsed_ms:.1f}, '
+                    f'db;dur={profile.db_time * 1000:.1f};desc="{profile.statements} queries"'
+                )
+                message["headers"] = list(message.get("headers", [])) + [(b"server-timing", value.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, profiling_send)
+        finally:
+            _current_profile.reset(token)
+            latency_ms = (time.perf_counter() - start) * 1000
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            repeated = profile.repeated_statements(self.n_plus_one_threshold)
+            lazy = profile.repeated_lazy_loads(self.n_plus_one_threshold)
+            for name, count in lazy:
+                print(f"⚠️ N+1 의심: {scope['method']} {route_path} - {name} lazy load {count}회")
+            if repeated and not lazy:
+                statement, count = max(repeated, key=lambda item: item[1])
+                print(f"⚠️ N+1 의심: {scope['method']} {route_path} - 같은 SELECT {count}회 실행: {statement[:120]}")
+            profiling_metrics.record(scope["method"], route_path, latency_ms, profile, bool(repeated or lazy))
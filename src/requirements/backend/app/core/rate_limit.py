@@ -0,0 +1,259 @@
+import abc
+import ipaddress
+import json
+import math
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from .config import settings
+
+
+class RateLimitStore(abc.ABC):
+    """
+    슬라이딩 윈도우 카운터 저장소 인터페이스
+
+    고정 윈도우 두 개(현재/직전)의 카운트를 직전 윈도우와 겹치는 비율만큼 가중합하여
+    슬라이딩 윈도우 요청 수를 근사합니다 (키당 O(1) 메모리).
+    """
+
+    @abc.abstractmethod
+    async def hit(self, key: str, limit: int, window: int) -> Tuple[bool, int]:
+        """
+        요청 1회를 기록합니다.
+
+        Returns:
+            (허용 여부, 거부 시 재시도까지 남은 초)
+        """
+        raise NotImplementedError
+
+
+def _sliding_count(current: int, previous: int, window: int, now: float) -> float:
+    elapsed = now % window
+    return previous * (window - elapsed) / window + current
+
+
+def _retry_after(window: int, now: float) -> int:
+    return max(1, math.ceil(window - now % window))
+
+
+class LocalRateLimitStore(RateLimitStore):
+    """
+    프로세스 내 저장소 (기본값)
+    이벤트 루프 스레드에서만 접근하므로 잠금 없이 dict 조회 몇 번으로 처리됩니다.
+    max_keys를 넘으면 가장 오래 사용하지 않은 키부터 제거합니다.
+    """
+
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        # key -> [윈도우 번호, 현재 윈도우 카운트, 직전 윈도우 카운트]
+        self._counters: "OrderedDict[str, list]" = OrderedDict()
+
+    async def hit(self, key: str, limit: int, window: int) -> Tuple[bool, int]:
+        now = time.time()
+        bucket = int(now // window)
+        counter = self._counters.get(key)
+        if counter is None:
+            counter = [bucket, 0, 0]
+            self._counters[key] = counter
+            if len(self._counters) > self.max_keys:
+                self._counters.popitem(last=False)
+        else:
+            self._counters.move_to_end(key)
+            if counter[0] != bucket:
+                # 윈도우가 바뀌면 현재 카운트를 직전으로 이동 (두 윈도우 이상 지났으면 0)
+                counter[2] = counter[1] if counter[0] == bucket - 1 else 0
+                counter[1] = 0
+                counter[0] = bucket
+
+        if _sliding_count(counter[1], counter[2], window, now) >= limit:
+            return False, _retry_after(window, now)
+        counter[1] += 1
+        return True, 0
+
+
+class RedisRateLimitStore(RateLimitStore):
+    """
+    Redis 공유 저장소 (여러 uvicorn 워커/서버 간 한도 공유)
+    redis 패키지는 이 저장소를 사용할 때만 필요합니다.
+    """
+
+    def __init__(self, url: str, prefix: str = "policy-insight:ratelimit:"):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("RedisRateLimitStore를 사용하려면 redis 패키지를 설치해야 합니다") from e
+        self.client = redis.from_url(url)
+        self.prefix = prefix
+
+    async def hit(self, key: str, limit: int, window: int) -> Tuple[bool, int]:
+        now = time.time()
+        bucket = int(now // window)
+        current_key = f"{self.prefix}{key}:{bucket}"
+        previous_key = f"{self.prefix}{key}:{bucket - 1}"
+
+        current, previous = await self.client.mget(current_key, previous_key)
+        if _sliding_count(int(current or 0), int(previous or 0), window, now) >= limit:
+            return False, _retry_after(window, now)
+
+        pipe = self.client.pipeline()
+        pipe.incr(current_key)
+        pipe.expire(current_key, window * 2)
+        await pipe.execute()
+        return True, 0
+
+
+def create_rate_limit_store() -> RateLimitStore:
+    """설정값(RATE_LIMIT_BACKEND: local | redis)에 따라 저장소를 생성합니다."""
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        if not settings.CACHE_REDIS_URL:
+            raise RuntimeError("redis 요청 제한 저장소에는 CACHE_REDIS_URL 설정이 필요합니다")
+        return RedisRateLimitStore(settings.CACHE_REDIS_URL)
+    return LocalRateLimitStore(settings.RATE_LIMIT_MAX_KEYS)
+
+
+# 요청 제한 대상 (메서드, 경로) -> 요청 본문에서 이메일을 읽을 필드명
+# (CORS preflight OPTIONS 요청은 제한하지 않도록 라우터와 같은 메서드로 지정)
+RATE_LIMITED_PATHS: Dict[Tuple[str, str], str] = {
+    ("POST", "/api/v1/auth/login"): "email",
+    ("POST", "/api/v1/auth/signup"): "email",
+    ("POST", "/api/v1/auth/id"): "email",  # 아이디 찾기
+    ("PUT", "/api/v1/auth/password/nologin"): "id",  # 비로그인 비밀번호 재설정
+}
+
+# 이메일 추출을 위해 읽는 최대 본문 크기 (인증 요청 본문은 작으므로 이보다 크면 413으로 거부)
+MAX_BODY_BYTES = 4096
+
+TOO_MANY_REQUESTS_BODY = json.dumps({"detail": "Too many requests"}).encode()
+PAYLOAD_TOO_LARGE_BODY = json.dumps({"detail": "Request body too large"}).encode()
+
+
+def parse_trusted_proxies(value: str) -> List:
+    """쉼표로 구분된 프록시 주소/대역 문자열을 네트워크 목록으로 변환합니다."""
+    return [ipaddress.ip_network(item.strip(), strict=False) for item in value.split(",") if item.strip()]
+
+
+class RateLimitMiddleware:
+    """
+    인증 엔드포인트 요청 제한 (ASGI 미들웨어)
+
+    IP별, 이메일별 슬라이딩 윈도우 한도를 확인하여 초과 시 auth_service와 DB에 도달하기 전에
+    429 응답을 바로 반환합니다. IP 확인은 본문을 읽기 전에 수행되므로 거부 비용이 매우 작습니다.
+
+    - X-Real-IP 헤더는 RATE_LIMIT_TRUST_PROXY_HEADER가 켜져 있고 직접 연결한 주소가
+      RATE_LIMIT_TRUSTED_PROXIES에 속할 때만 사용합니다 (그 외에는 누구나 헤더를 바꿔 IP 한도를 우회할 수 있음).
+    - 본문이 MAX_BODY_BYTES를 넘으면 이메일 한도를 확인할 수 없으므로 413으로 거부합니다.
+    """
+
+    def __init__(self, app, store: Optional[RateLimitStore] = None):
+        self.app = app
+        self.store = store or create_rate_limit_store()
+        self.trusted_proxies = (
+            parse_trusted_proxies(settings.RATE_LIMIT_TRUSTED_PROXIES) if settings.RATE_LIMIT_TRUST_PROXY_HEADER else []
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        email_field = RATE_LIMITED_PATHS.get((scope["method"], scope["path"]))
+        if email_field is None:
+            await self.app(scope, receive, send)
+            return
+
+        window = settings.RATE_LIMIT_WINDOW_SECONDS
+
+        # 1. IP별 한도
+        allowed, retry_after = await self.store.hit(
+            f"ip:{scope['path']}:{self._client_ip(scope)}", settings.RATE_LIMIT_IP_MAX_REQUESTS, window
+        )
+        if not allowed:
+            await self._reject(send, retry_after)
+            return
+
+        # 2. 이메일별 한도 (본문을 미리 읽고 앱에는 그대로 다시 전달)
+        body, more_body = await self._read_body(receive)
+        if len(body) > MAX_BODY_BYTES:
+            await self._respond(send, 413, PAYLOAD_TOO_LARGE_BODY)
+            return
+        email = self._extract_email(body, email_field)
+        if email:
+            allowed, retry_after = await self.store.hit(
+                f"email:{scope['path']}:{email}", settings.RATE_LIMIT_EMAIL_MAX_REQUESTS, window
+            )
+            if not allowed:
+                await self._reject(send, retry_after)
+                return
+
+        replayed = False
+
+        async def replay_receive():
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": more_body}
+            return await receive()
+
+        await self.app(scope, replay_receive, send)
+
+    def _client_ip(self, scope) -> str:
+        client = scope.get("client")
+        peer = client[0] if client else None
+        if peer and self._is_trusted_proxy(peer):
+            # 신뢰하는 프록시(nginx)가 설정한 X-Real-IP
+            for name, value in scope.get("headers", []):
+                if name == b"x-real-ip":
+                    return value.decode("latin-1")
+        return peer or "unknown"
+
+    def _is_trusted_proxy(self, address: str) -> bool:
+        if not self.trusted_proxies:
+            return False
+        try:
+            ip = ipaddress.ip_address(address)
+        except ValueError:
+            return False
+        return any(ip in network for network in self.trusted_proxies)
+
+    @staticmethod
+    async def _read_body(receive) -> Tuple[bytes, bool]:
+        """MAX_BODY_BYTES까지 본문을 읽습니다. (본문, 남은 본문 존재 여부)"""
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                return b"".join(chunks), False
+            chunk = message.get("body", b"")
+            chunks.append(chunk)
+            size += len(chunk)
+            more_body = message.get("more_body", False)
+            if not more_body or size > MAX_BODY_BYTES:
+                return b"".join(chunks), more_body
+
+    @staticmethod
+    def _extract_email(body: bytes, field: str) -> Optional[str]:
+        try:
+            value = json.loads(body).get(field)
+        except (ValueError, AttributeError):
+            return None
+        if not isinstance(value, str):
+            return None
+        return value.strip().lower()[:254] or None
+
+    @staticmethod
+    async def _reject(send, retry_after: int):
+        await RateLimitMiddleware._respond(
+            send, 429, TOO_MANY_REQUESTS_BODY, [(b"retry-after", str(retry_after).encode())]
+        )
+
+    @staticmethod
+    async def _respond(send, status_code: int, body: bytes, headers: Optional[List[Tuple[bytes, bytes]]] = None):
+        await send({
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ] + (headers or []),
+        })
+        await send({"type": "http.response.body", "body": body})
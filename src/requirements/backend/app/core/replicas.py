@@ -0,0 +1,163 @@
+import asyncio
+import itertools
+import time
+from typing import Dict, List, Optional
+from fastapi import HTTPException, Request
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from .cache import create_cache_backend
+from .config import settings
+from .db import AsyncSessionLocal, ASYNC_CONNECT_ARGS, POOL_OPTIONS, to_async_url
+from .pool import InstrumentedAsyncQueuePool, PoolMetrics, pool_metrics
+from .security import verify_access_token
+
+
+# 복제 지연(초): WAL을 모두 재생했으면 0, 아니면 마지막 재생 트랜잭션 이후 경과 시간
+# (유휴 상태의 primary에서는 재생 시각이 오래되어도 지연이 아니므로 LSN을 먼저 비교)
+REPLICA_LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+class Replica:
+    """읽기 전용 복제본 (엔진, 세션 팩토리, 마지막으로 확인한 복제 지연)"""
+
+    def __init__(self, name: str, url: str):
+        self.name = name
+        # 복제본마다 별도 풀 지표 (/health/db)
+        metrics = pool_metrics.setdefault(name, PoolMetrics(name))
+        poolclass = type(f"InstrumentedAsyncQueuePool_{name}", (InstrumentedAsyncQueuePool,), {"metrics": metrics})
+        self.engine = create_async_engine(
+            to_async_url(url),
+            poolclass=poolclass,
+            connect_args=ASYNC_CONNECT_ARGS,
+            **POOL_OPTIONS
+        )
+        metrics.pool = self.engine.sync_engine.pool
+        self.sessionmaker = async_sessionmaker(
+            bind=self.engine,
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False
+        )
+        self.lag: Optional[float] = None  # 확인 전이거나 확인 실패 시 None (사용하지 않음)
+        self.checked_at: Optional[float] = None
+        self.error: Optional[str] = None
+
+
+class ReplicaRouter:
+    """
+    읽기 전용 요청의 세션을 복제본으로 분배합니다.
+
+    - 복제 지연이 max_lag_seconds 이하인 복제본만 라운드 로빈으로 사용하고, 없으면 primary를 사용합니다.
+    - 회원 정보를 수정한 회원은 sticky_seconds 동안 primary에서 읽습니다 (read-your-writes).
+      표시는 회원 캐시와 같은 저장소(local | redis)에 저장되어 redis 사용 시 워커 간에도 유지됩니다.
+    """
+
+    def __init__(self, urls: List[str], max_lag_seconds: float, sticky_seconds: int):
+        self.replicas = [Replica(f"replica{i + 1}", url) for i, url in enumerate(urls)]
+        self.max_lag_seconds = max_lag_seconds
+        self.sticky_seconds = sticky_seconds
+        self._round_robin = itertools.count()
+        self._sticky = create_cache_backend(
+            settings.MEMBER_CACHE_BACKEND,
+            max_size=settings.MEMBER_CACHE_MAX_SIZE,
+            redis_url=settings.CACHE_REDIS_URL
+        )
+
+    def choose(self) -> Optional[Replica]:
+        """사용 가능한 복제본을 고릅니다 (없으면 None)."""
+        usable = [r for r in self.replicas if r.lag is not None and r.lag <= self.max_lag_seconds]
+        if not usable:
+            return None
+        return usable[next(self._round_robin) % len(usable)]
+
+    async def mark_member_write(self, member_id: int) -> None:
+        """회원이 자신의 정보를 수정했음을 기록합니다 (이후 sticky_seconds 동안 primary에서 읽음)."""
+        if self.replicas and self.sticky_seconds > 0:
+            await self._sticky.set(f"rw:{member_id}", 1, self.sticky_seconds)
+
+    async def sessionmaker_for(self, member_id: Optional[int]) -> async_sessionmaker:
+        if member_id is not None and await self._sticky.get(f"rw:{member_id}"):
+            return AsyncSessionLocal
+        replica = self.choose()
+        return replica.sessionmaker if replica else AsyncSessionLocal
+
+    async def check_lag(self) -> None:
+        """모든 복제본의 복제 지연을 확인합니다 (연결 실패 시 사용 중단)."""
+        for replica in self.replicas:
+            try:
+                async with replica.engine.connect() as conn:
+                    lag = await asyncio.wait_for(
+                        conn.scalar(REPLICA_LAG_QUERY), timeout=settings.DB_REPLICA_CHECK_TIMEOUT_SECONDS
+                    )
+                replica.lag = float(lag)
+                replica.error = None
+                if replica.lag > self.max_lag_seconds:
+                    print(f"⚠️ {replica.name} 복제 지연 {replica.lag:.1f}초 - primary로 전환")
+            except Exception as e:
+                if replica.lag is not None:
+                    print(f"⚠️ {replica.name} 확인 실패 - primary로 전환: {e}")
+                replica.lag = None
+                replica.error = str(e)
+            replica.checked_at = time.time()
+
+    def snapshot(self) -> List[Dict]:
+        return [
+            {
+                "name": replica.name,
+                "lag_seconds": replica.lag,
+                "in_use": replica.lag is not None and replica.lag <= self.max_lag_seconds,
+                "checked_at": replica.checked_at,
+                "error": replica.error,
+            }
+            for replica in self.replicas
+        ]
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+
+replica_router = ReplicaRouter(
+    [url.strip() for url in settings.DB_REPLICA_URLS.split(",") if url.strip()],
+    settings.DB_REPLICA_MAX_LAG_SECONDS,
+    settings.DB_READ_YOUR_WRITES_SECONDS
+)
+
+
+async def monitor_replica_lag_periodically():
+    """복제본 지연을 주기적으로 확인합니다 (앱 시작 시 백그라운드 태스크로 실행)."""
+    while True:
+        try:
+            await replica_router.check_lag()
+        except Exception as e:
+            print(f"복제본 지연 확인 중 오류: {e}")
+        await asyncio.sleep(settings.DB_REPLICA_CHECK_INTERVAL_SECONDS)
+
+
+def _member_id_from_request(request: Request) -> Optional[int]:
+    """Authorization 헤더의 액세스 토큰에서 회원 ID를 읽습니다 (없거나 유효하지 않으면 None)."""
+    authorization = request.headers.get("authorization", "")
+    if not authorization.startswith("Bearer "):
+        return None
+    try:
+        payload = verify_access_token(authorization[len("Bearer "):])
+        return int(payload.get("sub"))
+    except (HTTPException, TypeError, ValueError):
+        return None
+
+
+async def get_read_db(request: Request):
+    """
+    읽기 전용 엔드포인트용 세션 (복제본 또는 primary)
+
+    쓰기가 필요한 엔드포인트는 get_async_db를 사용해야 합니다.
+    """
+    sessionmaker = await replica_router.sessionmaker_for(_member_id_from_request(request))
+    async with sessionmaker() as db:
+        yield db
@@ -0,0 +1,87 @@
+import hashlib
+from typing import Awaitable, Callable, Optional
+from fastapi import Request, Response
+from pydantic import BaseModel
+from .cache import LocalTTLCache
+from .config import settings
+
+
+class CachedBody:
+    """직렬화된 응답 본문과 ETag"""
+
+    __slots__ = ("body", "etag")
+
+    def __init__(self, body: bytes, etag: str):
+        self.body = body
+        self.etag = etag
+
+
+# 직렬화된 응답 본문 LRU (워커 프로세스당)
+# includeBody=true 목록처럼 항목 하나가 수백 KB일 수 있으므로 항목 수와 본문 크기 합계를 함께 제한
+_response_cache = LocalTTLCache(
+    settings.RESPONSE_CACHE_MAX_SIZE,
+    max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+    sizeof=lambda cached: len(cached.body)
+)
+
+
+def make_etag(body: bytes) -> str:
+    """응답 본문 해시로 강한 ETag를 만듭니다."""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더 값(여러 개, W/ 접두사, * 포함 가능)이 ETag와 일치하는지 확인합니다."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def cache_key(request: Request) -> str:
+    """경로 + 정렬된 쿼리 문자열 (파라미터 순서가 달라도 같은 키)"""
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    return f"{request.url.path}?{query}"
+
+
+async def cached_response(
+    request: Request,
+    max_age: int,
+    producer: Callable[[], Awaitable[BaseModel]],
+    key: Optional[str] = None
+) -> Response:
+    """
+    GET 응답을 ETag/Cache-Control과 함께 반환합니다.
+
+    - 캐시에 있으면 DB 조회와 직렬화 없이 저장된 본문을 반환합니다.
+    - If-None-Match가 ETag와 일치하면 본문 없이 304를 반환합니다.
+    - Cache-Control: public, max-age 로 nginx/브라우저도 캐시할 수 있게 합니다.
+
+    Args:
+        request: 요청 객체
+        max_age: 캐시 유지 시간 (초, 프로세스 내 캐시와 Cache-Control에 함께 사용)
+        producer: 캐시가 없을 때 응답 모델을 만드는 함수
+        key: 캐시 키 (기본값: 경로 + 쿼리 문자열)
+    """
+    key = key or cache_key(request)
+    cached = _response_cache.get(key)
+    if cached is None:
+        model = await producer()
+        body = model.model_dump_json().encode()
+        cached = CachedBody(body, make_etag(body))
+        _response_cache.set(key, cached, max_age)
+
+    headers = {
+        "ETag": cached.etag,
+        "Cache-Control": f"public, max-age={max_age}",
+    }
+    if etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
@@ -1,20 +1,105 @@
+import base64
 import hashlib
+import hmac
+import re
 import secrets
+import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from functools import lru_cache
+from typing import Optional, Dict, Tuple
 from jose import jwt, JWTError
 from fastapi import HTTPException, status, Header
 from .config import settings
+from .cache import LocalTTLCache
+
+
+# 검증된 액세스 토큰 페이로드 캐시 (토큰 SHA-256 -> 페이로드, 토큰 만료 시각까지 유지)
+_access_token_cache = LocalTTLCache(settings.TOKEN_CACHE_MAX_SIZE)
+
+
+# scrypt 해시 형식: scrypt$ln=14,r=8,p=1$<salt>$<hash> (salt/hash는 패딩 없는 base64)
+PASSWORD_HASH_PREFIX = "scrypt"
+_LEGACY_SHA256_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode().rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.b64decode(data + "=" * (-len(data) % 4))
+
+
+def _scrypt(password: str, salt: bytes, log_n: int, r: int, p: int) -> bytes:
+    n = 1 << log_n
+    return hashlib.scrypt(
+        password.encode(), salt=salt, n=n, r=r, p=p,
+        maxmem=128 * r * (n + p + 2), dklen=32
+    )
 
 
 def hash_password(password: str) -> str:
-    """SHA-256 방식으로 비밀번호를 해시화합니다."""
-    return hashlib.sha256(password.encode()).hexdigest()
+    """
+    salt를 포함한 scrypt(메모리 하드) 방식으로 비밀번호를 해시화합니다.
+    CPU를 수십 ms 사용하므로 비동기 코드에서는 password_hasher를 통해 호출해야 합니다.
+    """
+    log_n, r, p = settings.PASSWORD_SCRYPT_LOG_N, settings.PASSWORD_SCRYPT_R, settings.PASSWORD_SCRYPT_P
+    salt = secrets.token_bytes(16)
+    digest = _scrypt(password, salt, log_n, r, p)
+    return f"{PASSWORD_HASH_PREFIX}$ln={log_n},r={r},p={p}${_b64encode(salt)}${_b64encode(digest)}"
+
+
+def verify_password(plain_password: str, hashed_password: Optional[str]) -> Tuple[bool, bool]:
+    """
+    평문 비밀번호와 저장된 해시를 비교합니다.
+    
+    기존 형식(salt 없는 SHA-256 hex)도 검증하며, 기존 형식이거나 비용 설정이 바뀐 해시는
+    재해시가 필요하다고 알려줍니다 (로그인 성공 시 재해시하여 저장).
+    
+    Returns:
+        (일치 여부, 재해시 필요 여부)
+    """
+    if not hashed_password:
+        return False, False
+
+    if _LEGACY_SHA256_PATTERN.match(hashed_password):
+        legacy = hashlib.sha256(plain_password.encode()).hexdigest()
+        return hmac.compare_digest(legacy, hashed_password), True
+
+    try:
+        prefix, params, salt, digest = hashed_password.split("$")
+        cost = dict(item.split("=") for item in params.split(","))
+        log_n, r, p = int(cost["ln"]), int(cost["r"]), int(cost["p"])
+    except (ValueError, KeyError):
+        return False, False
+    if prefix != PASSWORD_HASH_PREFIX:
+        return False, False
 
+    matched = hmac.compare_digest(_scrypt(plain_password, _b64decode(salt), log_n, r, p), _b64decode(digest))
+    needs_rehash = (log_n, r, p) != (
+        settings.PASSWORD_SCRYPT_LOG_N, settings.PASSWORD_SCRYPT_R, settings.PASSWORD_SCRYPT_P
+    )
+    return matched, needs_rehash
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """평문 비밀번호와 해시된 비밀번호를 비교합니다."""
-    return hash_password(plain_password) == hashed_password
+
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    # 현재 비용 설정의 임의 비밀번호 해시 (프로세스당 한 번 생성)
+    return hash_password(secrets.token_urlsafe(16))
+
+
+def verify_dummy_password(plain_password: str) -> bool:
+    """
+    존재하지 않거나 비활성인 회원의 로그인 시도에도 실제 검증과 같은 비용의 scrypt를 수행합니다.
+    응답 시간 차이로 가입된 이메일인지 알아낼 수 없도록 하기 위함이며, 항상 False를 반환합니다.
+    """
+    verify_password(plain_password, _dummy_password_hash())
+    return False
+
+
+def hash_token(token: str) -> str:
+    """토큰을 고정 길이(64자) SHA-256 해시로 변환합니다 (저장/조회 키)."""
+    return hashlib.sha256(token.encode()).hexdigest()
 
 
 def generate_csrf_token() -> str:
@@ -27,7 +112,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     액세스 토큰을 생성합니다.
     
     Args:
-        data: 토큰에 포함할 데이터 (member_id, token_version 필수)
+        data: 토큰에 포함할 데이터 (member_id, token_version 필수, sid: 리프레시 토큰 세션 ID)
         expires_delta: 만료 시간 (옵션)
     
     Returns:
@@ -45,11 +130,15 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
 
 def create_refresh_token(data: dict) -> str:
-    """리프레시 토큰을 생성합니다."""
+    """
+    리프레시 토큰을 생성합니다.
+    
+    같은 회원이 같은 초에 여러 번 발급받아도 토큰(해시)이 겹치지 않도록 임의의 jti를 포함합니다.
+    """
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     
-    to_encode.update({"exp": expire, "type": "refresh"})
+    to_encode.update({"exp": expire, "type": "refresh", "jti": secrets.token_urlsafe(16)})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
@@ -135,6 +224,12 @@ def verify_access_token(token: str) -> Dict:
     Raises:
         HTTPException: 토큰이 유효하지 않을 경우
     """
+    # 같은 토큰은 만료 전까지 반복 전송되므로 서명 검증 결과를 캐시에서 재사용
+    cache_key = hash_token(token)
+    cached = _access_token_cache.get(cache_key)
+    if cached is not None:
+        return dict(cached)
+    
     payload = decode_token(token)
     
     if payload is None:
@@ -156,4 +251,9 @@ def verify_access_token(token: str) -> Dict:
             detail="Invalid authorize"
         )
     
+    # 만료 시각까지만 캐시 (exp가 없거나 이미 지난 토큰은 캐시하지 않음)
+    ttl = payload.get("exp", 0) - time.time()
+    if ttl > 0 and settings.TOKEN_CACHE_MAX_SIZE > 0:
+        _access_token_cache.set(cache_key, dict(payload), ttl)
+    
     return payload
@@ -1,35 +1,83 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select, insert, update, delete, literal, cast, String
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import func
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
 from app.models.member import Member
 from app.models.login_history import LoginHistory
+from app.models.refresh_token import RefreshToken
+from app.core.config import settings
+from app.core.security import hash_token
+from app.core.member_cache import get_cached_member, cache_member, invalidate_member
+from app.core.replicas import replica_router
 
 
-def get_member_by_email(db: Session, email: str) -> Optional[Member]:
+def open_session_since() -> datetime:
+    """
+    로그아웃되지 않은 로그인 기록을 찾을 시작 시각
+    리프레시 토큰 만료 후에는 새 액세스 토큰을 받을 수 없으므로 그 이전 기록은 조회하지 않습니다.
+
+    login_history의 일시는 모두 앱 시각(datetime.now(), 파티션 관리와 같은 시계)으로 기록하므로
+    DB의 now() 대신 앱 시각을 기준으로 합니다.
+    """
+    return datetime.now() - timedelta(
+        days=settings.REFRESH_TOKEN_EXPIRE_DAYS,
+        minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
+    )
+
+
+async def get_member_by_email(db: AsyncSession, email: str) -> Optional[Member]:
     """이메일로 회원 정보를 조회합니다."""
-    return db.query(Member).filter(Member.email == email).first()
+    result = await db.execute(select(Member).where(Member.email == email))
+    return result.scalars().first()
+
 
+async def get_member_by_id(db: AsyncSession, member_id: int) -> Optional[Member]:
+    """
+    회원 ID로 회원 정보를 조회합니다.
+    인증 확인용 조회이므로 캐시된 회원 상태(읽기 전용)를 우선 반환합니다.
+    """
+    cached = await get_cached_member(member_id)
+    if cached is not None:
+        return cached
+    member = await _load_member(db, member_id)
+    if member:
+        await cache_member(member, db)
+    return member
 
-def get_member_by_id(db: Session, member_id: int) -> Optional[Member]:
-    """회원 ID로 회원 정보를 조회합니다."""
-    return db.query(Member).filter(Member.member_id == member_id).first()
 
+async def _load_member(db: AsyncSession, member_id: int) -> Optional[Member]:
+    """수정용으로 DB에서 회원 객체를 조회합니다 (캐시 미사용)."""
+    result = await db.execute(select(Member).where(Member.member_id == member_id))
+    return result.scalars().first()
 
-def get_member_by_refresh_token(db: Session, refresh_token: str) -> Optional[Member]:
-    """리프레시 토큰으로 회원 정보를 조회합니다."""
-    return db.query(Member).filter(
-        Member.refresh_token == refresh_token,
-        Member.account_status == 'A'  # 활성 상태인 계정만
-    ).first()
 
+async def get_refresh_session(db: AsyncSession, refresh_token: str) -> Optional[Tuple[Member, int]]:
+    """
+    리프레시 토큰으로 회원 정보와 세션 ID(token_id)를 조회합니다.
+    토큰 해시의 유니크 인덱스로 조회하므로 회원 수와 관계없이 일정한 시간이 걸립니다.
+    """
+    result = await db.execute(
+        select(Member, RefreshToken.token_id)
+        .join(RefreshToken, RefreshToken.member_id == Member.member_id)
+        .where(
+            RefreshToken.token_hash == hash_token(refresh_token),
+            RefreshToken.expires_at > datetime.utcnow(),  # 만료되지 않은 토큰만
+            Member.account_status == 'A'  # 활성 상태인 계정만
+        )
+    )
+    row = result.first()
+    return (row[0], row[1]) if row else None
 
-def check_email_exists(db: Session, email: str) -> bool:
+
+async def check_email_exists(db: AsyncSession, email: str) -> bool:
     """이메일이 이미 존재하는지 확인합니다."""
-    return db.query(Member).filter(Member.email == email).first() is not None
+    result = await db.execute(select(Member.member_id).where(Member.email == email))
+    return result.first() is not None
 
 
-def create_member(
-    db: Session,
+async def create_member(
+    db: AsyncSession,
     email: str,
     hashed_password: str,
     name: str,
@@ -50,27 +98,34 @@ def create_member(
     Returns:
         생성된 회원 객체
     """
-    new_member = Member(
-        email=email,
-        passwd=hashed_password,
-        member_name=name,
-        phone=phone,
-        profile_image=profile_image,
-        account_status='A'  # 활성 상태
+    # 회원 ID를 미리 채번하여 프로필 이미지 경로와 함께 INSERT ... RETURNING 한 번으로 생성
+    new_id = select(
+        func.nextval(func.pg_get_serial_sequence(Member.__tablename__, 'member_id')).label('member_id')
+    ).cte('new_id')
+    stmt = (
+        insert(Member)
+        .from_select(
+            ['member_id', 'email', 'passwd', 'member_name', 'phone', 'profile_image', 'account_status'],
+            select(
+                new_id.c.member_id,
+                literal(email),
+                literal(hashed_password),
+                literal(name),
+                literal(phone),
+                # 회원 ID를 사용한 프로필 이미지 경로
+                func.concat('/static/profiles/', cast(new_id.c.member_id, String), '/profile.png'),
+                literal('A')  # 활성 상태
+            )
+        )
+        .returning(*Member.__table__.c)
     )
-    db.add(new_member)
-    db.commit()
-    db.refresh(new_member)
-    
-    # 회원 ID를 사용하여 프로필 이미지 경로 업데이트
-    new_member.profile_image = f"/static/profiles/{new_member.member_id}/profile.png"
-    db.commit()
-    db.refresh(new_member)
+    new_member = (await db.execute(select(Member).from_statement(stmt))).scalars().one()
+    await db.commit()
     
     return new_member
 
 
-def update_password(db: Session, member_id: int, hashed_password: str) -> bool:
+async def update_password(db: AsyncSession, member_id: int, hashed_password: str) -> bool:
     """
     회원의 비밀번호를 업데이트합니다.
     
@@ -82,113 +137,192 @@ def update_password(db: Session, member_id: int, hashed_password: str) -> bool:
     Returns:
         성공 여부
     """
-    member = db.query(Member).filter(Member.member_id == member_id).first()
-    if member:
-        member.passwd = hashed_password
-        db.commit()
-        return True
-    return False
+    result = await db.execute(
+        update(Member)
+        .where(Member.member_id == member_id)
+        .values(passwd=hashed_password)
+        .returning(Member.member_id)
+        .execution_options(synchronize_session=False)
+    )
+    updated = result.first() is not None
+    await db.commit()
+    return updated
 
 
-def update_refresh_token(db: Session, member_id: int, refresh_token: str) -> Member:
-    """리프레시 토큰을 업데이트합니다."""
-    member = db.query(Member).filter(Member.member_id == member_id).first()
-    if member:
-        member.refresh_token = refresh_token
-        member.last_login = func.now()
-        db.commit()
-        db.refresh(member)
-    return member
+async def update_refresh_token(
+    db: AsyncSession,
+    member_id: int,
+    refresh_token: str,
+    access_device: Optional[str] = None
+) -> Optional[Tuple[Member, int]]:
+    """
+    새 리프레시 토큰 세션을 저장하고 최종 로그인 일시를 갱신합니다.
+    회원당 REFRESH_TOKEN_MAX_SESSIONS개를 넘는 오래된 세션은 삭제합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        member_id: 회원 ID
+        refresh_token: 발급한 리프레시 토큰 (해시만 저장)
+        access_device: 발급받은 기기 정보 (선택)
+        
+    Returns:
+        (업데이트된 회원 객체, 새 세션 ID) - 회원이 없으면 None
+    """
+    result = await db.execute(
+        select(Member).from_statement(
+            update(Member)
+            .where(Member.member_id == member_id)
+            .values(last_login=func.now())
+            .returning(*Member.__table__.c)
+        ).execution_options(populate_existing=True)
+    )
+    member = result.scalars().first()
+    if member is None:
+        await db.commit()
+        return None
+
+    # 새 세션 INSERT와 오래된 세션 정리를 한 문장으로 실행하고 새 세션 ID를 반환
+    # (같은 스냅샷을 보므로 기존 세션은 최대 개수 - 1개만 남김)
+    inserted = (
+        insert(RefreshToken)
+        .values(
+            member_id=member_id,
+            token_hash=hash_token(refresh_token),
+            expires_at=datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+            access_device=access_device
+        )
+        .returning(RefreshToken.token_id)
+        .cte('inserted')
+    )
+    recent_ids = (
+        select(RefreshToken.token_id)
+        .where(RefreshToken.member_id == member_id)
+        .order_by(RefreshToken.token_id.desc())
+        .limit(max(settings.REFRESH_TOKEN_MAX_SESSIONS - 1, 0))
+    )
+    pruned = (
+        delete(RefreshToken)
+        .where(
+            RefreshToken.member_id == member_id,
+            RefreshToken.token_id.not_in(recent_ids)
+        )
+        .cte('pruned')
+    )
+    token_id = (await db.execute(select(inserted.c.token_id).add_cte(pruned))).scalar_one()
+    await db.commit()
+    return member, token_id
 
 
-def invalidate_tokens(db: Session, member_id: int) -> bool:
+async def revoke_refresh_session(db: AsyncSession, member_id: int, token_id: int) -> bool:
     """
-    회원의 리프레시 토큰을 무효화합니다.
+    리프레시 토큰 세션 하나를 삭제합니다 (해당 기기만 로그아웃, 다른 기기의 세션은 유지).
     
     Args:
         db: 데이터베이스 세션
         member_id: 회원 ID
+        token_id: 세션 ID (액세스 토큰의 sid)
         
     Returns:
-        성공 여부
+        삭제 여부 (이미 삭제되었거나 만료 정리된 세션이면 False)
     """
-    member = db.query(Member).filter(Member.member_id == member_id).first()
-    if member:
-        member.refresh_token = None
-        db.commit()
-        return True
-    return False
+    result = await db.execute(
+        delete(RefreshToken).where(
+            RefreshToken.token_id == token_id,
+            RefreshToken.member_id == member_id
+        )
+    )
+    await db.commit()
+    return result.rowcount > 0
 
 
-def increment_token_version(db: Session, member_id: int) -> Member:
+async def invalidate_tokens(db: AsyncSession, member_id: int) -> bool:
     """
-    회원의 토큰 버전을 증가시킵니다.
-    리프레시 토큰으로 새 액세스 토큰을 발급할 때 호출하여
-    기존의 모든 액세스 토큰을 무효화합니다.
+    회원의 모든 리프레시 토큰(세션)을 삭제하고 토큰 버전을 증가시킵니다.
+    모든 기기의 액세스 토큰도 무효화됩니다 (전체 로그아웃, 비밀번호 변경).
     
     Args:
         db: 데이터베이스 세션
         member_id: 회원 ID
         
     Returns:
-        업데이트된 회원 객체
+        성공 여부
     """
-    member = db.query(Member).filter(Member.member_id == member_id).first()
-    if member:
-        member.token_version = (member.token_version or 1) + 1
-        db.commit()
-        db.refresh(member)
-    return member
+    result = await db.execute(
+        update(Member)
+        .where(Member.member_id == member_id)
+        .values(token_version=func.coalesce(Member.token_version, 1) + 1)
+        .returning(Member.member_id)
+        .execution_options(synchronize_session=False)
+    )
+    if result.first() is None:
+        await db.commit()
+        return False
+    await db.execute(delete(RefreshToken).where(RefreshToken.member_id == member_id))
+    await db.commit()
+    await invalidate_member(member_id)
+    await replica_router.mark_member_write(member_id)
+    return True
 
 
-def create_login_history(
-    db: Session,
+async def purge_expired_refresh_tokens(db: AsyncSession) -> int:
+    """
+    만료된 리프레시 토큰을 일괄 삭제합니다.
+    
+    Returns:
+        삭제된 토큰 수
+    """
+    result = await db.execute(delete(RefreshToken).where(RefreshToken.expires_at <= datetime.utcnow()))
+    await db.commit()
+    return result.rowcount
+
+
+async def create_login_history(
+    db: AsyncSession,
     member_id: int,
     access_ip: Optional[str] = None,
     access_device: Optional[str] = None,
-    browser_info: Optional[str] = None
+    browser_info: Optional[str] = None,
+    login_date: Optional[datetime] = None
 ) -> LoginHistory:
-    """로그인 기록을 생성합니다."""
+    """로그인 기록을 생성합니다 (login_date를 주지 않으면 현재 앱 시각)."""
     login_history = LoginHistory(
         member_id=member_id,
+        login_date=login_date or datetime.now(),
         access_ip=access_ip,
         access_device=access_device,
         browser_info=browser_info
     )
     db.add(login_history)
-    db.commit()
-    db.refresh(login_history)
+    await db.commit()
+    await db.refresh(login_history)
     return login_history
 
 
-def update_logout_date(db: Session, member_id: int) -> bool:
+async def update_logout_date(db: AsyncSession, member_id: int, logout_date: Optional[datetime] = None) -> bool:
     """
     가장 최근 로그인 기록에 로그아웃 일시를 업데이트합니다.
     
     Args:
         db: 데이터베이스 세션
         member_id: 회원 ID
+        logout_date: 로그아웃 일시 (기본값: 현재 앱 시각)
         
     Returns:
         성공 여부
     """
     # 가장 최근 로그인 기록 중 로그아웃 일시가 없는 것을 찾아 업데이트
-    login_history = db.query(LoginHistory).filter(
-        LoginHistory.member_id == member_id,
-        LoginHistory.logout_date.is_(None)
-    ).order_by(LoginHistory.login_date.desc()).first()
+    # (로그아웃 가능한 세션 기간으로 범위를 제한하여 최근 파티션만 조회)
+    result = await db.execute(
+        select(LoginHistory).where(
+            LoginHistory.member_id == member_id,
+            LoginHistory.logout_date.is_(None),
+            LoginHistory.login_date >= open_session_since()
+        ).order_by(LoginHistory.login_date.desc()).limit(1)
+    )
+    login_history = result.scalars().first()
     
     if login_history:
-        login_history.logout_date = func.now()
-        db.commit()
+        login_history.logout_date = logout_date or datetime.now()
+        await db.commit()
         return True
     return False
-
-
-def verify_member_credentials(db: Session, email: str, hashed_password: str) -> Optional[Member]:
-    """이메일과 해시된 비밀번호로 회원을 검증합니다."""
-    return db.query(Member).filter(
-        Member.email == email,
-        Member.passwd == hashed_password,
-        Member.account_status == 'A'  # 활성 상태인 계정만
-    ).first()
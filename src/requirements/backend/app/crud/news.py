@@ -0,0 +1,238 @@
+from sqlalchemy import select, tuple_, text, bindparam, case, or_, func, Text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
+from app.models.news import News
+
+
+# 목록 조회 시 가져오는 컬럼 (본문 제외)
+SUMMARY_COLUMNS = (
+    News.news_id,
+    News.news_title,
+    News.summary,
+    News.category,
+    News.sub_category,
+    News.published,
+    News.company,
+    News.news_url,
+    News.issue_id,
+)
+
+
+async def list_news(
+    db: AsyncSession,
+    limit: int,
+    company: Optional[str] = None,
+    category: Optional[str] = None,
+    sub_category: Optional[str] = None,
+    published_from: Optional[datetime] = None,
+    published_to: Optional[datetime] = None,
+    after: Optional[Tuple[datetime, int]] = None,
+    include_body: bool = False
+) -> List:
+    """
+    뉴스 목록을 게시일 최신순으로 조회합니다.
+    OFFSET 대신 (published, news_id) 키셋 조건으로 다음 페이지를 조회하므로
+    페이지가 깊어져도 인덱스 범위 스캔 비용이 일정합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        limit: 최대 조회 건수
+        company, category, sub_category: 필터 (선택)
+        published_from, published_to: 게시일 범위 [from, to) (선택)
+        after: 이전 페이지 마지막 항목의 (published, news_id) (선택)
+        include_body: 본문 포함 여부
+        
+    Returns:
+        조회된 행 목록
+    """
+    columns = SUMMARY_COLUMNS + (News.body,) if include_body else SUMMARY_COLUMNS
+    stmt = select(*columns)
+    if company is not None:
+        stmt = stmt.where(News.company == company)
+    if category is not None:
+        stmt = stmt.where(News.category == category)
+    if sub_category is not None:
+        stmt = stmt.where(News.sub_category == sub_category)
+    if published_from is not None:
+        stmt = stmt.where(News.published >= published_from)
+    if published_to is not None:
+        stmt = stmt.where(News.published < published_to)
+    if after is not None:
+        stmt = stmt.where(tuple_(News.published, News.news_id) < tuple_(*after))
+
+    stmt = stmt.order_by(News.published.desc(), News.news_id.desc()).limit(limit)
+    result = await db.execute(stmt)
+    return result.all()
+
+
+async def list_news_after_id(db: AsyncSession, after_id: int, limit: int) -> List:
+    """
+    news_id가 after_id보다 큰(새로 추가된) 뉴스를 ID 순으로 조회합니다. (실시간 스트림용)
+    
+    Args:
+        db: 데이터베이스 세션
+        after_id: 마지막으로 전달한 news_id
+        limit: 최대 조회 건수
+    """
+    result = await db.execute(
+        select(*SUMMARY_COLUMNS)
+        .where(News.news_id > after_id)
+        .order_by(News.news_id)
+        .limit(limit)
+    )
+    return result.all()
+
+
+async def list_news_ids_after(db: AsyncSession, after_id: int, limit: int) -> List[int]:
+    """news_id가 after_id보다 큰 뉴스 ID를 순서대로 조회합니다 (기본 키 인덱스만 사용, 실시간 스트림용)."""
+    result = await db.execute(
+        select(News.news_id)
+        .where(News.news_id > after_id)
+        .order_by(News.news_id)
+        .limit(limit)
+    )
+    return list(result.scalars())
+
+
+async def list_news_by_ids(db: AsyncSession, news_ids: List[int]) -> List:
+    """지정한 ID의 뉴스를 ID 순으로 조회합니다 (본문 제외)."""
+    result = await db.execute(
+        select(*SUMMARY_COLUMNS)
+        .where(News.news_id.in_(news_ids))
+        .order_by(News.news_id)
+    )
+    return result.all()
+
+
+async def get_max_news_id(db: AsyncSession) -> int:
+    """가장 최근에 추가된 news_id (뉴스가 없으면 0)"""
+    result = await db.execute(select(func.coalesce(func.max(News.news_id), 0)))
+    return result.scalar_one()
+
+
+# 내보내기 컬럼 (목록 컬럼 + 본문)
+EXPORT_COLUMNS = SUMMARY_COLUMNS + (News.body,)
+
+
+async def stream_news_for_export(
+    db: AsyncSession,
+    batch_size: int,
+    company: Optional[str] = None,
+    category: Optional[str] = None,
+    published_from: Optional[datetime] = None,
+    published_to: Optional[datetime] = None
+) -> AsyncIterator[List]:
+    """
+    내보낼 뉴스를 게시일 순으로 batch_size 행씩 나누어 반환합니다.
+    서버 측 커서(yield_per)로 조회하므로 전체 결과를 메모리에 올리지 않습니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        batch_size: 한 번에 가져올 행 수
+        company, category: 필터 (선택)
+        published_from, published_to: 게시일 범위 [from, to) (선택)
+    """
+    stmt = select(*EXPORT_COLUMNS)
+    if company is not None:
+        stmt = stmt.where(News.company == company)
+    if category is not None:
+        stmt = stmt.where(News.category == category)
+    if published_from is not None:
+        stmt = stmt.where(News.published >= published_from)
+    if published_to is not None:
+        stmt = stmt.where(News.published < published_to)
+    stmt = stmt.order_by(News.published, News.news_id).execution_options(yield_per=batch_size)
+
+    result = await db.stream(stmt)
+    async for rows in result.partitions():
+        yield rows
+
+
+async def get_news_by_id(db: AsyncSession, news_id: int) -> Optional[News]:
+    """뉴스 ID로 뉴스를 조회합니다."""
+    result = await db.execute(select(News).where(News.news_id == news_id))
+    return result.scalars().first()
+
+
+# 검색 인덱스 식 (마이그레이션 0006의 ix_news_search_bigrams 와 같은 식이어야 인덱스를 사용함)
+SEARCH_DOCUMENT = "news_bigrams(news_title || ' ' || body)"
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+async def search_news(
+    db: AsyncSession,
+    terms: List[str],
+    grams: List[str],
+    limit: int,
+    offset: int,
+    max_candidates: int,
+    max_scan: int,
+    company: Optional[str] = None
+) -> List:
+    """
+    제목/본문에 모든 검색어가 포함된 뉴스를 점수순으로 조회합니다.
+    
+    1. 바이그램 GIN 인덱스로 모든 바이그램을 포함한 뉴스를 찾아 최신 max_scan건의 ID만 남기고
+       (자주 나오는 검색어도 본문을 확인하는 행 수가 max_scan건을 넘지 않음)
+    2. 그 안에서 ILIKE로 검색어가 실제로 연속해서 나타나는지 확인한 뒤
+    3. 최신 max_candidates건만 제목 일치(가중치 3) + 본문 출현 횟수(검색어당 최대 10)로 점수를 매깁니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        terms: 소문자로 정규화된 검색어 목록
+        grams: 검색어들의 바이그램 목록
+        limit, offset: 페이지 범위
+        max_candidates: 점수를 계산할 최대 후보 수
+        max_scan: 본문을 확인할 최대 인덱스 후보 수
+        company: 신문사 필터 (선택)
+        
+    Returns:
+        조회된 행 목록 (score 포함)
+    """
+    matched = select(News.news_id).where(
+        text(f"{SEARCH_DOCUMENT} @> :grams").bindparams(bindparam("grams", value=grams, type_=ARRAY(Text)))
+    )
+    if company is not None:
+        matched = matched.where(News.company == company)
+    matched = matched.order_by(News.published.desc()).limit(max_scan).subquery()
+
+    candidates = select(
+        News.news_id,
+        News.news_title,
+        News.body,
+        News.category,
+        News.sub_category,
+        News.published,
+        News.company,
+        News.news_url
+    ).join(matched, matched.c.news_id == News.news_id)
+    for term in terms:
+        pattern = _like_pattern(term)
+        candidates = candidates.where(or_(
+            News.news_title.ilike(pattern, escape="\\"),
+            News.body.ilike(pattern, escape="\\")
+        ))
+    candidates = candidates.order_by(News.published.desc()).limit(max_candidates).subquery()
+
+    score = 0
+    for term in terms:
+        title_hit = case((func.strpos(func.lower(candidates.c.news_title), term) > 0, 3), else_=0)
+        body_hits = (
+            func.length(candidates.c.body) - func.length(func.replace(func.lower(candidates.c.body), term, ""))
+        ) / len(term)
+        score = score + title_hit + func.least(body_hits, 10)
+
+    stmt = (
+        select(candidates, score.label("score"))
+        .order_by(score.desc(), candidates.c.published.desc())
+        .limit(limit)
+        .offset(offset)
+    )
+    result = await db.execute(stmt)
+    return result.all()
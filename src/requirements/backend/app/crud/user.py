@@ -1,19 +1,34 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import func
 from typing import Optional
 from app.models.member import Member
+from app.models.refresh_token import RefreshToken
+from app.core.member_cache import get_cached_member, cache_member, invalidate_member
+from app.core.replicas import replica_router
 
 
-def get_member_by_id(db: Session, member_id: int) -> Optional[Member]:
-    """회원 ID로 회원 정보를 조회합니다."""
-    return db.query(Member).filter(
-        Member.member_id == member_id,
-        Member.account_status == 'A'  # 활성 상태인 계정만
-    ).first()
+async def get_member_by_id(db: AsyncSession, member_id: int) -> Optional[Member]:
+    """
+    회원 ID로 회원 정보를 조회합니다.
+    캐시된 회원 상태(읽기 전용)를 우선 사용하고, 없으면 DB에서 조회 후 캐시합니다.
+    """
+    member = await get_cached_member(member_id)
+    if member is None:
+        result = await db.execute(select(Member).where(Member.member_id == member_id))
+        member = result.scalars().first()
+        if member is None:
+            return None
+        await cache_member(member, db)
+    
+    # 활성 상태인 계정만
+    if member.account_status != 'A':
+        return None
+    return member
 
 
-def update_member_info(
-    db: Session,
+async def update_member_info(
+    db: AsyncSession,
     member_id: int,
     image: Optional[str] = None,
     phone: Optional[str] = None
@@ -30,18 +45,21 @@ def update_member_info(
     Returns:
         업데이트된 회원 객체
     """
-    member = db.query(Member).filter(Member.member_id == member_id).first()
+    result = await db.execute(select(Member).where(Member.member_id == member_id))
+    member = result.scalars().first()
     if member:
         if image is not None:
             member.profile_image = image
         if phone is not None:
             member.phone = phone
-        db.commit()
-        db.refresh(member)
+        await db.commit()
+        await db.refresh(member)
+        await invalidate_member(member_id)
+        await replica_router.mark_member_write(member_id)
     return member
 
 
-def delete_member(db: Session, member_id: int) -> bool:
+async def delete_member(db: AsyncSession, member_id: int) -> bool:
     """
     회원을 탈퇴 처리합니다 (계정 상태를 'W'로 변경).
     
@@ -52,11 +70,15 @@ def delete_member(db: Session, member_id: int) -> bool:
     Returns:
         성공 여부
     """
-    member = db.query(Member).filter(Member.member_id == member_id).first()
+    result = await db.execute(select(Member).where(Member.member_id == member_id))
+    member = result.scalars().first()
     if member:
         member.account_status = 'W'  # 탈퇴 상태
         member.withdrawal_date = func.now()  # 탈퇴 일시 기록
-        member.refresh_token = None  # 리프레시 토큰 삭제
-        db.commit()
+        member.token_version = (member.token_version or 1) + 1  # 발급된 액세스 토큰 무효화
+        await db.execute(delete(RefreshToken).where(RefreshToken.member_id == member_id))  # 리프레시 토큰 삭제
+        await db.commit()
+        await invalidate_member(member_id)
+        await replica_router.mark_member_write(member_id)
         return True
     return False
@@ -1,16 +1,28 @@
+import asyncio
 from typing import List
 from fastapi import FastAPI, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
-from .core.db import get_db, Base, engine
-
-# Create database tables
-Base.metadata.create_all(bind=engine)
+from .core.config import settings
+from .core.db import get_db, Base, engine, async_engine
+from .core.rate_limit import RateLimitMiddleware
+from .core.compression import CompressionMiddleware
+from .core.profiling import ProfilingMiddleware, instrument_engine
+from .core.password_hasher import password_hasher
+from .core.replicas import replica_router, monitor_replica_lag_periodically
+from . import migrations
 from .routers import health
 from .routers import auth
 from .routers import user
+from .routers import news
+from .routers import metrics
+from .services.auth import purge_expired_refresh_tokens_periodically
+from .services.login_history_writer import login_history_writer
+from .services.news_stream import news_broker
+from .services.login_history_maintenance import maintain_login_history_partitions_periodically
 
 # HTTPBearer 스키마 정의 (Swagger UI에서 "Authorize" 버튼 활성화)
 security = HTTPBearer()
@@ -19,11 +31,19 @@ app = FastAPI(
     title="Policy Insight API",
     description="Policy Insight Backend API with Celery 태스크 관리",
     version="1.0.0",
+    # orjson 직렬화 (한글을 이스케이프하지 않은 UTF-8 그대로 출력)
+    default_response_class=ORJSONResponse,
     swagger_ui_parameters={
         "persistAuthorization": True  # 토큰을 브라우저에 저장하여 새로고침 시에도 유지
     }
 )
 
+# 인증 엔드포인트 요청 제한
+# (나중에 추가한 미들웨어가 바깥쪽에서 실행되므로 CORS보다 먼저 추가하여
+#  429 응답에도 CORS 헤더가 붙어 브라우저에서 상태 코드와 Retry-After를 읽을 수 있게 함)
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(RateLimitMiddleware)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -31,9 +51,68 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Retry-After"],  # 429/503 응답의 재시도 대기 시간을 프론트엔드에서 읽을 수 있도록
+)
+
+# 응답 압축 (brotli/gzip)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY
 )
 
+# 요청 프로파일링 (라우트별 지연 시간, SQL 문 수, N+1 감지 -> /metrics)
+if settings.PROFILING_ENABLED:
+    instrument_engine(engine)
+    instrument_engine(async_engine.sync_engine)
+    for replica in replica_router.replicas:
+        instrument_engine(replica.engine.sync_engine)
+    app.add_middleware(
+        ProfilingMiddleware,
+        n_plus_one_threshold=settings.PROFILING_N_PLUS_ONE_THRESHOLD,
+        server_timing=settings.PROFILING_SERVER_TIMING
+    )
+
 # Include routers
 app.include_router(health.router)
 app.include_router(auth.router)
 app.include_router(user.router)
+app.include_router(news.router)
+app.include_router(metrics.router)
+
+# 백그라운드 태스크
+background_tasks: List[asyncio.Task] = []
+
+
+@app.on_event("startup")
+async def start_background_tasks():
+    # 스키마 준비 (import 시점이 아닌 앱 시작 시 한 번)
+    if settings.DB_SCHEMA_MODE == "migrate":
+        await asyncio.to_thread(migrations.upgrade, engine)
+        # 큰 인덱스는 앱 시작을 막지 않도록 별도 단계에서 생성 (없으면 안내만)
+        missing = await asyncio.to_thread(migrations.missing_concurrent_indexes, engine)
+        if missing:
+            print(f"⚠️ 아직 만들지 않은 인덱스: {', '.join(missing)} (python -m app.migrations indexes 로 생성)")
+    elif settings.DB_SCHEMA_MODE == "create_all":
+        await asyncio.to_thread(Base.metadata.create_all, bind=engine)
+    
+    await login_history_writer.start()
+    if settings.NEWS_STREAM_ENABLED:
+        await news_broker.start()
+    background_tasks.append(asyncio.create_task(purge_expired_refresh_tokens_periodically()))
+    background_tasks.append(asyncio.create_task(maintain_login_history_partitions_periodically()))
+    if replica_router.replicas:
+        background_tasks.append(asyncio.create_task(monitor_replica_lag_periodically()))
+
+
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    background_tasks.clear()
+    await news_broker.stop()
+    await login_history_writer.stop()
+    password_hasher.shutdown()
+    await replica_router.dispose()
@@ -0,0 +1,140 @@
+"""
+버전 관리되는 스키마 마이그레이션
+
+app/migrations/versions/ 의 mNNNN_*.py 모듈을 revision 순서대로 적용하고,
+적용 이력은 schema_migrations 테이블에 기록합니다.
+
+각 마이그레이션 모듈은 다음을 정의합니다.
+    revision: str       - 정렬 가능한 버전 번호 ("0001")
+    description: str    - 설명
+    upgrade(conn)       - 동기 Connection으로 스키마 변경 실행
+    CONCURRENT_INDEXES  - (선택) {인덱스 이름: CREATE INDEX CONCURRENTLY 문}
+                          트랜잭션 안에서 만들 수 없고 큰 테이블에서 오래 걸리는 인덱스로,
+                          upgrade와 분리된 indexes 명령에서 만듭니다.
+
+사용법 (backend 디렉터리에서):
+    python -m app.migrations upgrade
+    python -m app.migrations indexes
+    python -m app.migrations status
+"""
+import importlib
+import pkgutil
+from typing import List
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from . import versions
+
+# 여러 워커가 동시에 시작해도 마이그레이션은 한 번만 실행되도록 사용하는 advisory lock 키
+MIGRATION_LOCK_KEY = 726_510_001
+
+
+def load_migrations() -> List:
+    """versions 패키지의 마이그레이션 모듈을 revision 순서로 반환합니다."""
+    modules = []
+    for info in pkgutil.iter_modules(versions.__path__):
+        if info.name.startswith("m"):
+            modules.append(importlib.import_module(f"{versions.__name__}.{info.name}"))
+    return sorted(modules, key=lambda m: m.revision)
+
+
+def _ensure_version_table(conn):
+    conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version VARCHAR(32) PRIMARY KEY,
+            description TEXT NOT NULL,
+            applied_at TIMESTAMP NOT NULL DEFAULT now()
+        )
+    """))
+
+
+def upgrade(engine: Engine) -> List[str]:
+    """
+    적용되지 않은 마이그레이션을 하나의 트랜잭션에서 순서대로 적용합니다.
+    
+    Returns:
+        새로 적용된 revision 목록
+    """
+    applied_now = []
+    with engine.begin() as conn:
+        conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+        _ensure_version_table(conn)
+        applied = set(conn.execute(text("SELECT version FROM schema_migrations")).scalars())
+
+        for migration in load_migrations():
+            if migration.revision in applied:
+                continue
+            print(f"마이그레이션 적용: {migration.revision} {migration.description}")
+            migration.upgrade(conn)
+            conn.execute(
+                text("INSERT INTO schema_migrations (version, description) VALUES (:version, :description)"),
+                {"version": migration.revision, "description": migration.description}
+            )
+            applied_now.append(migration.revision)
+    return applied_now
+
+
+def status(engine: Engine) -> List[tuple]:
+    """(revision, 설명, 적용 일시 또는 None) 목록을 반환합니다."""
+    with engine.begin() as conn:
+        _ensure_version_table(conn)
+        applied = dict(conn.execute(text("SELECT version, applied_at FROM schema_migrations")).all())
+    return [(m.revision, m.description, applied.get(m.revision)) for m in load_migrations()]
+
+
+def _index_valid(conn, name: str):
+    """인덱스가 있으면 유효 여부(indisvalid), 없으면 None을 반환합니다."""
+    return conn.execute(
+        text("""
+            SELECT i.indisvalid
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE c.relname = :name AND c.relnamespace = current_schema()::regnamespace
+        """),
+        {"name": name}
+    ).scalar()
+
+
+def build_concurrent_indexes(engine: Engine) -> List[str]:
+    """
+    적용된 마이그레이션의 CONCURRENT_INDEXES를 트랜잭션 밖에서 하나씩 만듭니다.
+
+    CREATE INDEX CONCURRENTLY는 테이블 쓰기를 막지 않으므로 서비스 중에 실행할 수 있습니다.
+    이전 실행이 중단되어 INVALID로 남은 인덱스는 삭제하고 다시 만듭니다.
+
+    Returns:
+        새로 만든 인덱스 이름 목록
+    """
+    built = []
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        _ensure_version_table(conn)
+        applied = set(conn.execute(text("SELECT version FROM schema_migrations")).scalars())
+        for migration in load_migrations():
+            if migration.revision not in applied:
+                continue
+            for name, statement in getattr(migration, "CONCURRENT_INDEXES", {}).items():
+                valid = _index_valid(conn, name)
+                if valid:
+                    continue
+                if valid is False:
+                    print(f"INVALID 인덱스 삭제 후 다시 생성: {name}")
+                    conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+                print(f"인덱스 생성 (CONCURRENTLY): {name}")
+                conn.execute(text(statement))
+                built.append(name)
+    return built
+
+
+def missing_concurrent_indexes(engine: Engine) -> List[str]:
+    """적용된 마이그레이션의 CONCURRENT_INDEXES 중 아직 없거나 INVALID인 인덱스 이름 목록"""
+    missing = []
+    with engine.begin() as conn:
+        _ensure_version_table(conn)
+        applied = set(conn.execute(text("SELECT version FROM schema_migrations")).scalars())
+        for migration in load_migrations():
+            if migration.revision not in applied:
+                continue
+            for name in getattr(migration, "CONCURRENT_INDEXES", {}):
+                if not _index_valid(conn, name):
+                    missing.append(name)
+    return missing
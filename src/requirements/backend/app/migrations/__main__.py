@@ -0,0 +1,33 @@
+import argparse
+
+from app.core.db import engine
+from app.migrations import upgrade, status, build_concurrent_indexes, missing_concurrent_indexes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스키마 마이그레이션")
+    parser.add_argument(
+        "command",
+        choices=["upgrade", "indexes", "status"],
+        help="upgrade: 미적용 마이그레이션 적용, indexes: 대형 인덱스 CONCURRENTLY 생성, status: 적용 현황 조회"
+    )
+    args = parser.parse_args()
+
+    if args.command == "upgrade":
+        applied = upgrade(engine)
+        print(f"{len(applied)}개 마이그레이션 적용 완료" if applied else "적용할 마이그레이션이 없습니다")
+        missing = missing_concurrent_indexes(engine)
+        if missing:
+            print(f"⚠️ 아직 만들지 않은 인덱스: {', '.join(missing)} (python -m app.migrations indexes 로 생성)")
+    elif args.command == "indexes":
+        built = build_concurrent_indexes(engine)
+        print(f"{len(built)}개 인덱스 생성 완료" if built else "만들 인덱스가 없습니다")
+    else:
+        for revision, description, applied_at in status(engine):
+            print(f"{revision}  {'적용됨 ' + str(applied_at) if applied_at else '미적용'}  {description}")
+        for name in missing_concurrent_indexes(engine):
+            print(f"인덱스 미생성  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+from sqlalchemy import text
+
+revision = "0001"
+description = "초기 스키마 (마이그레이션 도입 전 create_all 기준)"
+
+# 마이그레이션 도입 전 모델로 create_all 하던 시점의 스키마를 그대로 고정한 DDL
+# 이후 스키마 변경은 각 revision이 담당하므로 모델이 바뀌어도 이 파일은 수정하지 않음
+# (이미 있는 테이블/인덱스는 건너뛰므로 create_all로 만들어진 기존 DB도 그대로 기준 버전이 됨)
+STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS data_collection_history (
+        collection_id BIGSERIAL NOT NULL,
+        data_type CHAR(1) NOT NULL,
+        start_date TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        end_date TIMESTAMP WITHOUT TIME ZONE,
+        collected_count INTEGER DEFAULT '0',
+        success_flag BOOLEAN DEFAULT 'true' NOT NULL,
+        error_content TEXT,
+        PRIMARY KEY (collection_id),
+        CONSTRAINT check_data_type CHECK (data_type IN ('N'))
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_data_collection_history_collection_id ON data_collection_history (collection_id)",
+    """
+    CREATE TABLE IF NOT EXISTS law (
+        law_id VARCHAR(6) NOT NULL,
+        proclamation_date DATE NOT NULL,
+        law_type_code VARCHAR(10) NOT NULL,
+        law_name VARCHAR(500) NOT NULL,
+        ministry_code VARCHAR(10) NOT NULL,
+        enforcement_date DATE,
+        revision_type VARCHAR(20),
+        law_file_path TEXT,
+        PRIMARY KEY (law_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_law_law_id ON law (law_id)",
+    """
+    CREATE TABLE IF NOT EXISTS member (
+        member_id BIGSERIAL NOT NULL,
+        email VARCHAR(100) NOT NULL,
+        passwd VARCHAR(64),
+        member_name VARCHAR(50) NOT NULL,
+        phone VARCHAR(11) NOT NULL,
+        profile_image VARCHAR(500) NOT NULL,
+        join_date TIMESTAMP WITHOUT TIME ZONE DEFAULT now() NOT NULL,
+        refresh_token TEXT,
+        token_version BIGINT DEFAULT '1' NOT NULL,
+        last_login TIMESTAMP WITHOUT TIME ZONE,
+        account_status CHAR(1) DEFAULT 'A' NOT NULL,
+        withdrawal_date TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (member_id),
+        UNIQUE (email)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_member_member_id ON member (member_id)",
+    """
+    CREATE TABLE IF NOT EXISTS issue (
+        issue_id BIGSERIAL NOT NULL,
+        issue_name VARCHAR(200) NOT NULL,
+        issue_description TEXT,
+        keywords VARCHAR(500),
+        occurrence_date TIMESTAMP WITHOUT TIME ZONE,
+        related_news_count INTEGER DEFAULT '0',
+        news_sentiment FLOAT,
+        law_id VARCHAR(6),
+        law_score FLOAT,
+        PRIMARY KEY (issue_id),
+        CONSTRAINT check_news_sentiment_range CHECK (news_sentiment >= 0 AND news_sentiment <= 1),
+        CONSTRAINT check_law_score_range CHECK (law_score >= 0 AND law_score <= 1),
+        FOREIGN KEY(law_id) REFERENCES law (law_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_issue_issue_id ON issue (issue_id)",
+    """
+    CREATE TABLE IF NOT EXISTS legislation_analysis (
+        legislation_analysis_id VARCHAR(11) NOT NULL,
+        law_id VARCHAR(6) NOT NULL,
+        legislation_type CHAR(1) NOT NULL,
+        legislation_reason TEXT NOT NULL,
+        PRIMARY KEY (legislation_analysis_id),
+        CONSTRAINT check_legislation_type CHECK (legislation_type IN ('E', 'A', 'R')),
+        FOREIGN KEY(law_id) REFERENCES law (law_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_legislation_analysis_legislation_analysis_id ON legislation_analysis (legislation_analysis_id)",
+    """
+    CREATE TABLE IF NOT EXISTS login_history (
+        history_id BIGSERIAL NOT NULL,
+        member_id BIGINT NOT NULL,
+        login_date TIMESTAMP WITHOUT TIME ZONE DEFAULT now() NOT NULL,
+        logout_date TIMESTAMP WITHOUT TIME ZONE,
+        access_ip VARCHAR(45),
+        access_device VARCHAR(200),
+        browser_info VARCHAR(300),
+        failure_reason VARCHAR(200),
+        PRIMARY KEY (history_id),
+        FOREIGN KEY(member_id) REFERENCES member (member_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_login_history_history_id ON login_history (history_id)",
+    """
+    CREATE TABLE IF NOT EXISTS refresh_token (
+        token_id BIGSERIAL NOT NULL,
+        member_id BIGINT NOT NULL,
+        token_hash CHAR(64) NOT NULL,
+        issued_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now() NOT NULL,
+        expires_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        access_device VARCHAR(200),
+        PRIMARY KEY (token_id),
+        FOREIGN KEY(member_id) REFERENCES member (member_id) ON DELETE CASCADE,
+        UNIQUE (token_hash)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_refresh_token_expires_at ON refresh_token (expires_at)",
+    "CREATE INDEX IF NOT EXISTS ix_refresh_token_member_id ON refresh_token (member_id)",
+    """
+    CREATE TABLE IF NOT EXISTS social_account (
+        social_id BIGSERIAL NOT NULL,
+        member_id BIGINT NOT NULL,
+        social_platform VARCHAR(50) NOT NULL,
+        social_account_id VARCHAR(200) NOT NULL,
+        linked_date TIMESTAMP WITHOUT TIME ZONE DEFAULT now() NOT NULL,
+        link_status CHAR(1) DEFAULT 'A' NOT NULL,
+        profile_sync BOOLEAN DEFAULT 'false' NOT NULL,
+        PRIMARY KEY (social_id),
+        FOREIGN KEY(member_id) REFERENCES member (member_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_social_account_social_id ON social_account (social_id)",
+    """
+    CREATE TABLE IF NOT EXISTS issue_legislation_analysis (
+        legislation_analysis_id VARCHAR(11) NOT NULL,
+        issue_id BIGINT NOT NULL,
+        PRIMARY KEY (legislation_analysis_id, issue_id),
+        FOREIGN KEY(legislation_analysis_id) REFERENCES legislation_analysis (legislation_analysis_id),
+        FOREIGN KEY(issue_id) REFERENCES issue (issue_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS news (
+        news_id BIGSERIAL NOT NULL,
+        news_title VARCHAR(500) NOT NULL,
+        body TEXT NOT NULL,
+        summary TEXT,
+        category TEXT NOT NULL,
+        sub_category TEXT NOT NULL,
+        published TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        company TEXT NOT NULL,
+        news_url VARCHAR(1000) DEFAULT now() NOT NULL,
+        issue_id BIGINT,
+        collection_id BIGINT,
+        PRIMARY KEY (news_id),
+        FOREIGN KEY(issue_id) REFERENCES issue (issue_id),
+        FOREIGN KEY(collection_id) REFERENCES data_collection_history (collection_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_news_news_id ON news (news_id)",
+    """
+    CREATE TABLE IF NOT EXISTS report (
+        report_id BIGSERIAL NOT NULL,
+        issue_id BIGINT NOT NULL,
+        report_name VARCHAR(200) NOT NULL,
+        report_type CHAR(1) NOT NULL,
+        created_date TIMESTAMP WITHOUT TIME ZONE DEFAULT now() NOT NULL,
+        PRIMARY KEY (report_id),
+        CONSTRAINT check_report_type CHECK (report_type IN ('D', 'W', 'M')),
+        FOREIGN KEY(issue_id) REFERENCES issue (issue_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_report_report_id ON report (report_id)",
+    """
+    CREATE TABLE IF NOT EXISTS issue_report (
+        issue_report_id BIGSERIAL NOT NULL,
+        issue_id BIGINT NOT NULL,
+        report_id BIGINT NOT NULL,
+        PRIMARY KEY (issue_report_id),
+        FOREIGN KEY(issue_id) REFERENCES issue (issue_id),
+        FOREIGN KEY(report_id) REFERENCES report (report_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_issue_report_issue_report_id ON issue_report (issue_report_id)",
+]
+
+
+def upgrade(conn):
+    for statement in STATEMENTS:
+        conn.execute(text(statement))
@@ -0,0 +1,21 @@
+from sqlalchemy import text
+
+revision = "0002"
+description = "조회 빈도가 높은 경로 인덱스 추가"
+
+INDEXES = [
+    # 회원별 로그인 기록 조회 / 로그아웃 처리
+    "CREATE INDEX IF NOT EXISTS ix_login_history_member_id ON login_history (member_id)",
+    # 최신순 뉴스 목록 (게시일 + ID로 정렬/페이지네이션)
+    "CREATE INDEX IF NOT EXISTS ix_news_published ON news (published, news_id)",
+    "CREATE INDEX IF NOT EXISTS ix_news_company ON news (company)",
+    "CREATE INDEX IF NOT EXISTS ix_news_issue_id ON news (issue_id)",
+    # 크롤링 중복 확인
+    "CREATE INDEX IF NOT EXISTS ix_news_news_url ON news (news_url)",
+    "CREATE INDEX IF NOT EXISTS ix_issue_law_id ON issue (law_id)",
+]
+
+
+def upgrade(conn):
+    for statement in INDEXES:
+        conn.execute(text(statement))
@@ -0,0 +1,8 @@
+from sqlalchemy import text
+
+revision = "0003"
+description = "refresh_token 테이블로 이전된 member.refresh_token 컬럼 삭제"
+
+
+def upgrade(conn):
+    conn.execute(text("ALTER TABLE member DROP COLUMN IF EXISTS refresh_token"))
@@ -0,0 +1,55 @@
+from datetime import date
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.partitions import ensure_month_partitions
+
+revision = "0004"
+description = "login_history 월별 범위 파티션 전환"
+
+COLUMNS = "history_id, member_id, login_date, logout_date, access_ip, access_device, browser_info, failure_reason"
+
+
+def upgrade(conn):
+    relkind = conn.execute(text("SELECT relkind FROM pg_class WHERE relname = 'login_history'")).scalar()
+
+    if relkind == "p":
+        # DB_SCHEMA_MODE=create_all 로 현재 모델 기준 테이블이 이미 만들어진 경우 파티션만 준비
+        ensure_month_partitions(conn, "login_history", date.today(), settings.LOGIN_HISTORY_PARTITION_MONTHS_AHEAD)
+        return
+
+    # 기존 일반 테이블을 옮겨 두고 같은 구조의 파티션 테이블 생성
+    # (파티션 키가 기본 키에 포함되어야 하므로 PK는 (history_id, login_date))
+    sequence = conn.execute(text("SELECT pg_get_serial_sequence('login_history', 'history_id')")).scalar()
+    conn.execute(text("ALTER TABLE login_history RENAME TO login_history_legacy"))
+    conn.execute(text("ALTER TABLE login_history_legacy RENAME CONSTRAINT login_history_pkey TO login_history_legacy_pkey"))
+    conn.execute(text("ALTER INDEX IF EXISTS ix_login_history_history_id RENAME TO ix_login_history_legacy_history_id"))
+    conn.execute(text("ALTER INDEX IF EXISTS ix_login_history_member_id RENAME TO ix_login_history_legacy_member_id"))
+
+    conn.execute(text(f"""
+        CREATE TABLE login_history (
+            history_id BIGINT NOT NULL DEFAULT nextval('{sequence}'),
+            member_id BIGINT NOT NULL REFERENCES member (member_id),
+            login_date TIMESTAMP NOT NULL DEFAULT now(),
+            logout_date TIMESTAMP,
+            access_ip VARCHAR(45),
+            access_device VARCHAR(200),
+            browser_info VARCHAR(300),
+            failure_reason VARCHAR(200),
+            PRIMARY KEY (history_id, login_date)
+        ) PARTITION BY RANGE (login_date)
+    """))
+    conn.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY login_history.history_id"))
+    conn.execute(text("CREATE INDEX ix_login_history_history_id ON login_history (history_id)"))
+    conn.execute(text("CREATE INDEX ix_login_history_member_id ON login_history (member_id)"))
+
+    # 기존 데이터가 들어갈 파티션부터 생성 후 이관
+    oldest = conn.execute(text("SELECT min(login_date) FROM login_history_legacy")).scalar()
+    ensure_month_partitions(
+        conn,
+        "login_history",
+        oldest.date() if oldest else date.today(),
+        settings.LOGIN_HISTORY_PARTITION_MONTHS_AHEAD
+    )
+    conn.execute(text(f"INSERT INTO login_history ({COLUMNS}) SELECT {COLUMNS} FROM login_history_legacy"))
+    conn.execute(text("DROP TABLE login_history_legacy"))
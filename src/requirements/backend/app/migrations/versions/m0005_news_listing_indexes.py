@@ -0,0 +1,16 @@
+from sqlalchemy import text
+
+revision = "0005"
+description = "뉴스 목록 필터 + 키셋 페이지네이션용 복합 인덱스"
+
+INDEXES = [
+    # 신문사 필터 + (게시일, ID) 정렬
+    "CREATE INDEX IF NOT EXISTS ix_news_company_published ON news (company, published, news_id)",
+    # 카테고리/상세 카테고리 필터 + (게시일, ID) 정렬
+    "CREATE INDEX IF NOT EXISTS ix_news_category_published ON news (category, sub_category, published, news_id)",
+]
+
+
+def upgrade(conn):
+    for statement in INDEXES:
+        conn.execute(text(statement))
@@ -0,0 +1,32 @@
+from sqlalchemy import text
+
+revision = "0006"
+description = "뉴스 제목/본문 한국어 바이그램 검색 인덱스"
+
+
+def upgrade(conn):
+    # 문서를 소문자로 바꾼 뒤 한글/영문/숫자로만 이루어진 2글자 조각(바이그램) 집합으로 변환
+    # 형태소 분석 없이도 한국어 부분 문자열 검색이 가능하고 2글자 단어도 인덱스를 사용함
+    conn.execute(text(r"""
+        CREATE OR REPLACE FUNCTION news_bigrams(doc text) RETURNS text[]
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+            SELECT coalesce(array_agg(DISTINCT gram), '{}')
+            FROM (
+                SELECT substr(t, i, 2) AS gram
+                FROM (SELECT lower(coalesce(doc, '')) AS t) s,
+                     generate_series(1, greatest(length(t) - 1, 0)) AS i
+            ) grams
+            WHERE gram ~ '^[0-9a-z가-힣]{2}$'
+        $$
+    """))
+
+
+# 식 인덱스 - 별도 컬럼 없이 INSERT/UPDATE 시 자동으로 갱신됨
+# 모든 본문의 바이그램을 계산하므로 큰 테이블에서는 오래 걸림 - 앱 시작 시의 마이그레이션 트랜잭션에서
+# 만들면 그동안 크롤러 INSERT와 앱 시작이 막히므로 별도 단계(python -m app.migrations indexes)에서 CONCURRENTLY로 생성
+CONCURRENT_INDEXES = {
+    "ix_news_search_bigrams": (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_news_search_bigrams "
+        "ON news USING gin (news_bigrams(news_title || ' ' || body))"
+    ),
+}
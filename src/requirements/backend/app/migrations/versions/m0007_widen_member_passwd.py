@@ -0,0 +1,8 @@
+from sqlalchemy import text
+
+revision = "0007"
+description = "member.passwd 컬럼 확장 (salt 포함 scrypt 해시 저장)"
+
+
+def upgrade(conn):
+    conn.execute(text("ALTER TABLE member ALTER COLUMN passwd TYPE VARCHAR(255)"))
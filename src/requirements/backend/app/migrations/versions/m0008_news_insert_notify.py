@@ -0,0 +1,25 @@
+from sqlalchemy import text
+
+revision = "0008"
+description = "news INSERT 시 news_inserted 채널로 NOTIFY (실시간 뉴스 스트림)"
+
+
+def upgrade(conn):
+    # 문장(statement) 단위 트리거 - 대량 INSERT/COPY도 문장당 알림 한 번 (페이로드: 추가된 최대 news_id)
+    conn.execute(text("""
+        CREATE OR REPLACE FUNCTION notify_news_inserted() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            PERFORM pg_notify('news_inserted', (SELECT max(news_id)::text FROM inserted_news));
+            RETURN NULL;
+        END
+        $$
+    """))
+    conn.execute(text("DROP TRIGGER IF EXISTS news_inserted_notify ON news"))
+    conn.execute(text("""
+        CREATE TRIGGER news_inserted_notify
+        AFTER INSERT ON news
+        REFERENCING NEW TABLE AS inserted_news
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION notify_news_inserted()
+    """))
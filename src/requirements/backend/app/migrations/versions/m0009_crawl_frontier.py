@@ -0,0 +1,38 @@
+from sqlalchemy import text
+
+revision = "0009"
+description = "크롤러 분산 프런티어 테이블 (crawl_frontier)"
+
+STATEMENTS = [
+    # 발견한 기사 URL별 상태/우선순위/임대 정보 (celery/crawling/CrawlFrontier.py)
+    # state: P(대기), L(임대 중), D(완료), F(실패)
+    """
+    CREATE TABLE IF NOT EXISTS crawl_frontier (
+        url_id BIGSERIAL PRIMARY KEY,
+        news_url VARCHAR(1000) NOT NULL UNIQUE,
+        company TEXT NOT NULL,
+        category TEXT NOT NULL,
+        sub_category TEXT NOT NULL,
+        state CHAR(1) NOT NULL DEFAULT 'P' CHECK (state IN ('P', 'L', 'D', 'F')),
+        priority DOUBLE PRECISION NOT NULL DEFAULT 0,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        lease_owner VARCHAR(200),
+        lease_expires TIMESTAMP,
+        published TIMESTAMP,
+        discovered_at TIMESTAMP NOT NULL DEFAULT now(),
+        updated_at TIMESTAMP NOT NULL DEFAULT now()
+    )
+    """,
+    # 임대 대상(대기 + 임대 중) 행만 우선순위 순으로 찾는 부분 인덱스
+    """
+    CREATE INDEX IF NOT EXISTS ix_crawl_frontier_claim
+    ON crawl_frontier (company, priority DESC, url_id)
+    WHERE state IN ('P', 'L')
+    """,
+]
+
+
+def upgrade(conn):
+    # 이전에 크롤러가 실행 중에 직접 만든 테이블이 있으면 그대로 사용 (같은 정의)
+    for statement in STATEMENTS:
+        conn.execute(text(statement))
@@ -1,6 +1,7 @@
 from app.models.member import Member
 from app.models.login_history import LoginHistory
 from app.models.social_account import SocialAccount
+from app.models.refresh_token import RefreshToken
 
 # 정책 인사이트 관련 모델
 from app.models.news import News
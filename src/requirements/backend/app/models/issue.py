@@ -15,7 +15,7 @@ class Issue(Base):
     occurrence_date = Column(TIMESTAMP, nullable=True, doc="이슈 발생 기간")
     related_news_count = Column(Integer, nullable=True, server_default='0', doc="관련 뉴스 건수")
     news_sentiment = Column(Float, nullable=True, doc="뉴스 기반 감성 지수")
-    law_id = Column(String(6), ForeignKey("law.law_id"), nullable=True, doc="관련 법안 번호")
+    law_id = Column(String(6), ForeignKey("law.law_id"), nullable=True, index=True, doc="관련 법안 번호")
     law_score = Column(Float, nullable=True, doc="법안과의 연관도")
 
     __table_args__ = (
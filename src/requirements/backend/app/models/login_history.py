@@ -7,10 +7,12 @@ from app.core.db import Base
 
 class LoginHistory(Base):
     __tablename__ = "login_history"
+    # 로그인 일시 기준 월별 범위 파티션 (파티션 생성/보관은 services/login_history_maintenance.py)
+    __table_args__ = {"postgresql_partition_by": "RANGE (login_date)"}
 
     history_id = Column(BigInteger, primary_key=True, index=True, autoincrement=True, doc="로그인 기록의 고유 식별번호")
-    member_id = Column(BigInteger, ForeignKey("member.member_id"), nullable=False, doc="로그인한 회원 번호")
-    login_date = Column(TIMESTAMP, nullable=False, server_default=func.now(), doc="로그인 일시")
+    member_id = Column(BigInteger, ForeignKey("member.member_id"), nullable=False, index=True, doc="로그인한 회원 번호")
+    login_date = Column(TIMESTAMP, primary_key=True, nullable=False, server_default=func.now(), doc="로그인 일시 (파티션 키)")
     logout_date = Column(TIMESTAMP, nullable=True, doc="로그아웃 일시")
     access_ip = Column(String(45), nullable=True, doc="접속한 IP 주소")  # IPv4, IPv6 지원
     access_device = Column(String(200), nullable=True, doc="접속한 기기 정보")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, TIMESTAMP, BigInteger, ForeignKey
+from sqlalchemy import Column, String, Text, TIMESTAMP, BigInteger, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -15,11 +15,19 @@ class News(Base):
     category = Column(Text, nullable=False, doc="뉴스의 카테고리")
     sub_category = Column(Text, nullable=False, doc="카테고리의 상세 카테고리")
     published = Column(TIMESTAMP, nullable=False, doc="뉴스 게시 일시")
-    company = Column(Text, nullable=False, doc="신문사")  # 1: 한국경제, 2: 세계일보, 3: 조선일보, 4: 중앙일보, 5: 문화일보, 6: 아시아투데이
-    news_url = Column(String(1000), nullable=False, server_default=func.now(), doc="뉴스 원문 URL")
-    issue_id = Column(BigInteger, ForeignKey("issue.issue_id"), nullable=True, doc="연관된 이슈 번호")
+    company = Column(Text, nullable=False, index=True, doc="신문사")  # 1: 한국경제, 2: 세계일보, 3: 조선일보, 4: 중앙일보, 5: 문화일보, 6: 아시아투데이
+    news_url = Column(String(1000), nullable=False, server_default=func.now(), index=True, doc="뉴스 원문 URL")
+    issue_id = Column(BigInteger, ForeignKey("issue.issue_id"), nullable=True, index=True, doc="연관된 이슈 번호")
     collection_id = Column(BigInteger, ForeignKey("data_collection_history.collection_id"), nullable=True, doc="데이터 수집 이력 코드")
 
+    __table_args__ = (
+        # 최신순 목록 정렬/페이지네이션용 (게시일 + ID)
+        Index("ix_news_published", "published", "news_id"),
+        # 필터 + 키셋 페이지네이션용
+        Index("ix_news_company_published", "company", "published", "news_id"),
+        Index("ix_news_category_published", "category", "sub_category", "published", "news_id"),
+    )
+
     # 관계 설정
     issue = relationship("Issue", back_populates="news")
     data_collection = relationship("DataCollectionHistory", back_populates="news")
\ No newline at end of file
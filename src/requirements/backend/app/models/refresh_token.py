@@ -0,0 +1,23 @@
+from sqlalchemy import Column, BigInteger, CHAR, String, TIMESTAMP, ForeignKey, Index
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+
+from app.core.db import Base
+
+
+class RefreshToken(Base):
+    __tablename__ = "refresh_token"
+    __table_args__ = (
+        # 만료 토큰 일괄 삭제용
+        Index("ix_refresh_token_expires_at", "expires_at"),
+    )
+
+    token_id = Column(BigInteger, primary_key=True, autoincrement=True, doc="리프레시 토큰 세션의 고유 식별번호")
+    member_id = Column(BigInteger, ForeignKey("member.member_id", ondelete="CASCADE"), nullable=False, index=True, doc="토큰을 발급받은 회원 번호")
+    token_hash = Column(CHAR(64), nullable=False, unique=True, doc="리프레시 토큰의 SHA-256 해시")
+    issued_at = Column(TIMESTAMP, nullable=False, server_default=func.now(), doc="토큰 발급 일시")
+    expires_at = Column(TIMESTAMP, nullable=False, doc="토큰 만료 일시 (UTC)")
+    access_device = Column(String(200), nullable=True, doc="발급받은 기기 정보")
+
+    # 관계 설정
+    member = relationship("Member", back_populates="refresh_tokens")
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Header, Request
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from app.core.db import get_db
+from app.core.db import get_async_db
 from app.schemas.auth import (
     LoginRequest, LoginResponse, 
     LogoutResponse, SignupRequest, SignupResponse,
@@ -56,7 +56,7 @@ async def get_csrf_token():
 async def login(
 	login_data: LoginRequest,
 	request: Request,
-	db: Session = Depends(get_db)
+	db: AsyncSession = Depends(get_async_db)
 ):
 	"""
 	로그인 API
@@ -76,7 +76,7 @@ async def login(
 		# User-Agent 추출
 		user_agent = request.headers.get("user-agent", "")
 		
-		return auth_service.login_user(db, login_data, client_ip, user_agent)
+		return await auth_service.login_user(db, login_data, client_ip, user_agent)
 	except HTTPException:
 		raise
 	except Exception as e:
@@ -96,12 +96,12 @@ async def login(
 )
 async def logout(
 	token: str = Depends(get_token_from_credentials),
-	db: Session = Depends(get_db)
+	db: AsyncSession = Depends(get_async_db)
 ):
 	"""
 	로그아웃 API
 	
-	액세스 토큰을 검증하고 사용자의 토큰을 무효화합니다.
+	액세스 토큰을 검증하고 이 기기의 세션(리프레시 토큰)을 삭제합니다. 다른 기기의 로그인은 유지됩니다.
 	
 	- **Authorization Header**: Swagger UI의 Authorize 버튼을 통해 액세스 토큰 입력
 	
@@ -109,7 +109,7 @@ async def logout(
 		LogoutResponse: 로그아웃 성공 메시지
 	"""
 	try:
-		return auth_service.logout_user(db, token)
+		return await auth_service.logout_user(db, token)
 	except HTTPException:
 		raise
 	except Exception as e:
@@ -130,7 +130,7 @@ async def logout(
 )
 async def signup(
 	signup_data: SignupRequest,
-	db: Session = Depends(get_db)
+	db: AsyncSession = Depends(get_async_db)
 ):
 	"""
 	회원가입 API
@@ -146,7 +146,7 @@ async def signup(
 		SignupResponse: 회원가입 성공 메시지
 	"""
 	try:
-		return auth_service.signup_user(db, signup_data)
+		return await auth_service.signup_user(db, signup_data)
 	except HTTPException:
 		raise
 	except Exception as e:
@@ -166,7 +166,7 @@ async def signup(
 )
 async def create_refresh(
 	refresh_data: RefreshTokenRequest,
-	db: Session = Depends(get_db)
+	db: AsyncSession = Depends(get_async_db)
 ):
 	"""
 	리프레시 토큰을 통한 액세스 토큰 재발급 API
@@ -182,7 +182,7 @@ async def create_refresh(
 	try:
 		# Bearer 접두사를 추가하여 서비스 레이어로 전달
 		token_with_bearer = f"Bearer {refresh_data.refreshToken}"
-		return auth_service.refresh_access_token(db, token_with_bearer)
+		return await auth_service.refresh_access_token(db, token_with_bearer)
 	except HTTPException:
 		raise
 	except Exception as e:
@@ -202,7 +202,7 @@ async def create_refresh(
 )
 async def reset_password_nologin(
 	reset_data: ResetPasswordNoLoginRequest,
-	db: Session = Depends(get_db)
+	db: AsyncSession = Depends(get_async_db)
 ):
 	"""
 	비로그인 상태에서 비밀번호 변경 API
@@ -216,7 +216,7 @@ async def reset_password_nologin(
 		PasswordChangeResponse: 비밀번호 변경 성공 메시지
 	"""
 	try:
-		return auth_service.reset_password_nologin(db, reset_data)
+		return await auth_service.reset_password_nologin(db, reset_data)
 	except HTTPException:
 		raise
 	except Exception as e:
@@ -237,12 +237,12 @@ async def reset_password_nologin(
 async def reset_password_login(
 	reset_data: ResetPasswordLoginRequest,
 	token: str = Depends(get_token_from_credentials),
-	db: Session = Depends(get_db)
+	db: AsyncSession = Depends(get_async_db)
 ):
 	"""
 	로그인 상태에서 비밀번호 변경 API
 	
-	액세스 토큰을 검증하고 새 비밀번호로 변경합니다.
+	액세스 토큰을 검증하고 새 비밀번호로 변경합니다. 변경 후 모든 기기에서 로그아웃되므로 다시 로그인해야 합니다.
 	
 	- **Authorization Header**: Swagger UI의 Authorize 버튼을 통해 액세스 토큰 입력
 	- **password**: 새 비밀번호 (10-20자, 영대문자, 영소문자, 숫자, 특수문자 최소 1개 이상 포함)
@@ -251,7 +251,7 @@ async def reset_password_login(
 		List[PasswordHistoryItem]: 비밀번호 변경 이력 목록
 	"""
 	try:
-		return auth_service.reset_password_login(db, reset_data, token)
+		return await auth_service.reset_password_login(db, reset_data, token)
 	except HTTPException:
 		raise
 	except Exception as e:
@@ -271,7 +271,7 @@ async def reset_password_login(
 )
 async def find_id(
 	find_data: FindIdRequest,
-	db: Session = Depends(get_db)
+	db: AsyncSession = Depends(get_async_db)
 ):
 	"""
 	아이디 찾기 API
@@ -284,7 +284,7 @@ async def find_id(
 		FindIdResponse: 찾은 아이디(이메일)
 	"""
 	try:
-		return auth_service.find_user_id(db, find_data)
+		return await auth_service.find_user_id(db, find_data)
 	except HTTPException:
 		raise
 	except Exception as e:
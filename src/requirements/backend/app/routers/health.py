@@ -1,7 +1,23 @@
 from fastapi import APIRouter
+from app.core.pool import pool_metrics
+from app.core.replicas import replica_router
 
 router = APIRouter(prefix="/health", tags=["health"])
 
 @router.get("/")
 def health_check():
-	return {"status": "healthy"}
\ No newline at end of file
+	return {"status": "healthy"}
+
+# /health/db, /health/replicas는 내부 상태를 노출하므로 nginx에서 내부 네트워크만 허용 (/metrics와 동일)
+@router.get("/db")
+def db_pool_status():
+	"""커넥션 풀 지표 (체크아웃 수, 대기 시간, 오버플로 발생 등)"""
+	return {name: metrics.snapshot() for name, metrics in pool_metrics.items()}
+
+@router.get("/replicas")
+def replica_status():
+	"""읽기 복제본 상태 (마지막으로 확인한 복제 지연, 사용 여부)"""
+	return {
+		"max_lag_seconds": replica_router.max_lag_seconds,
+		"replicas": replica_router.snapshot()
+	}
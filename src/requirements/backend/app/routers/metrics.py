@@ -0,0 +1,14 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from app.core.profiling import profiling_metrics
+from app.core.password_hasher import password_hasher
+
+router = APIRouter(tags=["metrics"])
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """라우트별 처리 시간 히스토그램, SQL 문 수, DB 시간, N+1 의심 요청 수, 비밀번호 해시 대기열 (Prometheus 형식, 워커 프로세스별)"""
+    return PlainTextResponse(
+        profiling_metrics.render_prometheus() + password_hasher.render_prometheus(),
+        media_type="text/plain; version=0.0.4"
+    )
@@ -0,0 +1,253 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import Literal, Optional
+from app.core.dependencies import get_token_from_credentials
+from app.core.replicas import get_read_db
+from app.core.config import settings
+from app.core.response_cache import cached_response
+from app.schemas.news import NewsListResponse, NewsDetail, NewsSearchResponse, ErrorResponse
+from app.services import news as news_service
+from app.services import user as user_service
+from app.services import news_export
+from app.services import news_stream
+
+router = APIRouter(prefix="/api/v1/news", tags=["news"])
+
+@router.get(
+    '',
+    response_model=NewsListResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        400: {"model": ErrorResponse, "description": "Invalid cursor"},
+        500: {"model": ErrorResponse, "description": "Internal server error"}
+    }
+)
+async def list_news(
+    request: Request,
+    company: Optional[str] = Query(None, description="신문사"),
+    category: Optional[str] = Query(None, description="카테고리"),
+    sub_category: Optional[str] = Query(None, alias="subCategory", description="상세 카테고리"),
+    published_from: Optional[datetime] = Query(None, alias="publishedFrom", description="게시일 시작 (포함)"),
+    published_to: Optional[datetime] = Query(None, alias="publishedTo", description="게시일 끝 (미포함)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor"),
+    limit: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    include_body: bool = Query(False, alias="includeBody", description="본문 포함 여부"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    뉴스 목록 조회 API
+    
+    게시일 최신순으로 뉴스 목록을 조회합니다. 기본적으로 본문은 제외됩니다.
+    다음 페이지는 응답의 **nextCursor** 값을 **cursor** 로 전달하여 조회합니다.
+    응답은 ETag/Cache-Control과 함께 NEWS_LIST_CACHE_SECONDS 동안 캐시됩니다.
+    
+    Returns:
+        NewsListResponse: 뉴스 목록과 다음 페이지 커서
+    """
+    try:
+        return await cached_response(
+            request,
+            settings.NEWS_LIST_CACHE_SECONDS,
+            lambda: news_service.list_news(
+                db,
+                limit,
+                cursor=cursor,
+                company=company,
+                category=category,
+                sub_category=sub_category,
+                published_from=published_from,
+                published_to=published_to,
+                include_body=include_body
+            )
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Server error"
+        )
+
+@router.get(
+    '/search',
+    response_model=NewsSearchResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        400: {"model": ErrorResponse, "description": "Query too short"},
+        500: {"model": ErrorResponse, "description": "Internal server error"}
+    }
+)
+async def search_news(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (공백으로 구분된 단어가 모두 포함된 뉴스 검색)"),
+    company: Optional[str] = Query(None, description="신문사"),
+    page: int = Query(1, ge=1, description="페이지 번호"),
+    limit: int = Query(20, ge=1, le=50, description="페이지 크기"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    뉴스 검색 API
+    
+    뉴스 제목과 본문에서 검색어를 찾아 점수순으로 반환합니다.
+    각 단어는 2글자 이상이어야 하며, 결과에는 검색어가 강조된 제목과 본문 발췌가 포함됩니다.
+    
+    Returns:
+        NewsSearchResponse: 검색 결과와 다음 페이지 번호
+    """
+    try:
+        return await cached_response(
+            request,
+            settings.NEWS_LIST_CACHE_SECONDS,
+            lambda: news_service.search_news(db, q, page, limit, company=company)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Server error"
+        )
+
+@router.get(
+    '/stream',
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        200: {"description": "새 뉴스 이벤트 스트림", "content": {"text/event-stream": {}}},
+        400: {"model": ErrorResponse, "description": "Invalid Last-Event-ID"},
+        503: {"model": ErrorResponse, "description": "News stream unavailable"}
+    }
+)
+async def stream_news(
+    request: Request,
+    last_event_id: Optional[int] = Query(None, alias="lastEventId", description="마지막으로 받은 뉴스 ID (Last-Event-ID 헤더 대신 사용 가능)")
+):
+    """
+    실시간 뉴스 스트림 API (Server-Sent Events)
+    
+    새 뉴스가 수집되면 `event: news` 이벤트로 뉴스 목록 항목(NewsSummary)을 전송합니다.
+    이벤트 id는 news_id이며, 재연결 시 Last-Event-ID 헤더(또는 lastEventId)로 이후 뉴스부터 이어 받습니다.
+    놓친 뉴스가 너무 많으면 `event: reset` 을 보내며, 클라이언트는 목록 API로 다시 조회해야 합니다.
+    늦게 저장된 뉴스는 더 큰 id 뒤에 전달될 수 있고 재연결 시 같은 뉴스가 다시 올 수 있으므로 클라이언트는 id로 중복을 제거해야 합니다.
+    
+    Returns:
+        StreamingResponse: text/event-stream
+    """
+    header = request.headers.get("last-event-id")
+    if header:
+        try:
+            last_event_id = int(header)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid Last-Event-ID"
+            )
+    news_stream.news_broker.check_capacity()
+    return StreamingResponse(
+        news_stream.stream_events(last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get(
+    '/export',
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "내보낸 파일 (스트리밍)",
+            "content": {
+                "application/x-ndjson": {},
+                "text/csv": {},
+                "application/vnd.apache.parquet": {},
+            },
+        },
+        400: {"model": ErrorResponse, "description": "Invalid export range"},
+        401: {"model": ErrorResponse, "description": "Unauthorized"},
+        501: {"model": ErrorResponse, "description": "Parquet export unavailable"},
+        500: {"model": ErrorResponse, "description": "Internal server error"}
+    }
+)
+async def export_news(
+    published_from: datetime = Query(..., alias="publishedFrom", description="게시일 시작 (포함)"),
+    published_to: datetime = Query(..., alias="publishedTo", description="게시일 끝 (미포함)"),
+    format: Literal["ndjson", "csv", "parquet"] = Query("ndjson", description="내보낼 형식"),
+    company: Optional[str] = Query(None, description="신문사"),
+    category: Optional[str] = Query(None, description="카테고리"),
+    token: str = Depends(get_token_from_credentials),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    뉴스 대량 내보내기 API
+    
+    게시일 순으로 조건에 맞는 뉴스를 NDJSON, CSV(크롤러 CSV와 같은 헤더), Parquet 형식으로 내보냅니다.
+    서버 측 커서로 일정 행씩 읽어 바로 전송하므로 기간이 길어도 서버 메모리 사용량이 일정합니다.
+    
+    - **Authorization Header**: Bearer {access_token} 형식
+    - **publishedFrom / publishedTo**: 필수, 최대 EXPORT_MAX_RANGE_DAYS일
+    
+    Returns:
+        StreamingResponse: 첨부 파일 스트림
+    """
+    # 로그인한 활성 회원만 (토큰 버전까지 확인)
+    await user_service.get_user_info(db, token)
+    news_export.validate_export_range(published_from, published_to)
+    try:
+        encoder = news_export.create_encoder(format)
+    except RuntimeError:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Parquet export unavailable"
+        )
+    filename = news_export.export_filename(format, published_from, published_to)
+    return StreamingResponse(
+        news_export.export_news(
+            encoder,
+            company=company,
+            category=category,
+            published_from=published_from,
+            published_to=published_to
+        ),
+        media_type=encoder.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+@router.get(
+    '/{news_id}',
+    response_model=NewsDetail,
+    status_code=status.HTTP_200_OK,
+    responses={
+        404: {"model": ErrorResponse, "description": "News not found"},
+        500: {"model": ErrorResponse, "description": "Internal server error"}
+    }
+)
+async def read_news(
+    news_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    뉴스 상세 조회 API
+    
+    작성 후 바뀌지 않는 기사이므로 NEWS_DETAIL_CACHE_SECONDS 동안 캐시되며,
+    캐시된 기사는 DB를 조회하지 않고 반환됩니다.
+    
+    Returns:
+        NewsDetail: 본문을 포함한 뉴스 정보
+    """
+    try:
+        return await cached_response(
+            request,
+            settings.NEWS_DETAIL_CACHE_SECONDS,
+            lambda: news_service.get_news(db, news_id),
+            key=f"news:{news_id}"
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Server error"
+        )
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.core.db import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.db import get_async_db
+from app.core.replicas import get_read_db
 from app.schemas.user import (
     UserInfoResponse, UpdateUserRequest, 
     UpdateUserResponse, DeleteUserResponse,
@@ -22,7 +23,7 @@ router = APIRouter(prefix="/api/v1/user", tags=["user"])
 )
 async def read_user_info(
     token: str = Depends(get_token_from_credentials),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     내 정보 조회 API
@@ -35,7 +36,7 @@ async def read_user_info(
         UserInfoResponse: 사용자 정보 (id, email, name, image, phone)
     """
     try:
-        return user_service.get_user_info(db, token)
+        return await user_service.get_user_info(db, token)
     except HTTPException:
         raise
     except Exception as e:
@@ -56,7 +57,7 @@ async def read_user_info(
 async def update_user_info(
     update_data: UpdateUserRequest,
     token: str = Depends(get_token_from_credentials),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     내 정보 수정 API
@@ -71,7 +72,7 @@ async def update_user_info(
         UpdateUserResponse: 수정된 사용자 정보 (image, phone)
     """
     try:
-        return user_service.update_user_info(db, update_data, token)
+        return await user_service.update_user_info(db, update_data, token)
     except HTTPException:
         raise
     except Exception as e:
@@ -90,7 +91,7 @@ async def update_user_info(
 )
 async def delete_user_info(
     token: str = Depends(get_token_from_credentials),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     회원 탈퇴 API
@@ -104,7 +105,7 @@ async def delete_user_info(
         None: 204 No Content (응답 본문 없음)
     """
     try:
-        user_service.delete_user(db, token)
+        await user_service.delete_user(db, token)
         return None
     except HTTPException:
         raise
@@ -0,0 +1,53 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import List, Optional
+
+
+class NewsSummary(BaseModel):
+    """뉴스 목록 항목 스키마 (본문은 요청 시에만 포함)"""
+    id: int = Field(..., description="뉴스 고유 식별번호")
+    title: str = Field(..., description="뉴스 제목")
+    summary: Optional[str] = Field(None, description="뉴스 요약 내용")
+    category: str = Field(..., description="뉴스의 카테고리")
+    subCategory: str = Field(..., description="카테고리의 상세 카테고리")
+    published: datetime = Field(..., description="뉴스 게시 일시")
+    company: str = Field(..., description="신문사")
+    url: str = Field(..., description="뉴스 원문 URL")
+    issueId: Optional[int] = Field(None, description="연관된 이슈 번호")
+    body: Optional[str] = Field(None, description="뉴스 본문 내용 (includeBody=true 인 경우)")
+
+
+class NewsListResponse(BaseModel):
+    """뉴스 목록 응답 스키마"""
+    items: List[NewsSummary] = Field(..., description="뉴스 목록 (게시일 최신순)")
+    nextCursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+
+
+class NewsDetail(NewsSummary):
+    """뉴스 상세 응답 스키마"""
+    body: str = Field(..., description="뉴스 본문 내용")
+
+
+class NewsSearchItem(BaseModel):
+    """뉴스 검색 결과 항목 스키마"""
+    id: int = Field(..., description="뉴스 고유 식별번호")
+    title: str = Field(..., description="뉴스 제목")
+    titleHighlight: str = Field(..., description="검색어를 <em>으로 강조한 제목 (HTML 이스케이프됨)")
+    snippet: str = Field(..., description="검색어 주변 본문 발췌 (검색어 <em> 강조, HTML 이스케이프됨)")
+    category: str = Field(..., description="뉴스의 카테고리")
+    subCategory: str = Field(..., description="카테고리의 상세 카테고리")
+    published: datetime = Field(..., description="뉴스 게시 일시")
+    company: str = Field(..., description="신문사")
+    url: str = Field(..., description="뉴스 원문 URL")
+    score: float = Field(..., description="검색 점수")
+
+
+class NewsSearchResponse(BaseModel):
+    """뉴스 검색 응답 스키마"""
+    items: List[NewsSearchItem] = Field(..., description="검색 결과 (점수순)")
+    nextPage: Optional[int] = Field(None, description="다음 페이지 번호 (마지막 페이지면 null)")
+
+
+class ErrorResponse(BaseModel):
+    """에러 응답 스키마"""
+    error: str = Field(..., description="에러 메시지")
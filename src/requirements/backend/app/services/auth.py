@@ -1,6 +1,7 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from typing import Dict, Optional, List
+import asyncio
 import re
 from datetime import datetime
 from app.schemas.auth import (
@@ -11,9 +12,11 @@ from app.schemas.auth import (
     PasswordHistoryItem, FindIdRequest, FindIdResponse
 )
 from app.crud import auth as auth_crud
+from app.core.config import settings
+from app.core.db import AsyncSessionLocal
+from app.services.login_history_writer import login_history_writer
+from app.core.password_hasher import password_hasher
 from app.core.security import (
-    hash_password, 
-    verify_password, 
     create_access_token, 
     create_refresh_token,
     verify_access_token,
@@ -108,8 +111,8 @@ def parse_user_agent(user_agent: str) -> tuple[Optional[str], Optional[str]]:
     return device, browser_info
 
 
-def login_user(
-    db: Session, 
+async def login_user(
+    db: AsyncSession, 
     login_data: LoginRequest,
     client_ip: Optional[str] = None,
     user_agent: Optional[str] = None
@@ -142,45 +145,54 @@ def login_user(
         )
     
     # 3. 이메일로 회원 조회
-    member = auth_crud.get_member_by_email(db, login_data.email)
-    if not member:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Invalid authorize"
-        )
+    member = await auth_crud.get_member_by_email(db, login_data.email)
     
     # 4. 계정 상태 확인
-    if member.account_status != 'A':
+    # (없거나 비활성인 회원도 더미 해시를 검증하여 응답 시간으로 가입 여부를 알 수 없게 함)
+    if not member or member.account_status != 'A':
+        await password_hasher.verify_dummy(login_data.password)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Invalid authorize"
         )
     
-    # 5. 비밀번호 검증
-    hashed_password = hash_password(login_data.password)
-    if member.passwd != hashed_password:
+    # 5. 비밀번호 검증 (해시 전용 스레드 풀에서 실행)
+    matched, needs_rehash = await password_hasher.verify(login_data.password, member.passwd)
+    if not matched:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Invalid authorize"
         )
     
-    # 6. 토큰 생성 (token_version 포함)
+    # 기존 SHA-256 해시이거나 비용 설정이 바뀐 해시는 현재 방식으로 재해시하여 저장
+    if needs_rehash:
+        await auth_crud.update_password(db, member.member_id, await password_hasher.hash(login_data.password))
+    
+    # 6. 리프레시 토큰 생성 (token_version 포함)
     token_data = {
         "sub": str(member.member_id), 
         "email": member.email,
         "token_version": member.token_version or 1
     }
-    access_token = create_access_token(token_data)
     refresh_token = create_refresh_token(token_data)
     
-    # 7. 리프레시 토큰 DB 업데이트
-    updated_member = auth_crud.update_refresh_token(db, member.member_id, refresh_token)
-    
-    # 8. User-Agent에서 디바이스 및 브라우저 정보 추출
+    # 7. User-Agent에서 디바이스 및 브라우저 정보 추출
     access_device, browser_info = parse_user_agent(user_agent)
     
-    # 9. 로그인 기록 생성
-    auth_crud.create_login_history(
+    # 8. 리프레시 토큰 세션 저장 (기기별로 여러 세션 유지)
+    session = await auth_crud.update_refresh_token(db, member.member_id, refresh_token, access_device)
+    if session is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Invalid authorize"
+        )
+    updated_member, token_id = session
+    
+    # 액세스 토큰에 세션 ID를 넣어 로그아웃 시 이 기기의 세션만 삭제
+    access_token = create_access_token({**token_data, "sid": token_id})
+    
+    # 9. 로그인 기록 생성 (write-behind 큐에서 일괄 기록)
+    await login_history_writer.record_login(
         db=db,
         member_id=member.member_id,
         access_ip=client_ip,
@@ -200,7 +212,7 @@ def login_user(
     )
 
 
-def logout_user(db: Session, authorization: str) -> LogoutResponse:
+async def logout_user(db: AsyncSession, authorization: str) -> LogoutResponse:
     """
     사용자 로그아웃을 처리합니다.
     
@@ -237,7 +249,7 @@ def logout_user(db: Session, authorization: str) -> LogoutResponse:
         )
     
     # 4. 회원 존재 여부 확인
-    member = auth_crud.get_member_by_id(db, member_id)
+    member = await auth_crud.get_member_by_id(db, member_id)
     if not member:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -259,21 +271,25 @@ def logout_user(db: Session, authorization: str) -> LogoutResponse:
             detail="Invalid authorize"
         )
     
-    # 6. 토큰 무효화 (리프레시 토큰 삭제)
-    if not auth_crud.invalidate_tokens(db, member_id):
+    # 6. 이 기기의 세션(리프레시 토큰)만 삭제 (다른 기기의 로그인은 유지)
+    # 세션 ID가 없는 이전 형식의 토큰이면 모든 세션을 무효화
+    session_id = payload.get("sid")
+    if isinstance(session_id, int):
+        await auth_crud.revoke_refresh_session(db, member_id, session_id)
+    elif not await auth_crud.invalidate_tokens(db, member_id):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Server error"
         )
     
-    # 7. 로그아웃 일시 업데이트 (로그인 기록 테이블)
-    auth_crud.update_logout_date(db, member_id)
+    # 7. 로그아웃 일시 업데이트 (로그인 기록 테이블, write-behind 큐에서 일괄 기록)
+    await login_history_writer.record_logout(db, member_id)
     
     # 8. 성공 응답 반환
     return LogoutResponse(message="success")
 
 
-def signup_user(db: Session, signup_data: SignupRequest) -> SignupResponse:
+async def signup_user(db: AsyncSession, signup_data: SignupRequest) -> SignupResponse:
     """
     사용자 회원가입을 처리합니다.
     
@@ -295,7 +311,7 @@ def signup_user(db: Session, signup_data: SignupRequest) -> SignupResponse:
         )
     
     # 2. 이메일 중복 확인
-    if auth_crud.check_email_exists(db, signup_data.email):
+    if await auth_crud.check_email_exists(db, signup_data.email):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already exists"
@@ -323,14 +339,14 @@ def signup_user(db: Session, signup_data: SignupRequest) -> SignupResponse:
         )
     
     # 6. 비밀번호 해싱
-    hashed_password = hash_password(signup_data.password)
+    hashed_password = await password_hasher.hash(signup_data.password)
     
     # 7. 전화번호 정규화 (하이픈 제거)
     phone_normalized = re.sub(r'[-\s]', '', signup_data.phone)
     
     # 8. 회원 생성
     try:
-        new_member = auth_crud.create_member(
+        new_member = await auth_crud.create_member(
             db=db,
             email=signup_data.email,
             hashed_password=hashed_password,
@@ -348,7 +364,7 @@ def signup_user(db: Session, signup_data: SignupRequest) -> SignupResponse:
     return SignupResponse(message="success")
 
 
-def refresh_access_token(db: Session, authorization: str) -> RefreshTokenResponse:
+async def refresh_access_token(db: AsyncSession, authorization: str) -> RefreshTokenResponse:
     """
     리프레시 토큰을 이용하여 새로운 액세스 토큰을 발급합니다.
     
@@ -384,13 +400,14 @@ def refresh_access_token(db: Session, authorization: str) -> RefreshTokenRespons
             detail="Invalid authorize"
         )
     
-    # 4. 리프레시 토큰으로 회원 조회
-    member = auth_crud.get_member_by_refresh_token(db, refresh_token)
-    if not member:
+    # 4. 리프레시 토큰으로 회원과 세션 조회
+    session = await auth_crud.get_refresh_session(db, refresh_token)
+    if not session:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authorize"
         )
+    member, token_id = session
     
     # 5. 회원 ID 일치 확인
     if member.member_id != member_id:
@@ -406,22 +423,21 @@ def refresh_access_token(db: Session, authorization: str) -> RefreshTokenRespons
             detail="Invalid authorize"
         )
     
-    # 7. 토큰 버전 증가 (기존 액세스 토큰 무효화)
-    updated_member = auth_crud.increment_token_version(db, member.member_id)
-    
-    # 8. 새로운 액세스 토큰 생성 (새로운 token_version 포함)
+    # 7. 새로운 액세스 토큰 생성 (현재 token_version과 세션 ID 포함)
+    # token_version은 올리지 않음 - 올리면 다른 기기의 액세스 토큰까지 무효화됨
     token_data = {
         "sub": str(member.member_id), 
         "email": member.email,
-        "token_version": updated_member.token_version
+        "token_version": member.token_version,
+        "sid": token_id
     }
     new_access_token = create_access_token(token_data)
     
-    # 9. 성공 응답 반환
+    # 8. 성공 응답 반환
     return RefreshTokenResponse(accessToken=new_access_token)
 
 
-def reset_password_nologin(db: Session, reset_data: ResetPasswordNoLoginRequest) -> PasswordChangeResponse:
+async def reset_password_nologin(db: AsyncSession, reset_data: ResetPasswordNoLoginRequest) -> PasswordChangeResponse:
     """
     비로그인 상태에서 비밀번호를 변경합니다.
     
@@ -450,7 +466,7 @@ def reset_password_nologin(db: Session, reset_data: ResetPasswordNoLoginRequest)
         )
     
     # 3. 이메일로 회원 조회
-    member = auth_crud.get_member_by_email(db, reset_data.id)
+    member = await auth_crud.get_member_by_email(db, reset_data.id)
     if not member:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -465,21 +481,24 @@ def reset_password_nologin(db: Session, reset_data: ResetPasswordNoLoginRequest)
         )
     
     # 5. 비밀번호 해싱
-    hashed_password = hash_password(reset_data.password)
+    hashed_password = await password_hasher.hash(reset_data.password)
     
     # 6. 비밀번호 업데이트
-    if not auth_crud.update_password(db, member.member_id, hashed_password):
+    if not await auth_crud.update_password(db, member.member_id, hashed_password):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Server error"
         )
     
-    # 7. 성공 응답 반환
+    # 7. 모든 기기에서 로그아웃 (세션 삭제, 토큰 버전 증가)
+    await auth_crud.invalidate_tokens(db, member.member_id)
+    
+    # 8. 성공 응답 반환
     return PasswordChangeResponse(message="success")
 
 
-def reset_password_login(
-    db: Session, 
+async def reset_password_login(
+    db: AsyncSession, 
     reset_data: ResetPasswordLoginRequest,
     authorization: str
 ) -> List[PasswordHistoryItem]:
@@ -520,7 +539,7 @@ def reset_password_login(
         )
     
     # 4. 회원 존재 여부 확인
-    member = auth_crud.get_member_by_id(db, member_id)
+    member = await auth_crud.get_member_by_id(db, member_id)
     if not member:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -550,16 +569,19 @@ def reset_password_login(
         )
     
     # 8. 비밀번호 해싱
-    hashed_password = hash_password(reset_data.password)
+    hashed_password = await password_hasher.hash(reset_data.password)
     
     # 9. 비밀번호 업데이트
-    if not auth_crud.update_password(db, member.member_id, hashed_password):
+    if not await auth_crud.update_password(db, member.member_id, hashed_password):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Server error"
         )
     
-    # 10. 비밀번호 변경 이력 반환 (현재 변경 내역)
+    # 10. 모든 기기에서 로그아웃 (세션 삭제, 토큰 버전 증가 - 이 기기도 다시 로그인해야 함)
+    await auth_crud.invalidate_tokens(db, member.member_id)
+    
+    # 11. 비밀번호 변경 이력 반환 (현재 변경 내역)
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     history = [
         PasswordHistoryItem(
@@ -571,7 +593,7 @@ def reset_password_login(
     return history
 
 
-def find_user_id(db: Session, find_data: FindIdRequest) -> FindIdResponse:
+async def find_user_id(db: AsyncSession, find_data: FindIdRequest) -> FindIdResponse:
     """
     이메일로 아이디(이메일)를 찾습니다.
     
@@ -593,7 +615,7 @@ def find_user_id(db: Session, find_data: FindIdRequest) -> FindIdResponse:
         )
     
     # 2. 이메일로 회원 조회
-    member = auth_crud.get_member_by_email(db, find_data.email)
+    member = await auth_crud.get_member_by_email(db, find_data.email)
     if not member:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -609,3 +631,16 @@ def find_user_id(db: Session, find_data: FindIdRequest) -> FindIdResponse:
     
     # 4. 아이디(이메일) 반환
     return FindIdResponse(id=member.email)
+
+
+async def purge_expired_refresh_tokens_periodically():
+    """만료된 리프레시 토큰을 주기적으로 일괄 삭제합니다 (앱 시작 시 백그라운드 태스크로 실행)."""
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                purged = await auth_crud.purge_expired_refresh_tokens(db)
+            if purged:
+                print(f"만료된 리프레시 토큰 {purged}개 삭제")
+        except Exception as e:
+            print(f"리프레시 토큰 정리 중 오류: {e}")
+        await asyncio.sleep(settings.REFRESH_TOKEN_PURGE_INTERVAL_SECONDS)
@@ -0,0 +1,53 @@
+import asyncio
+from datetime import date
+from sqlalchemy import text
+from app.core.config import settings
+from app.core.db import engine
+from app.core.partitions import (
+    add_months, month_start, ensure_month_partitions, list_month_partitions,
+    list_detached_month_partitions, detach_partition, archive_detached_partition
+)
+
+# 여러 워커 중 한 곳에서만 파티션 관리를 실행하기 위한 advisory lock 키
+MAINTENANCE_LOCK_KEY = 726_510_002
+
+
+def maintain_login_history_partitions():
+    """
+    login_history 파티션을 관리합니다.
+    - 이번 달부터 LOGIN_HISTORY_PARTITION_MONTHS_AHEAD 개월 뒤까지 파티션을 미리 생성
+    - LOGIN_HISTORY_RETENTION_MONTHS 보다 오래된 파티션은 분리 후 압축 파일로 보관하고 삭제
+
+    긴 트랜잭션으로 login_history 잠금을 잡고 있지 않도록 AUTOCOMMIT 커넥션에서 문장마다 커밋하며,
+    동시 실행 방지는 세션 단위 advisory lock으로 합니다.
+    """
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        if not conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": MAINTENANCE_LOCK_KEY}).scalar():
+            return
+        try:
+            ensure_month_partitions(conn, "login_history", date.today(), settings.LOGIN_HISTORY_PARTITION_MONTHS_AHEAD)
+
+            if settings.LOGIN_HISTORY_RETENTION_MONTHS <= 0:
+                return
+            cutoff = add_months(month_start(date.today()), -settings.LOGIN_HISTORY_RETENTION_MONTHS)
+            for name, month in list_month_partitions(conn, "login_history"):
+                if month < cutoff:
+                    detach_partition(conn, "login_history", name)
+
+            # 이번에 분리한 파티션 + 이전 실행에서 분리 후 보관 전에 중단된 파티션
+            for name, month in list_detached_month_partitions(conn, "login_history"):
+                if month < cutoff:
+                    path = archive_detached_partition(conn, name, settings.LOGIN_HISTORY_ARCHIVE_DIR)
+                    print(f"로그인 기록 파티션 보관 완료: {name} -> {path}")
+        finally:
+            conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MAINTENANCE_LOCK_KEY})
+
+
+async def maintain_login_history_partitions_periodically():
+    """login_history 파티션 관리를 주기적으로 실행합니다 (앱 시작 시 백그라운드 태스크로 실행)."""
+    while True:
+        try:
+            await asyncio.to_thread(maintain_login_history_partitions)
+        except Exception as e:
+            print(f"로그인 기록 파티션 관리 중 오류: {e}")
+        await asyncio.sleep(settings.LOGIN_HISTORY_MAINTENANCE_INTERVAL_SECONDS)
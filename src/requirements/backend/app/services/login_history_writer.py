@@ -0,0 +1,252 @@
+import asyncio
+import json
+import os
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+from sqlalchemy import insert, update, select, func, bindparam
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.db import AsyncSessionLocal
+from app.models.login_history import LoginHistory
+from app.crud import auth as auth_crud
+
+
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+
+class LoginHistoryWriter:
+    """
+    로그인/로그아웃 기록 write-behind 큐
+
+    요청 처리 중에는 이벤트를 프로세스 내 bounded 큐에 넣기만 하고,
+    백그라운드 writer가 모아서 login_history에 여러 행 단위로 기록합니다.
+
+    - 큐가 가득 차면 해당 요청의 세션으로 바로 기록합니다 (이벤트 유실 없음).
+      단, 같은 회원의 로그인이 아직 큐에 있으면 로그아웃은 그 뒤에 기록되도록 큐에 자리가 날 때까지 기다립니다.
+    - 모든 일시는 이벤트 발생 시 앱 시각으로 기록합니다 (큐를 거치지 않는 경우도 같은 시계 사용).
+    - 기록에 실패한 배치와 종료 시점에 남은 이벤트는 spill 파일(JSON Lines)에 저장하고
+      다음 시작 시 다시 큐에 넣습니다.
+    """
+
+    def __init__(self):
+        self.queue: Optional[asyncio.Queue] = None
+        self.task: Optional[asyncio.Task] = None
+        self.pending: List[Dict] = []
+        self.spill_path = settings.LOGIN_HISTORY_SPILL_PATH
+        self._queued_logins: Dict[int, int] = {}  # 회원별 아직 기록하지 않은 로그인 이벤트 수
+
+    async def start(self):
+        self.queue = asyncio.Queue(maxsize=settings.LOGIN_HISTORY_QUEUE_SIZE)
+        self._replay_spill()
+        self.task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """남은 이벤트를 기록하고 writer를 종료합니다. 기록하지 못한 이벤트는 spill 파일에 저장합니다."""
+        if self.task is None:
+            return
+        self.task.cancel()
+        await asyncio.gather(self.task, return_exceptions=True)
+        self.task = None
+
+        remaining = self.pending + self._drain(self.queue.qsize())
+        self.pending = []
+        self._queued_logins.clear()
+        if remaining:
+            try:
+                await self._flush(remaining)
+            except Exception as e:
+                print(f"로그인 기록 종료 시 저장 실패, spill 파일에 보관: {e}")
+                self._spill(remaining)
+
+    async def record_login(
+        self,
+        db: AsyncSession,
+        member_id: int,
+        access_ip: Optional[str] = None,
+        access_device: Optional[str] = None,
+        browser_info: Optional[str] = None
+    ):
+        """로그인 기록 이벤트를 큐에 넣습니다."""
+        at = datetime.now()
+        event = {
+            "type": "login",
+            "member_id": member_id,
+            "at": at.strftime(DATETIME_FORMAT),
+            "access_ip": access_ip,
+            "access_device": access_device,
+            "browser_info": browser_info,
+        }
+        if self._enqueue(event):
+            self._queued_logins[member_id] = self._queued_logins.get(member_id, 0) + 1
+        else:
+            await auth_crud.create_login_history(db, member_id, access_ip, access_device, browser_info, login_date=at)
+
+    async def record_logout(self, db: AsyncSession, member_id: int):
+        """로그아웃 기록 이벤트를 큐에 넣습니다."""
+        at = datetime.now()
+        event = {
+            "type": "logout",
+            "member_id": member_id,
+            "at": at.strftime(DATETIME_FORMAT),
+        }
+        if self._enqueue(event):
+            return
+        if self.task is not None and self._queued_logins.get(member_id):
+            # 바로 기록하면 큐에 있는 로그인보다 먼저 실행되어 이전 세션의 기록을 갱신하므로 순서를 지킴
+            await self.queue.put(event)
+            return
+        await auth_crud.update_logout_date(db, member_id, logout_date=at)
+
+    def _enqueue(self, event: Dict) -> bool:
+        if self.queue is None or self.task is None:
+            return False
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def _release(self, events: List[Dict]):
+        """기록(또는 spill)을 마친 로그인 이벤트를 회원별 대기 수에서 뺍니다."""
+        for event in events:
+            if event["type"] != "login":
+                continue
+            member_id = event["member_id"]
+            count = self._queued_logins.get(member_id, 0) - 1
+            if count > 0:
+                self._queued_logins[member_id] = count
+            else:
+                self._queued_logins.pop(member_id, None)
+
+    def _drain(self, limit: int) -> List[Dict]:
+        events = []
+        while len(events) < limit:
+            try:
+                events.append(self.queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return events
+
+    async def _run(self):
+        while True:
+            batch = []
+            try:
+                # 첫 이벤트를 기다린 뒤 flush 주기 동안 배치 크기만큼 모음
+                batch.append(await self.queue.get())
+                deadline = time.monotonic() + settings.LOGIN_HISTORY_FLUSH_INTERVAL
+                while len(batch) < settings.LOGIN_HISTORY_BATCH_SIZE:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                await self._flush(batch)
+                self._release(batch)
+            except asyncio.CancelledError:
+                # 종료 중 - 모아 둔 배치는 stop()에서 남은 큐와 함께 기록
+                self.pending = batch
+                raise
+            except Exception as e:
+                print(f"로그인 기록 {len(batch)}건 저장 실패, spill 파일에 보관: {e}")
+                self._spill(batch)
+                self._release(batch)
+
+    async def _flush(self, events: List[Dict]):
+        """
+        이벤트를 순서대로 기록합니다.
+        같은 종류가 연속된 구간마다 로그인은 다중 행 INSERT, 로그아웃은 executemany UPDATE 한 번으로 처리합니다.
+        """
+        table = LoginHistory.__table__
+        async with AsyncSessionLocal() as db:
+            start = 0
+            while start < len(events):
+                end = start
+                while end < len(events) and events[end]["type"] == events[start]["type"]:
+                    end += 1
+                run = events[start:end]
+                if run[0]["type"] == "login":
+                    await db.execute(insert(table), [
+                        {
+                            "member_id": e["member_id"],
+                            "login_date": datetime.strptime(e["at"], DATETIME_FORMAT),
+                            "access_ip": e["access_ip"],
+                            "access_device": e["access_device"],
+                            "browser_info": e["browser_info"],
+                        }
+                        for e in run
+                    ])
+                else:
+                    # 회원별 가장 최근의 로그아웃 일시가 없는 로그인 기록을 갱신
+                    latest_open = (
+                        select(func.max(table.c.history_id))
+                        .where(
+                            table.c.member_id == bindparam("b_member_id"),
+                            table.c.logout_date.is_(None),
+                            table.c.login_date >= auth_crud.open_session_since()  # 최근 파티션만 조회
+                        )
+                        .scalar_subquery()
+                    )
+                    await db.execute(
+                        update(table)
+                        .where(
+                            table.c.history_id == latest_open,
+                            table.c.login_date >= auth_crud.open_session_since()
+                        )
+                        .values(logout_date=bindparam("b_logout_date")),
+                        [
+                            {"b_member_id": e["member_id"], "b_logout_date": datetime.strptime(e["at"], DATETIME_FORMAT)}
+                            for e in run
+                        ]
+                    )
+                start = end
+            await db.commit()
+
+    def _spill(self, events: List[Dict]):
+        """기록하지 못한 이벤트를 spill 파일 끝에 추가합니다."""
+        if not events:
+            return
+        try:
+            with open(self.spill_path, "a", encoding="utf-8") as f:
+                for event in events:
+                    f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            print(f"로그인 기록 spill 파일 저장 실패 ({len(events)}건 유실): {e}")
+
+    def _replay_spill(self):
+        """이전 실행에서 남긴 spill 파일을 읽어 큐에 다시 넣습니다."""
+        if not os.path.exists(self.spill_path):
+            return
+        # 여러 워커가 동시에 시작해도 한 워커만 가져가도록 파일 이름을 먼저 바꿈
+        claimed = f"{self.spill_path}.{os.getpid()}"
+        try:
+            os.replace(self.spill_path, claimed)
+        except OSError:
+            return
+
+        events = []
+        with open(claimed, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    events.append(json.loads(line))
+
+        overflow = []
+        for event in events:
+            try:
+                self.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                overflow.append(event)
+                continue
+            if event["type"] == "login":
+                self._queued_logins[event["member_id"]] = self._queued_logins.get(event["member_id"], 0) + 1
+        os.remove(claimed)
+        self._spill(overflow)
+        print(f"spill 파일에서 로그인 기록 {len(events) - len(overflow)}건 복구")
+
+
+login_history_writer = LoginHistoryWriter()
@@ -0,0 +1,223 @@
+import base64
+import binascii
+import html
+import re
+from datetime import datetime
+from typing import List, Optional, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas.news import NewsSummary, NewsListResponse, NewsDetail, NewsSearchItem, NewsSearchResponse
+from app.crud import news as news_crud
+from app.core.config import settings
+
+
+# 검색 인덱스와 같은 규칙의 바이그램 (소문자 한글/영문/숫자 2글자)
+BIGRAM_PATTERN = re.compile(r'^[0-9a-z가-힣]{2}$')
+
+# 본문 발췌 길이 (검색어 앞뒤 글자 수)
+SNIPPET_CONTEXT = 60
+
+
+def encode_cursor(published: datetime, news_id: int) -> str:
+    """페이지 마지막 항목의 (게시일, ID)를 불투명 커서 문자열로 변환합니다."""
+    raw = f"{published.isoformat()}|{news_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    커서 문자열을 (게시일, ID)로 변환합니다.
+    
+    Raises:
+        HTTPException: 커서 형식이 올바르지 않을 경우
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        published, news_id = raw.split("|")
+        return datetime.fromisoformat(published), int(news_id)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def to_summary(row, include_body: bool = False) -> NewsSummary:
+    return NewsSummary(
+        id=row.news_id,
+        title=row.news_title,
+        summary=row.summary,
+        category=row.category,
+        subCategory=row.sub_category,
+        published=row.published,
+        company=row.company,
+        url=row.news_url,
+        issueId=row.issue_id,
+        body=row.body if include_body else None
+    )
+
+
+async def list_news(
+    db: AsyncSession,
+    limit: int,
+    cursor: Optional[str] = None,
+    company: Optional[str] = None,
+    category: Optional[str] = None,
+    sub_category: Optional[str] = None,
+    published_from: Optional[datetime] = None,
+    published_to: Optional[datetime] = None,
+    include_body: bool = False
+) -> NewsListResponse:
+    """
+    뉴스 목록을 조회합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        limit: 페이지 크기
+        cursor: 이전 응답의 nextCursor (첫 페이지는 None)
+        company, category, sub_category: 필터 (선택)
+        published_from, published_to: 게시일 범위 (선택)
+        include_body: 본문 포함 여부
+        
+    Returns:
+        NewsListResponse: 뉴스 목록과 다음 페이지 커서
+    """
+    after = decode_cursor(cursor) if cursor else None
+
+    # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+    rows = await news_crud.list_news(
+        db,
+        limit + 1,
+        company=company,
+        category=category,
+        sub_category=sub_category,
+        published_from=published_from,
+        published_to=published_to,
+        after=after,
+        include_body=include_body
+    )
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].published, rows[-1].news_id)
+
+    return NewsListResponse(
+        items=[to_summary(row, include_body) for row in rows],
+        nextCursor=next_cursor
+    )
+
+
+async def get_news(db: AsyncSession, news_id: int) -> NewsDetail:
+    """
+    뉴스 상세 정보를 조회합니다.
+    
+    Raises:
+        HTTPException: 뉴스가 없을 경우
+    """
+    news = await news_crud.get_news_by_id(db, news_id)
+    if not news:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="News not found"
+        )
+    return NewsDetail(**to_summary(news, include_body=True).model_dump())
+
+
+def to_bigrams(term: str) -> List[str]:
+    """검색어를 검색 인덱스(news_bigrams)와 같은 규칙의 바이그램 목록으로 변환합니다."""
+    grams = {term[i:i + 2] for i in range(len(term) - 1)}
+    return sorted(gram for gram in grams if BIGRAM_PATTERN.match(gram))
+
+
+def highlight(value: str, terms: List[str]) -> str:
+    """HTML 이스케이프 후 검색어를 <em> 태그로 강조합니다."""
+    pattern = re.compile("|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True)), re.IGNORECASE)
+    parts = []
+    last = 0
+    for match in pattern.finditer(value):
+        parts.append(html.escape(value[last:match.start()]))
+        parts.append(f"<em>{html.escape(match.group())}</em>")
+        last = match.end()
+    parts.append(html.escape(value[last:]))
+    return "".join(parts)
+
+
+def make_snippet(body: str, terms: List[str]) -> str:
+    """본문에서 처음 나오는 검색어 주변을 발췌하여 강조합니다."""
+    lowered = body.lower()
+    positions = [pos for pos in (lowered.find(term) for term in terms) if pos >= 0]
+    first = min(positions) if positions else 0
+    start = max(first - SNIPPET_CONTEXT, 0)
+    end = min(first + SNIPPET_CONTEXT * 2, len(body))
+    snippet = highlight(body[start:end], terms)
+    return ("…" if start > 0 else "") + snippet + ("…" if end < len(body) else "")
+
+
+async def search_news(
+    db: AsyncSession,
+    query: str,
+    page: int,
+    limit: int,
+    company: Optional[str] = None
+) -> NewsSearchResponse:
+    """
+    뉴스 제목/본문을 검색합니다.
+    공백으로 구분된 검색어가 모두 포함된 뉴스를 점수순으로 반환합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        query: 검색어
+        page: 페이지 번호 (1부터)
+        limit: 페이지 크기
+        company: 신문사 필터 (선택)
+        
+    Returns:
+        NewsSearchResponse: 검색 결과와 다음 페이지 번호
+        
+    Raises:
+        HTTPException: 검색어가 너무 짧을 경우 (2글자 이상 단어가 없음)
+    """
+    terms = list(dict.fromkeys(term for term in query.lower().split() if term))
+    grams = sorted({gram for term in terms for gram in to_bigrams(term)})
+    if not grams:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Query too short"
+        )
+
+    # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+    rows = await news_crud.search_news(
+        db,
+        terms,
+        grams,
+        limit + 1,
+        (page - 1) * limit,
+        settings.SEARCH_MAX_CANDIDATES,
+        settings.SEARCH_MAX_SCAN,
+        company=company
+    )
+
+    next_page = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_page = page + 1
+
+    return NewsSearchResponse(
+        items=[
+            NewsSearchItem(
+                id=row.news_id,
+                title=row.news_title,
+                titleHighlight=highlight(row.news_title, terms),
+                snippet=make_snippet(row.body, terms),
+                category=row.category,
+                subCategory=row.sub_category,
+                published=row.published,
+                company=row.company,
+                url=row.news_url,
+                score=float(row.score)
+            )
+            for row in rows
+        ],
+        nextPage=next_page
+    )
@@ -0,0 +1,282 @@
+"""
+뉴스 대량 내보내기 (NDJSON / CSV / Parquet)
+
+서버 측 커서로 EXPORT_BATCH_SIZE 행씩 읽어 바로 인코딩하여 내보내므로
+기간이 길어도 메모리 사용량이 일정합니다.
+
+사용법 (backend 디렉터리에서):
+    python -m app.services.news_export --format csv --from 2025-01-01 --to 2026-01-01 -o news_2025.csv
+"""
+import argparse
+import asyncio
+import csv
+import io
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Dict, List, Optional
+import orjson
+from fastapi import HTTPException, status
+from sqlalchemy import text
+from app.core.config import settings
+from app.core.db import async_engine
+from app.core.replicas import replica_router
+from app.crud import news as news_crud
+
+
+# NewsCrawler.to_csv_sync 와 같은 CSV 헤더
+CSV_HEADER = ['제목', '본문', '카테고리', '하위카테고리', '게시일자', '신문사', '기사링크']
+
+
+class NdjsonEncoder:
+    """한 줄에 기사 하나씩 JSON (뉴스 API 응답과 같은 필드명)"""
+
+    media_type = "application/x-ndjson"
+    extension = "ndjson"
+
+    def header(self) -> bytes:
+        return b""
+
+    def encode(self, rows: List) -> bytes:
+        return b"".join(
+            orjson.dumps({
+                "id": row.news_id,
+                "title": row.news_title,
+                "summary": row.summary,
+                "category": row.category,
+                "subCategory": row.sub_category,
+                "published": row.published,
+                "company": row.company,
+                "url": row.news_url,
+                "issueId": row.issue_id,
+                "body": row.body,
+            }) + b"\n"
+            for row in rows
+        )
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class CsvEncoder:
+    """NewsCrawler.to_csv_sync 와 같은 헤더/열 순서의 CSV (UTF-8 BOM 포함, 엑셀 호환)"""
+
+    media_type = "text/csv; charset=utf-8"
+    extension = "csv"
+
+    def header(self) -> bytes:
+        return self._rows_to_bytes([CSV_HEADER], bom=True)
+
+    def encode(self, rows: List) -> bytes:
+        return self._rows_to_bytes([
+            [
+                row.news_title,
+                row.body,
+                row.category,
+                row.sub_category,
+                row.published.strftime("%Y-%m-%d %H:%M:%S"),
+                row.company,
+                row.news_url,
+            ]
+            for row in rows
+        ])
+
+    def finish(self) -> bytes:
+        return b""
+
+    @staticmethod
+    def _rows_to_bytes(rows: List[List], bom: bool = False) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue().encode("utf-8-sig" if bom else "utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """ParquetWriter가 쓴 바이트를 모아 두었다가 꺼내 가는 쓰기 전용 파일 객체"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ParquetEncoder:
+    """
+    열 지향 Parquet (배치마다 row group 하나)
+    pyarrow 패키지는 이 형식을 사용할 때만 필요합니다.
+    """
+
+    media_type = "application/vnd.apache.parquet"
+    extension = "parquet"
+
+    def __init__(self):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError("Parquet 내보내기를 사용하려면 pyarrow 패키지를 설치해야 합니다") from e
+        self._pa = pa
+        self._schema = pa.schema([
+            ("id", pa.int64()),
+            ("title", pa.string()),
+            ("summary", pa.string()),
+            ("category", pa.string()),
+            ("subCategory", pa.string()),
+            ("published", pa.timestamp("us")),
+            ("company", pa.string()),
+            ("url", pa.string()),
+            ("issueId", pa.int64()),
+            ("body", pa.string()),
+        ])
+        self._sink = _ChunkSink()
+        self._writer = pq.ParquetWriter(self._sink, self._schema, compression="zstd")
+
+    def header(self) -> bytes:
+        return self._sink.drain()
+
+    def encode(self, rows: List) -> bytes:
+        columns = list(zip(*(
+            (
+                row.news_id, row.news_title, row.summary, row.category, row.sub_category,
+                row.published, row.company, row.news_url, row.issue_id, row.body,
+            )
+            for row in rows
+        )))
+        table = self._pa.Table.from_arrays(
+            [self._pa.array(values, type=field.type) for values, field in zip(columns, self._schema)],
+            schema=self._schema
+        )
+        self._writer.write_table(table)
+        return self._sink.drain()
+
+    def finish(self) -> bytes:
+        self._writer.close()  # 파일 끝의 메타데이터(footer) 기록
+        return self._sink.drain()
+
+
+ENCODERS = {
+    "ndjson": NdjsonEncoder,
+    "csv": CsvEncoder,
+    "parquet": ParquetEncoder,
+}
+
+
+def create_encoder(export_format: str):
+    """형식 이름으로 인코더를 생성합니다 (Parquet은 pyarrow가 없으면 RuntimeError)."""
+    return ENCODERS[export_format]()
+
+
+def validate_export_range(published_from: datetime, published_to: datetime):
+    """
+    API 내보내기 기간을 검증합니다 (한 요청이 테이블 전체를 읽지 않도록 EXPORT_MAX_RANGE_DAYS로 제한).
+
+    Raises:
+        HTTPException: 기간이 비어 있거나 최대 기간을 넘을 경우
+    """
+    if published_to <= published_from:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid export range"
+        )
+    if published_to - published_from > timedelta(days=settings.EXPORT_MAX_RANGE_DAYS):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Export range exceeds {settings.EXPORT_MAX_RANGE_DAYS} days"
+        )
+
+
+def export_filename(export_format: str, published_from: Optional[datetime], published_to: Optional[datetime]) -> str:
+    start = published_from.strftime("%Y%m%d") if published_from else "start"
+    end = published_to.strftime("%Y%m%d") if published_to else "now"
+    return f"news_{start}_{end}.{ENCODERS[export_format].extension}"
+
+
+async def export_news(
+    encoder,
+    company: Optional[str] = None,
+    category: Optional[str] = None,
+    published_from: Optional[datetime] = None,
+    published_to: Optional[datetime] = None
+) -> AsyncIterator[bytes]:
+    """
+    조건에 맞는 뉴스를 인코딩된 바이트 조각으로 순서대로 반환합니다.
+
+    응답 스트리밍 중에도 세션을 유지해야 하므로 요청 의존성 대신 직접 세션을 엽니다 (복제본 우선).
+    """
+    sessionmaker = await replica_router.sessionmaker_for(None)
+    async with sessionmaker() as db:
+        # 오래 걸리는 내보내기는 일반 요청의 statement_timeout 대신 별도 제한 적용
+        await db.execute(text(f"SET LOCAL statement_timeout = {int(settings.EXPORT_STATEMENT_TIMEOUT_MS)}"))
+
+        chunk = encoder.header()
+        if chunk:
+            yield chunk
+        async for rows in news_crud.stream_news_for_export(
+            db,
+            batch_size=settings.EXPORT_BATCH_SIZE,
+            company=company,
+            category=category,
+            published_from=published_from,
+            published_to=published_to
+        ):
+            # 인코딩(특히 Parquet의 zstd row group 생성)은 CPU 작업이므로 스레드에서 실행하여
+            # 내보내기 중에도 같은 워커의 다른 요청이 멈추지 않게 함
+            chunk = await asyncio.to_thread(encoder.encode, rows)
+            if chunk:
+                yield chunk
+        chunk = await asyncio.to_thread(encoder.finish)
+        if chunk:
+            yield chunk
+
+
+async def _export_to_file(args) -> Dict:
+    encoder = create_encoder(args.format)
+    written = 0
+    try:
+        with open(args.output, "wb") as f:
+            async for chunk in export_news(
+                encoder,
+                company=args.company,
+                category=args.category,
+                published_from=args.published_from,
+                published_to=args.published_to
+            ):
+                f.write(chunk)
+                written += len(chunk)
+    finally:
+        await replica_router.dispose()
+        await async_engine.dispose()
+    return {"bytes": written}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="뉴스 대량 내보내기")
+    parser.add_argument("--format", choices=list(ENCODERS), default="ndjson", help="내보낼 형식")
+    parser.add_argument("--from", dest="published_from", type=datetime.fromisoformat, help="게시일 시작 (포함, 예: 2025-01-01)")
+    parser.add_argument("--to", dest="published_to", type=datetime.fromisoformat, help="게시일 끝 (미포함)")
+    parser.add_argument("--company", help="신문사")
+    parser.add_argument("--category", help="카테고리")
+    parser.add_argument("-o", "--output", help="출력 파일 (기본값: news_<from>_<to>.<확장자>)")
+    args = parser.parse_args()
+    args.output = args.output or export_filename(args.format, args.published_from, args.published_to)
+
+    result = asyncio.run(_export_to_file(args))
+    print(f"✅ {args.output} 작성 완료 ({result['bytes']:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+import asyncio
+import itertools
+from collections import deque
+from typing import AsyncIterator, Deque, List, Optional, Set
+from fastapi import HTTPException, status
+from sqlalchemy.engine import make_url
+from app.core.config import settings
+from app.core.db import AsyncSessionLocal, SQLALCHEMY_DATABASE_URL
+from app.crud import news as news_crud
+from app.services.news import to_summary
+
+
+# news INSERT 트리거(마이그레이션 0008)가 알림을 보내는 채널
+NOTIFY_CHANNEL = "news_inserted"
+
+# 새 뉴스를 한 번에 조회하는 최대 건수
+FETCH_BATCH_SIZE = 500
+
+
+class NewsEvent:
+    """구독자에게 보내는 새 뉴스 이벤트 (JSON은 한 번만 직렬화하여 모든 구독자가 공유)"""
+
+    __slots__ = ("news_id", "data")
+
+    def __init__(self, news_id: int, data: bytes):
+        self.news_id = news_id
+        self.data = data
+
+    def to_sse(self) -> bytes:
+        return b"id: %d\nevent: news\ndata: %s\n\n" % (self.news_id, self.data)
+
+
+class Subscription:
+    """구독자별 제한된 크기의 버퍼 (가득 차면 overflowed 표시 후 구독 해제)"""
+
+    __slots__ = ("queue", "overflowed")
+
+    def __init__(self, buffer_size: int):
+        self.queue: "asyncio.Queue[NewsEvent]" = asyncio.Queue(maxsize=buffer_size)
+        self.overflowed = False
+
+
+class NewsBroker:
+    """
+    새 뉴스 알림을 워커 내 구독자들에게 전달합니다.
+
+    - 워커당 PostgreSQL 연결 하나로 LISTEN 하고, 알림이 오면 새 뉴스를 한 번만 조회하여 모든 구독자에게 전달합니다.
+      알림을 놓쳐도 poll_seconds 마다 새 뉴스를 확인합니다.
+    - 최근 이벤트는 replay_size 개까지 보관하여 재연결한 클라이언트가 Last-Event-ID 이후부터 이어 받을 수 있습니다.
+    - 구독자 버퍼가 가득 차면(느린 클라이언트) 그 구독자만 끊고, 클라이언트는 재연결하여 이어 받습니다.
+    - news_id는 INSERT 시점에 정해지지만 커밋 순서는 다를 수 있으므로, 매번 high_water 아래 rescan_ids 범위를
+      다시 확인하여 늦게 커밋된 뉴스도 전달합니다 (이미 전달한 ID는 건너뜀).
+    """
+
+    def __init__(self, buffer_size: int, replay_size: int, max_subscribers: int, poll_seconds: int, resume_max: int,
+                 rescan_ids: int):
+        self.buffer_size = buffer_size
+        self.max_subscribers = max_subscribers
+        self.poll_seconds = poll_seconds
+        self.resume_max = resume_max
+        self.rescan_ids = rescan_ids
+        self.high_water = 0  # 지금까지 전달한 가장 큰 news_id
+        self.started = False
+        self._recent: Deque[NewsEvent] = deque(maxlen=replay_size)  # 전달 순서
+        self._late: Deque[NewsEvent] = deque(maxlen=replay_size)  # high_water보다 작은 ID로 늦게 전달된 이벤트
+        self._delivered: Set[int] = set()  # 다시 확인하는 범위 안에서 이미 전달한 news_id
+        self._subscribers: Set[Subscription] = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self):
+        # 이벤트 루프가 실행 중일 때 생성 (Python 3.9의 asyncio.Event는 생성 시점의 루프에 묶임)
+        self._wakeup = asyncio.Event()
+        async with AsyncSessionLocal() as db:
+            self.high_water = await news_crud.get_max_news_id(db)
+            # 시작 전에 이미 있던 뉴스는 전달하지 않음
+            self._delivered = set(await news_crud.list_news_ids_after(db, self._rescan_floor(), self.rescan_ids))
+        self._tasks = [
+            asyncio.create_task(self._listen()),
+            asyncio.create_task(self._fetch_loop()),
+        ]
+        self.started = True
+
+    async def stop(self):
+        self.started = False
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def check_capacity(self):
+        """새 구독을 받을 수 있는지 확인합니다."""
+        if not self.started:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="News stream unavailable"
+            )
+        if len(self._subscribers) >= self.max_subscribers:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many subscribers",
+                headers={"Retry-After": "5"}
+            )
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(self.buffer_size)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self._subscribers.discard(subscription)
+
+    async def replay(self, last_id: int) -> Optional[List[NewsEvent]]:
+        """
+        last_id 이후에 전달된 이벤트를 반환합니다.
+
+        보관 중인 최근 이벤트에 last_id가 있으면 그 뒤에 전달된 이벤트를 전달 순서 그대로 반환하고,
+        없으면 DB에서 last_id보다 큰 뉴스와 last_id 이하로 늦게 전달된 뉴스를 조회합니다
+        (이 경우 이미 받은 뉴스가 일부 다시 전달될 수 있음).
+        놓친 뉴스가 resume_max 건을 넘으면 None을 반환합니다 (클라이언트는 목록 API로 다시 조회).
+        """
+        for position, event in enumerate(self._recent):
+            if event.news_id == last_id:
+                return list(itertools.islice(self._recent, position + 1, None))
+        if last_id >= self.high_water:
+            return []
+
+        late = [event for event in self._late if last_id - self.rescan_ids < event.news_id <= last_id]
+        async with AsyncSessionLocal() as db:
+            rows = await news_crud.list_news_after_id(db, last_id, self.resume_max + 1)
+        # 아직 전달하지 않은 뉴스는 실시간으로 전달되므로 제외
+        rows = [row for row in rows if self._is_delivered(row.news_id)]
+        if len(late) + len(rows) > self.resume_max:
+            return None
+        return late + [self._to_event(row) for row in rows]
+
+    def _rescan_floor(self) -> int:
+        return max(self.high_water - self.rescan_ids, 0)
+
+    def _is_delivered(self, news_id: int) -> bool:
+        return news_id <= self._rescan_floor() or news_id in self._delivered
+
+    @staticmethod
+    def _to_event(row) -> NewsEvent:
+        return NewsEvent(row.news_id, to_summary(row).model_dump_json().encode())
+
+    def _publish(self, event: NewsEvent):
+        self._recent.append(event)
+        for subscription in list(self._subscribers):
+            try:
+                subscription.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                subscription.overflowed = True
+                self._subscribers.discard(subscription)
+
+    async def _fetch_new(self):
+        async with AsyncSessionLocal() as db:
+            after = self._rescan_floor()
+            while True:
+                ids = await news_crud.list_news_ids_after(db, after, FETCH_BATCH_SIZE)
+                new_ids = [news_id for news_id in ids if news_id not in self._delivered]
+                if new_ids:
+                    for row in await news_crud.list_news_by_ids(db, new_ids):
+                        event = self._to_event(row)
+                        if row.news_id < self.high_water:
+                            # 더 큰 ID보다 늦게 커밋된 뉴스 (DB 재전송 시 함께 확인)
+                            self._late.append(event)
+                        self._delivered.add(row.news_id)
+                        self.high_water = max(self.high_water, row.news_id)
+                        self._publish(event)
+                if len(ids) < FETCH_BATCH_SIZE:
+                    break
+                after = ids[-1]
+
+        floor = self._rescan_floor()
+        self._delivered = {news_id for news_id in self._delivered if news_id > floor}
+
+    async def _fetch_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self._fetch_new()
+            except Exception as e:
+                print(f"새 뉴스 조회 중 오류: {e}")
+
+    def _on_notify(self, connection, pid, channel, payload):
+        try:
+            # 알림 페이로드는 INSERT 문장에서 추가된 최대 news_id (이미 전달했으면 조회 불필요)
+            if int(payload) in self._delivered:
+                return
+        except (TypeError, ValueError):
+            pass
+        self._wakeup.set()
+
+    async def _listen(self):
+        """LISTEN 전용 연결을 유지합니다 (끊기면 지수 백오프로 재연결)."""
+        import asyncpg
+
+        url = make_url(SQLALCHEMY_DATABASE_URL).set(drivername="postgresql").render_as_string(hide_password=False)
+        backoff = 1
+        while True:
+            conn = None
+            try:
+                conn = await asyncpg.connect(url)
+                await conn.add_listener(NOTIFY_CHANNEL, self._on_notify)
+                backoff = 1
+                # 연결이 끊겨 있던 동안 추가된 뉴스 확인
+                self._wakeup.set()
+                while True:
+                    await asyncio.sleep(self.poll_seconds)
+                    await conn.execute("SELECT 1")  # 연결 상태 확인
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"뉴스 알림 수신 연결 오류 ({backoff}초 후 재연결): {e}")
+            finally:
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 60)
+
+
+news_broker = NewsBroker(
+    buffer_size=settings.NEWS_STREAM_CLIENT_BUFFER,
+    replay_size=settings.NEWS_STREAM_REPLAY_SIZE,
+    max_subscribers=settings.NEWS_STREAM_MAX_SUBSCRIBERS,
+    poll_seconds=settings.NEWS_STREAM_POLL_SECONDS,
+    resume_max=settings.NEWS_STREAM_RESUME_MAX,
+    rescan_ids=settings.NEWS_STREAM_RESCAN_IDS
+)
+
+
+async def stream_events(last_event_id: Optional[int]) -> AsyncIterator[bytes]:
+    """
+    SSE 응답 본문을 만듭니다.
+
+    last_event_id가 있으면 그 이후 뉴스를 먼저 보내고 실시간 뉴스를 이어서 보냅니다.
+    전달할 뉴스가 없으면 NEWS_STREAM_HEARTBEAT_SECONDS 마다 keep-alive 주석을 보냅니다.
+    """
+    # 재전송 중 추가되는 뉴스를 놓치지 않도록 먼저 구독
+    subscription = news_broker.subscribe()
+    try:
+        yield b"retry: %d\n\n" % (settings.NEWS_STREAM_RETRY_MS,)
+
+        # 재전송한 뉴스가 구독 버퍼에도 들어 있을 수 있으므로 중복 제외
+        replayed_ids: Set[int] = set()
+        if last_event_id is not None:
+            replayed = await news_broker.replay(last_event_id)
+            if replayed is None:
+                # 놓친 뉴스가 너무 많음 - 목록 API로 다시 조회하도록 알리고 현재부터 전달
+                yield b"event: reset\ndata: {}\n\n"
+            else:
+                for event in replayed:
+                    yield event.to_sse()
+                    replayed_ids.add(event.news_id)
+
+        while True:
+            if subscription.overflowed and subscription.queue.empty():
+                # 버퍼를 넘어 구독이 해제됨 - 클라이언트가 Last-Event-ID로 재연결하여 이어 받음
+                return
+            try:
+                event = await asyncio.wait_for(
+                    subscription.queue.get(), timeout=settings.NEWS_STREAM_HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                yield b": keep-alive\n\n"
+                continue
+            if event.news_id not in replayed_ids:
+                yield event.to_sse()
+    finally:
+        news_broker.unsubscribe(subscription)
@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from typing import Optional
 import re
@@ -22,7 +22,7 @@ def validate_phone_format(phone: str) -> bool:
     return phone_digits.isdigit() and len(phone_digits) == 11
 
 
-def get_user_info(db: Session, authorization: str) -> UserInfoResponse:
+async def get_user_info(db: AsyncSession, authorization: str) -> UserInfoResponse:
     """
     사용자 정보를 조회합니다.
     
@@ -59,7 +59,7 @@ def get_user_info(db: Session, authorization: str) -> UserInfoResponse:
         )
     
     # 4. 회원 정보 조회
-    member = user_crud.get_member_by_id(db, member_id)
+    member = await user_crud.get_member_by_id(db, member_id)
     if not member:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -84,8 +84,8 @@ def get_user_info(db: Session, authorization: str) -> UserInfoResponse:
     )
 
 
-def update_user_info(
-    db: Session, 
+async def update_user_info(
+    db: AsyncSession, 
     update_data: UpdateUserRequest,
     authorization: str
 ) -> UpdateUserResponse:
@@ -126,7 +126,7 @@ def update_user_info(
         )
     
     # 4. 회원 존재 여부 확인
-    member = user_crud.get_member_by_id(db, member_id)
+    member = await user_crud.get_member_by_id(db, member_id)
     if not member:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -154,7 +154,7 @@ def update_user_info(
         phone_normalized = re.sub(r'[-\s]', '', update_data.phone)
     
     # 8. 회원 정보 업데이트
-    updated_member = user_crud.update_member_info(
+    updated_member = await user_crud.update_member_info(
         db=db,
         member_id=member_id,
         image=update_data.image,
@@ -174,7 +174,7 @@ def update_user_info(
     )
 
 
-def delete_user(db: Session, authorization: str) -> DeleteUserResponse:
+async def delete_user(db: AsyncSession, authorization: str) -> DeleteUserResponse:
     """
     회원 탈퇴를 처리합니다.
     
@@ -211,7 +211,7 @@ def delete_user(db: Session, authorization: str) -> DeleteUserResponse:
         )
     
     # 4. 회원 존재 여부 확인
-    member = user_crud.get_member_by_id(db, member_id)
+    member = await user_crud.get_member_by_id(db, member_id)
     if not member:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -227,7 +227,7 @@ def delete_user(db: Session, authorization: str) -> DeleteUserResponse:
         )
     
     # 6. 회원 탈퇴 처리
-    if not user_crud.delete_member(db, member_id):
+    if not await user_crud.delete_member(db, member_id):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Server error"
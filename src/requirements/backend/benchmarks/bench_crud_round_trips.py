@@ -0,0 +1,188 @@
+"""
+회원 CRUD 쓰기 경로 왕복(round trip) 수 벤치마크
+
+회원가입/로그인/전체 로그아웃/비밀번호 변경에서 DB로 보내는 SQL 문과 COMMIT 수를
+기존 방식(SELECT -> 수정 -> commit -> refresh)과 현재 crud(UPDATE/INSERT ... RETURNING)로 비교합니다.
+실제 PostgreSQL(POSTGRES_URL)이 필요하며, 실행 중 만든 테스트 회원은 마지막에 삭제합니다.
+
+사용법 (backend 디렉터리에서):
+    POSTGRES_URL=postgresql://... python -m benchmarks.bench_crud_round_trips --rounds 50
+"""
+import argparse
+import asyncio
+import os
+import time
+import uuid
+from datetime import datetime, timedelta
+
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+
+from sqlalchemy import event, select, delete  # noqa: E402
+from sqlalchemy.sql import func  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.core.db import async_engine, AsyncSessionLocal  # noqa: E402
+from app.core.security import hash_password, hash_token  # noqa: E402
+from app.crud import auth as auth_crud  # noqa: E402
+from app.models.member import Member  # noqa: E402
+from app.models.refresh_token import RefreshToken  # noqa: E402
+
+
+class RoundTripCounter:
+    """비동기 엔진에서 실행된 SQL 문과 COMMIT 수를 셉니다."""
+
+    def __init__(self):
+        self.statements = 0
+        self.commits = 0
+        event.listen(async_engine.sync_engine, "before_cursor_execute", self._on_execute)
+        event.listen(async_engine.sync_engine, "commit", self._on_commit)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements += 1
+
+    def _on_commit(self, conn):
+        self.commits += 1
+
+    def reset(self):
+        self.statements = 0
+        self.commits = 0
+
+    @property
+    def total(self) -> int:
+        return self.statements + self.commits
+
+
+# ---- 기존 구현 (비교용) ----
+
+async def legacy_create_member(db, email, hashed_password, name, phone):
+    new_member = Member(
+        email=email,
+        passwd=hashed_password,
+        member_name=name,
+        phone=phone,
+        profile_image="/static/profiles/default/profile.png",
+        account_status='A'
+    )
+    db.add(new_member)
+    await db.commit()
+    await db.refresh(new_member)
+    new_member.profile_image = f"/static/profiles/{new_member.member_id}/profile.png"
+    await db.commit()
+    await db.refresh(new_member)
+    return new_member
+
+
+async def legacy_load_member(db, member_id):
+    result = await db.execute(select(Member).where(Member.member_id == member_id))
+    return result.scalars().first()
+
+
+async def legacy_update_refresh_token(db, member_id, refresh_token):
+    member = await legacy_load_member(db, member_id)
+    if member:
+        db.add(RefreshToken(
+            member_id=member_id,
+            token_hash=hash_token(refresh_token),
+            expires_at=datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+        ))
+        member.last_login = func.now()
+        await db.flush()
+        recent_ids = (
+            select(RefreshToken.token_id)
+            .where(RefreshToken.member_id == member_id)
+            .order_by(RefreshToken.token_id.desc())
+            .limit(settings.REFRESH_TOKEN_MAX_SESSIONS)
+        )
+        await db.execute(
+            delete(RefreshToken).where(
+                RefreshToken.member_id == member_id,
+                RefreshToken.token_id.not_in(recent_ids)
+            )
+        )
+        await db.commit()
+        await db.refresh(member)
+    return member
+
+
+async def legacy_invalidate_tokens(db, member_id):
+    member = await legacy_load_member(db, member_id)
+    if member:
+        member.token_version = (member.token_version or 1) + 1
+        await db.execute(delete(RefreshToken).where(RefreshToken.member_id == member_id))
+        await db.commit()
+        return True
+    return False
+
+
+async def legacy_update_password(db, member_id, hashed_password):
+    member = await legacy_load_member(db, member_id)
+    if member:
+        member.passwd = hashed_password
+        await db.commit()
+        return True
+    return False
+
+
+LEGACY = {
+    "create_member": legacy_create_member,
+    "update_refresh_token": legacy_update_refresh_token,
+    "invalidate_tokens": legacy_invalidate_tokens,
+    "update_password": legacy_update_password,
+}
+
+CURRENT = {
+    "create_member": auth_crud.create_member,
+    "update_refresh_token": auth_crud.update_refresh_token,
+    "invalidate_tokens": auth_crud.invalidate_tokens,
+    "update_password": auth_crud.update_password,
+}
+
+
+async def run_flow(impl, counter: RoundTripCounter, rounds: int, created_ids: list):
+    """함수별 (호출당 왕복 수, 호출당 ms)를 반환합니다."""
+    stats = {name: [0, 0.0] for name in impl}
+
+    async def measure(name, *args):
+        counter.reset()
+        start = time.perf_counter()
+        async with AsyncSessionLocal() as db:
+            result = await impl[name](db, *args)
+        stats[name][0] += counter.total
+        stats[name][1] += time.perf_counter() - start
+        return result
+
+    for _ in range(rounds):
+        email = f"bench-{uuid.uuid4().hex[:12]}@example.com"
+        member = await measure("create_member", email, hash_password("Benchmark!123"), "벤치마크", "01000000000")
+        created_ids.append(member.member_id)
+        await measure("update_refresh_token", member.member_id, uuid.uuid4().hex)
+        await measure("invalidate_tokens", member.member_id)
+        await measure("update_password", member.member_id, hash_password("Benchmark!456"))
+
+    return {name: (trips / rounds, elapsed / rounds * 1000) for name, (trips, elapsed) in stats.items()}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="회원 CRUD 쓰기 경로 왕복 수 벤치마크")
+    parser.add_argument("--rounds", type=int, default=50, help="함수별 반복 횟수")
+    args = parser.parse_args()
+
+    counter = RoundTripCounter()
+    created_ids = []
+    try:
+        legacy = await run_flow(LEGACY, counter, args.rounds, created_ids)
+        current = await run_flow(CURRENT, counter, args.rounds, created_ids)
+    finally:
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(RefreshToken).where(RefreshToken.member_id.in_(created_ids)))
+            await db.execute(delete(Member).where(Member.member_id.in_(created_ids)))
+            await db.commit()
+        await async_engine.dispose()
+
+    print(f"rounds={args.rounds} (왕복 수 = SQL 문 + COMMIT)")
+    print(f"{'함수':<26}{'기존 왕복':>10}{'현재 왕복':>10}{'기존 ms':>10}{'현재 ms':>10}")
+    for name in CURRENT:
+        print(f"{name:<26}{legacy[name][0]:>10.1f}{current[name][0]:>10.1f}{legacy[name][1]:>10.2f}{current[name][1]:>10.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,93 @@
+"""
+뉴스 검색 지연 시간 벤치마크
+
+seed로 적재한 뉴스(benchmarks.loadtest.seed)에서 자주 나오는 검색어와 드문 검색어(RARE_WORDS)로
+검색 서비스(services.news.search_news)를 반복 호출하여 그룹별 p50/p95/최대 지연 시간을 보고합니다.
+실제 PostgreSQL(POSTGRES_URL)과 검색 인덱스(python -m app.migrations indexes)가 필요합니다.
+
+사용법 (backend 디렉터리에서):
+    POSTGRES_URL=postgresql://... python -m benchmarks.loadtest.seed --members 0 --login-history 0 --news 1000000
+    POSTGRES_URL=postgresql://... python -m benchmarks.bench_news_search --iterations 50 --target-ms 100
+"""
+import argparse
+import asyncio
+import math
+import os
+import random
+import time
+from typing import Dict, List
+
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+
+from sqlalchemy import text  # noqa: E402
+from app import migrations  # noqa: E402
+from app.core.db import async_engine, engine, AsyncSessionLocal  # noqa: E402
+from app.services import news as news_service  # noqa: E402
+from benchmarks.loadtest.seed import RARE_WORDS  # noqa: E402
+
+
+# seed 본문 단어 목록(WORDS)에서 고른 검색어 - 거의 모든 뉴스에 나타남
+FREQUENT_QUERIES = ["정부", "부동산 정책", "국회 법안", "금리 인상", "반도체"]
+RARE_QUERIES = RARE_WORDS
+
+
+def percentile(values: List[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(len(ordered) * p / 100) - 1))]
+
+
+async def measure(queries: List[str], iterations: int, limit: int, rng: random.Random) -> List[float]:
+    latencies = []
+    for _ in range(iterations):
+        query = rng.choice(queries)
+        start = time.perf_counter()
+        async with AsyncSessionLocal() as db:
+            await news_service.search_news(db, query, page=1, limit=limit)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+async def run(args) -> Dict[str, List[float]]:
+    rng = random.Random(args.seed)
+    try:
+        # 첫 호출의 연결/플랜 캐시 비용 제외
+        await measure(FREQUENT_QUERIES + RARE_QUERIES, args.warmup, args.limit, rng)
+        return {
+            "frequent": await measure(FREQUENT_QUERIES, args.iterations, args.limit, rng),
+            "rare": await measure(RARE_QUERIES, args.iterations, args.limit, rng),
+        }
+    finally:
+        await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="뉴스 검색 지연 시간 벤치마크")
+    parser.add_argument("--iterations", type=int, default=50, help="그룹별 검색 횟수")
+    parser.add_argument("--warmup", type=int, default=5, help="측정 전 워밍업 검색 횟수")
+    parser.add_argument("--limit", type=int, default=20, help="페이지 크기")
+    parser.add_argument("--target-ms", type=float, default=100.0, help="p95 목표 (ms)")
+    parser.add_argument("--seed", type=int, default=42, help="검색어 선택 난수 시드")
+    args = parser.parse_args()
+
+    missing = migrations.missing_concurrent_indexes(engine)
+    if missing:
+        raise SystemExit(f"검색 인덱스가 없습니다: {', '.join(missing)} (python -m app.migrations indexes 로 생성)")
+    with engine.connect() as conn:
+        news_count = conn.execute(text("SELECT count(*) FROM news")).scalar()
+
+    results = asyncio.run(run(args))
+
+    print(f"news={news_count:,}, iterations={args.iterations}, limit={args.limit}")
+    print(f"{'그룹':<10}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}  목표(p95 < {args.target_ms:.0f}ms)")
+    failed = False
+    for group, latencies in results.items():
+        p95 = percentile(latencies, 95)
+        ok = p95 < args.target_ms
+        failed = failed or not ok
+        print(f"{group:<10}{percentile(latencies, 50):>10.1f}{p95:>10.1f}{max(latencies):>10.1f}  {'✅' if ok else '❌'}")
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+뉴스 응답 직렬화/압축 벤치마크
+
+한국어 본문을 가진 뉴스 목록 응답을 만들어
+- 직렬화: json(ensure_ascii=True), json(ensure_ascii=False, Starlette 기본), orjson
+- 압축: 원본, gzip, brotli
+의 페이로드 크기와 소요 시간을 비교합니다. (DB 불필요)
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.bench_serialization --items 20 --body-chars 2000
+"""
+import argparse
+import gzip
+import json
+import random
+import time
+from datetime import datetime, timedelta
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+WORDS = [
+    "정부", "국회", "법안", "개정안", "부동산", "정책", "발표", "경제", "성장률", "물가", "금리", "인상",
+    "기획재정부", "국토교통부", "여당", "야당", "대통령", "장관", "위원회", "심사", "통과", "예산",
+    "지원", "확대", "규제", "완화", "청년", "주거", "일자리", "지역", "관계자는", "밝혔다", "전망이다",
+    "따르면", "올해", "내년", "지난해", "대비", "증가", "감소", "것으로", "나타났다", "AI", "반도체", "2025년",
+]
+COMPANIES = ["한국경제", "세계일보", "조선일보", "중앙일보", "문화일보"]
+CATEGORIES = [("정치", "국회"), ("경제", "부동산"), ("사회", "노동"), ("경제", "금융")]
+
+
+def korean_text(rng: random.Random, chars: int) -> str:
+    words = []
+    length = 0
+    while length < chars:
+        word = rng.choice(WORDS)
+        words.append(word)
+        length += len(word) + 1
+        if rng.random() < 0.08:
+            words[-1] += "."
+    return " ".join(words)[:chars]
+
+
+def news_payload(items: int, body_chars: int, seed: int = 42) -> dict:
+    rng = random.Random(seed)
+    now = datetime(2025, 1, 1, 9, 0, 0)
+    result = []
+    for i in range(items):
+        category, sub_category = rng.choice(CATEGORIES)
+        result.append({
+            "id": 100000 + i,
+            "title": korean_text(rng, 40),
+            "summary": korean_text(rng, 200),
+            "category": category,
+            "subCategory": sub_category,
+            "published": (now - timedelta(minutes=i * 7)).isoformat(),
+            "company": rng.choice(COMPANIES),
+            "url": f"https://news.example.com/article/{100000 + i}",
+            "issueId": rng.randint(1, 500),
+            "body": korean_text(rng, body_chars),
+        })
+    return {"items": result, "nextCursor": "MjAyNS0wMS0wMVQwOTowMDowMHwxMDAwMDA"}
+
+
+def timed(func, repeat: int):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return result, (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="뉴스 응답 직렬화/압축 벤치마크")
+    parser.add_argument("--items", type=int, default=20, help="목록 항목 수")
+    parser.add_argument("--body-chars", type=int, default=2000, help="본문 글자 수 (0이면 본문 제외 목록)")
+    parser.add_argument("--repeat", type=int, default=200, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    payload = news_payload(args.items, args.body_chars)
+    if args.body_chars == 0:
+        for item in payload["items"]:
+            item.pop("body")
+
+    serializers = {
+        "json (ensure_ascii=True)": lambda: json.dumps(payload).encode(),
+        "json (ensure_ascii=False)": lambda: json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+    }
+    if orjson is not None:
+        serializers["orjson"] = lambda: orjson.dumps(payload)
+
+    print(f"items={args.items}, body_chars={args.body_chars}, repeat={args.repeat}")
+    print(f"{'직렬화':<28}{'bytes':>10}{'ms':>10}")
+    encoded = {}
+    for name, func in serializers.items():
+        body, ms = timed(func, args.repeat)
+        encoded[name] = body
+        print(f"{name:<28}{len(body):>10}{ms:>10.3f}")
+
+    body = encoded.get("orjson") or encoded["json (ensure_ascii=False)"]
+    compressors = {
+        "identity": lambda: body,
+        "gzip (level 6)": lambda: gzip.compress(body, compresslevel=6),
+    }
+    if brotli is not None:
+        compressors["brotli (quality 4)"] = lambda: brotli.compress(body, quality=4)
+
+    print()
+    print(f"{'압축':<28}{'bytes':>10}{'ms':>10}{'ratio':>10}")
+    for name, func in compressors.items():
+        compressed, ms = timed(func, args.repeat)
+        print(f"{name:<28}{len(compressed):>10}{ms:>10.3f}{len(compressed) / len(body):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+액세스 토큰 검증 캐시 벤치마크
+
+같은 액세스 토큰을 반복 검증할 때 캐시 미사용(매번 jwt.decode)과
+캐시 사용(verify_access_token) 의 요청당 소요 시간을 비교합니다.
+
+사용법 (backend 디렉터리에서):
+    python -m benchmarks.bench_token_cache --iterations 20000 --tokens 100
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+
+from app.core import security  # noqa: E402
+
+
+def run(label: str, func, tokens, iterations: int) -> float:
+    start = time.perf_counter()
+    for i in range(iterations):
+        func(tokens[i % len(tokens)])
+    elapsed = time.perf_counter() - start
+    per_call_us = elapsed / iterations * 1_000_000
+    print(f"{label:<28} {elapsed:8.3f}s  {per_call_us:8.2f}us/req")
+    return per_call_us
+
+
+def uncached_verify(token: str):
+    payload = security.decode_token(token)
+    if payload is None or payload.get("type") != "access" or "token_version" not in payload:
+        raise RuntimeError("invalid token")
+    return payload
+
+
+def main():
+    parser = argparse.ArgumentParser(description="액세스 토큰 검증 캐시 벤치마크")
+    parser.add_argument("--iterations", type=int, default=20000, help="검증 호출 횟수")
+    parser.add_argument("--tokens", type=int, default=100, help="서로 다른 토큰 수 (동시 접속 회원 수)")
+    args = parser.parse_args()
+
+    tokens = [
+        security.create_access_token({"sub": str(i), "email": f"user{i}@example.com", "token_version": 1})
+        for i in range(args.tokens)
+    ]
+
+    print(f"iterations={args.iterations}, tokens={args.tokens}")
+    uncached = run("jwt.decode (캐시 없음)", uncached_verify, tokens, args.iterations)
+    security._access_token_cache.clear()
+    cached = run("verify_access_token (캐시)", security.verify_access_token, tokens, args.iterations)
+    print(f"요청당 절감: {uncached - cached:.2f}us ({uncached / cached:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
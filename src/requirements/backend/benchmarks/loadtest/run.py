@@ -0,0 +1,303 @@
+"""
+혼합 트래픽 부하 테스트
+
+seed로 만든 회원들로 로그인/토큰 재발급/내 정보 조회/뉴스 목록 요청을 섞어 목표 RPS로 보냅니다.
+요청은 정해진 시각에 발사되는 개방형(open-loop) 방식이며, 지연 시간은 예정 발사 시각부터 측정하므로
+서버가 밀려 대기한 시간도 포함됩니다 (coordinated omission 보정).
+
+- --base-url 을 주면 실행 중인 서버(uvicorn/nginx)로 HTTP 요청을 보냅니다.
+  로그인 요청 제한에 걸리지 않도록 대상 서버는 RATE_LIMIT_ENABLED=false 로 실행해야 합니다.
+- --base-url 이 없으면 앱을 같은 프로세스에서 ASGI로 직접 호출합니다 (네트워크/nginx 제외, POSTGRES_URL 필요).
+
+httpx 패키지가 필요합니다 (pip install httpx).
+
+사용법 (backend 디렉터리에서):
+    POSTGRES_URL=postgresql://... python -m benchmarks.loadtest.run --rps 200 --duration 60 --output baseline.json
+    python -m benchmarks.loadtest.run --base-url http://localhost:8000 --rps 200 --baseline baseline.json
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+# 같은 프로세스의 앱(--base-url 없음)은 모든 요청이 한 클라이언트에서 오므로 요청 제한을 끔
+# (seed 모듈을 import하면 app.core.config.settings가 만들어지므로 그 전에 설정해야 함)
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+
+from benchmarks.loadtest.seed import LOADTEST_PASSWORD, member_email  # noqa: E402
+
+
+DEFAULT_MIX = "login=1,refresh=1,me=4,news=4"
+
+
+class VirtualUser:
+    """로그인 상태(토큰)를 가진 가상 사용자"""
+
+    __slots__ = ("email", "access_token", "refresh_token")
+
+    def __init__(self, email: str):
+        self.email = email
+        self.access_token: Optional[str] = None
+        self.refresh_token: Optional[str] = None
+
+
+class Recorder:
+    """엔드포인트별 지연 시간(ms)과 상태 코드 기록"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.statuses: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+
+    def record(self, name: str, status: int, latency_ms: float):
+        self.latencies[name].append(latency_ms)
+        self.statuses[name][status] += 1
+        if not (200 <= status < 300 or status == 304):
+            self.errors[name] += 1
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """최근접 순위(nearest-rank) 백분위수"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(recorder: Recorder, elapsed: float) -> Dict[str, Dict]:
+    summary = {}
+    for name in sorted(recorder.latencies):
+        values = sorted(recorder.latencies[name])
+        summary[name] = {
+            "requests": len(values),
+            "errors": recorder.errors[name],
+            "rps": len(values) / elapsed,
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+            "max": values[-1],
+            "statuses": dict(recorder.statuses[name]),
+        }
+    return summary
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        weights[name.strip()] = float(weight or 1)
+    unknown = set(weights) - set(OPERATIONS)
+    if unknown:
+        raise SystemExit(f"알 수 없는 요청 종류: {', '.join(sorted(unknown))} (가능: {', '.join(OPERATIONS)})")
+    return weights
+
+
+# ---- 요청 종류 ----
+
+async def op_login(client, user: VirtualUser, state: Dict):
+    response = await client.post("/api/v1/auth/login", json={"email": user.email, "password": LOADTEST_PASSWORD})
+    if response.status_code == 200:
+        data = response.json()
+        user.access_token = data["accessToken"]
+        user.refresh_token = data["refreshToken"]
+    return response.status_code
+
+
+async def op_refresh(client, user: VirtualUser, state: Dict):
+    response = await client.post("/api/v1/auth/refresh", json={"refreshToken": user.refresh_token})
+    if response.status_code == 201:
+        user.access_token = response.json()["accessToken"]
+    return response.status_code
+
+
+async def op_me(client, user: VirtualUser, state: Dict):
+    response = await client.get("/api/v1/user/me", headers={"Authorization": f"Bearer {user.access_token}"})
+    return response.status_code
+
+
+async def op_news(client, user: VirtualUser, state: Dict):
+    # 첫 페이지 위주로, 일부는 다음 페이지/카테고리 필터 요청
+    params = {"limit": 20}
+    roll = state["rng"].random()
+    if roll < 0.3 and state["cursors"]:
+        params["cursor"] = state["rng"].choice(state["cursors"])
+    elif roll < 0.5:
+        params["category"] = state["rng"].choice(["정치", "경제", "사회"])
+    response = await client.get("/api/v1/news", params=params)
+    if response.status_code == 200:
+        next_cursor = response.json().get("nextCursor")
+        if next_cursor and len(state["cursors"]) < 1000:
+            state["cursors"].append(next_cursor)
+    return response.status_code
+
+
+OPERATIONS = {
+    "login": op_login,
+    "refresh": op_refresh,
+    "me": op_me,
+    "news": op_news,
+}
+
+
+async def prepare_users(client, count: int, concurrency: int) -> List[VirtualUser]:
+    """가상 사용자를 미리 로그인시켜 토큰을 준비합니다."""
+    users = [VirtualUser(member_email(i)) for i in range(count)]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def login(user):
+        async with semaphore:
+            await op_login(client, user, {})
+
+    await asyncio.gather(*(login(user) for user in users))
+    ready = [user for user in users if user.access_token]
+    if not ready:
+        raise SystemExit("로그인에 성공한 가상 사용자가 없습니다 (seed 실행 여부와 요청 제한 설정을 확인하세요)")
+    print(f"가상 사용자 {len(ready)}/{count}명 로그인 완료")
+    return ready
+
+
+async def drive(client, users: List[VirtualUser], weights: Dict[str, float], rps: float, duration: float,
+                concurrency: int, seed: int) -> Recorder:
+    recorder = Recorder()
+    state = {"rng": random.Random(seed), "cursors": []}
+    names = list(weights)
+    weight_values = list(weights.values())
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks = []
+
+    async def fire(name: str, user: VirtualUser, scheduled: float):
+        async with semaphore:
+            try:
+                status = await OPERATIONS[name](client, user, state)
+            except Exception:
+                status = 0  # 연결 오류/타임아웃
+        recorder.record(name, status, (time.perf_counter() - scheduled) * 1000)
+
+    start = time.perf_counter()
+    total = int(rps * duration)
+    for k in range(total):
+        scheduled = start + k / rps
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        name = state["rng"].choices(names, weights=weight_values)[0]
+        tasks.append(asyncio.create_task(fire(name, state["rng"].choice(users), scheduled)))
+    await asyncio.gather(*tasks)
+    return recorder
+
+
+def print_report(summary: Dict[str, Dict], elapsed: float, baseline: Optional[Dict[str, Dict]]):
+    print()
+    print(f"{'endpoint':<10}{'req':>8}{'err':>6}{'rps':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    total = 0
+    for name, row in summary.items():
+        total += row["requests"]
+        print(
+            f"{name:<10}{row['requests']:>8}{row['errors']:>6}{row['rps']:>9.1f}"
+            f"{row['p50']:>10.1f}{row['p95']:>10.1f}{row['p99']:>10.1f}{row['max']:>10.1f}"
+        )
+        if baseline and name in baseline:
+            before = baseline[name]
+            print(
+                f"{'  기준 대비':<10}{'':>8}{'':>6}{row['rps'] - before['rps']:>+9.1f}"
+                f"{row['p50'] - before['p50']:>+10.1f}{row['p95'] - before['p95']:>+10.1f}"
+                f"{row['p99'] - before['p99']:>+10.1f}{'':>10}"
+            )
+    print(f"\n전체 {total}건, {total / elapsed:.1f} req/s ({elapsed:.1f}초)")
+
+
+def regressions(summary: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[str]:
+    """기준 대비 p95가 threshold(%) 이상 늘었거나 오류가 생긴 엔드포인트"""
+    found = []
+    for name, row in summary.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        if before["p95"] > 0 and (row["p95"] - before["p95"]) / before["p95"] * 100 > threshold:
+            found.append(f"{name}: p95 {before['p95']:.1f}ms -> {row['p95']:.1f}ms")
+        if row["errors"] > before["errors"]:
+            found.append(f"{name}: 오류 {before['errors']} -> {row['errors']}")
+    return found
+
+
+async def run(args) -> int:
+    try:
+        import httpx
+    except ImportError:
+        raise SystemExit("부하 테스트에는 httpx 패키지가 필요합니다 (pip install httpx)")
+
+    weights = parse_mix(args.mix)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with contextlib.AsyncExitStack() as stack:
+        if args.base_url:
+            client = httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout)
+        else:
+            # 같은 프로세스의 앱 - lifespan(startup/shutdown 이벤트: 로그인 이력 기록기 등)을 직접 실행
+            from app.main import app as asgi_app
+            await stack.enter_async_context(asgi_app.router.lifespan_context(asgi_app))
+            client = httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=asgi_app), base_url="http://loadtest", timeout=args.timeout
+            )
+
+        try:
+            users = await prepare_users(client, args.users, args.concurrency)
+            print(f"목표 {args.rps} req/s, {args.duration}초, 혼합 비율 {args.mix}")
+            start = time.perf_counter()
+            recorder = await drive(client, users, weights, args.rps, args.duration, args.concurrency, args.seed)
+            elapsed = time.perf_counter() - start
+        finally:
+            await client.aclose()
+
+    summary = summarize(recorder, elapsed)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["endpoints"]
+    print_report(summary, elapsed, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({
+                "rps": args.rps, "duration": args.duration, "mix": args.mix,
+                "target": args.base_url or "embedded", "endpoints": summary,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+
+    if baseline:
+        found = regressions(summary, baseline, args.max_regression)
+        if found:
+            print(f"\n❌ 성능 저하 감지 (p95 허용치 {args.max_regression}%)")
+            for line in found:
+                print(f"  - {line}")
+            return 1
+        print("\n✅ 기준 대비 성능 저하 없음")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="혼합 트래픽 부하 테스트")
+    parser.add_argument("--base-url", help="대상 서버 URL (생략하면 같은 프로세스의 앱을 ASGI로 호출)")
+    parser.add_argument("--rps", type=float, default=100, help="목표 초당 요청 수")
+    parser.add_argument("--duration", type=float, default=30, help="측정 시간 (초)")
+    parser.add_argument("--users", type=int, default=100, help="가상 사용자 수 (seed 회원 중 앞에서부터)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"요청 종류별 가중치 (기본값: {DEFAULT_MIX})")
+    parser.add_argument("--concurrency", type=int, default=200, help="동시에 처리 중인 최대 요청 수")
+    parser.add_argument("--timeout", type=float, default=30, help="요청 타임아웃 (초)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 (다음 실행의 --baseline 으로 사용)")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--max-regression", type=float, default=20, help="허용할 p95 증가율 (%%, 초과 시 종료 코드 1)")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 import os
 from celery import Celery
 from dotenv import load_dotenv
-from celery.signals import beat_init
+from celery.signals import beat_init, worker_process_init, worker_process_shutdown
 from celery.schedules import crontab
 
 # ============================================================
@@ -35,6 +35,21 @@ def on_beat_init(sender, **kwargs):
     sender.app.send_task('tasks.scheduled_crawling')
     print("✅ 초기 태스크 발송 완료")
 
+# 워커 프로세스 시작 시 크롤러 런타임(회사별 전용 스레드 + Playwright 브라우저) 예열
+# 태스크마다 Playwright 시작/Chromium 실행 비용을 다시 지불하지 않도록 프로세스 수명 동안 재사용
+# (브라우저 실행은 백그라운드에서 진행되므로 이 핸들러는 바로 반환되어 WORKER_UP 대기 시간을 넘지 않음)
+@worker_process_init.connect
+def on_worker_process_init(**kwargs):
+    from crawling.company import crawl_targets
+    from crawling.CrawlerRuntime import CrawlerRuntime
+    print("🔥 워커 프로세스 초기화 - 크롤러 런타임 예열 중...")
+    CrawlerRuntime.start(crawl_targets)
+
+@worker_process_shutdown.connect
+def on_worker_process_shutdown(**kwargs):
+    from crawling.CrawlerRuntime import CrawlerRuntime
+    CrawlerRuntime.stop()
+
 # Celery 설정
 app.conf.update(
     task_serializer='json',
@@ -62,8 +77,14 @@ app.conf.update(
     task_reject_on_worker_lost=True,  # 워커가 죽으면 작업 거부
     
     # 워커 동시성 설정
-    worker_concurrency=1,  # 워커 프로세스 수
-    worker_max_tasks_per_child=1,  # 워커당 최대 작업 수 (메모리 누수 방지)
+    # 크롤링은 회사별 태스크(tasks.crawl_company)로 나뉘어 프로세스/컨테이너마다 다른 회사를 동시에 처리하며,
+    # crawl_frontier 테이블의 SKIP LOCKED 임대로 워커 간 중복 수집이 없으므로 프로세스/컨테이너를 늘려도 됨
+    worker_concurrency=int(os.environ.get('CELERY_WORKER_CONCURRENCY', 1)),  # 워커 프로세스 수
+    # 매 태스크마다 프로세스를 죽이지 않고 크롤러 런타임을 유지
+    # 브라우저는 CrawlerRuntime의 페이지 수/메모리 기준으로 재시작하고,
+    # 프로세스 자체는 아래 한도를 넘을 때만 교체 (메모리 누수 방지)
+    worker_max_tasks_per_child=int(os.environ.get('CELERY_MAX_TASKS_PER_CHILD', 100)),  # 워커당 최대 작업 수
+    worker_max_memory_per_child=int(os.environ.get('CELERY_MAX_MEMORY_PER_CHILD_KB', 1024 * 1024)),  # 워커 프로세스 메모리 한도 (KB)
     
     # 작업 재시도 설정
     task_default_retry_delay=300,  # 재시도 전 5분 대기
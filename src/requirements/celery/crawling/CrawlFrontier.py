@@ -0,0 +1,178 @@
+import os
+import socket
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+from sqlalchemy import text
+from .db import get_engine
+
+
+class CrawlFrontier(object):
+	"""
+	PostgreSQL 기반 분산 크롤 프런티어
+
+	발견된 기사 URL을 상태/우선순위/임대(lease) 정보와 함께 crawl_frontier 테이블에 보관합니다.
+	여러 크롤러 워커가 `SELECT ... FOR UPDATE SKIP LOCKED`로 서로 다른 URL을 임대하므로
+	중복 수집 없이 워커를 늘릴 수 있고, 워커가 죽어 만료된 임대는 다른 워커가 자동으로 회수합니다.
+
+	상태(state):
+	- P: 대기 (Pending)
+	- L: 임대 중 (Leased)
+	- D: 완료 (Done)
+	- F: 실패 (Failed, 최대 시도 횟수 초과)
+
+	테이블과 인덱스는 백엔드 마이그레이션(0009)에서 만듭니다.
+	POSTGRES_URL이 없거나 DB 오류(마이그레이션 전이라 테이블이 없는 경우 포함)가 발생하면 프런티어 없이 기존처럼 동작합니다.
+	"""
+
+	# 임대 유지 시간 (초) - 기사 1건 처리 시간보다 충분히 길게
+	lease_seconds = int(os.environ.get('CRAWL_LEASE_SECONDS', 600))
+	# 최대 시도 횟수 - 초과 시 실패(F) 처리
+	max_attempts = int(os.environ.get('CRAWL_MAX_ATTEMPTS', 3))
+
+	# 임대 획득 결과
+	CLAIMED = 'claimed'
+	BUSY = 'busy'
+	DONE = 'done'
+
+	@staticmethod
+	def worker_id(company: str) -> str:
+		"""임대 소유자 식별자 (호스트명:PID:회사)"""
+		return f"{socket.gethostname()}:{os.getpid()}:{company}"
+
+	@classmethod
+	def acquire(cls, company: str, category: str, sub_category: str, news_url: str, owner: str, priority: float = 0) -> Tuple[str, Optional[datetime]]:
+		"""
+		목록 페이지에서 발견한 URL을 프런티어에 등록하고 임대를 시도합니다.
+
+		Returns:
+			(결과, 게시일시) - 결과는 CLAIMED / BUSY(다른 워커가 임대 중) / DONE(이미 수집됨),
+			게시일시는 DONE인 경우에만 채워집니다.
+		"""
+		engine = cls._engine_or_none()
+		if engine is None:
+			return cls.CLAIMED, None
+
+		try:
+			with engine.begin() as conn:
+				conn.execute(
+					text(
+						"INSERT INTO crawl_frontier (news_url, company, category, sub_category, priority) "
+						"VALUES (:news_url, :company, :category, :sub_category, :priority) "
+						"ON CONFLICT (news_url) DO NOTHING"
+					),
+					{"news_url": news_url, "company": company, "category": category, "sub_category": sub_category, "priority": priority}
+				)
+				claimed = conn.execute(
+					text(
+						"WITH picked AS ("
+						" SELECT url_id FROM crawl_frontier"
+						" WHERE news_url = :news_url"
+						" AND (state = 'P' OR (state = 'L' AND lease_expires < now()))"
+						" FOR UPDATE SKIP LOCKED"
+						") "
+						"UPDATE crawl_frontier f SET state = 'L', lease_owner = :owner,"
+						" lease_expires = now() + make_interval(secs => :lease), attempts = f.attempts + 1, updated_at = now() "
+						"FROM picked WHERE f.url_id = picked.url_id "
+						"RETURNING f.url_id"
+					),
+					{"news_url": news_url, "owner": owner, "lease": cls.lease_seconds}
+				).first()
+				if claimed:
+					return cls.CLAIMED, None
+
+				row = conn.execute(
+					text("SELECT state, published FROM crawl_frontier WHERE news_url = :news_url"),
+					{"news_url": news_url}
+				).first()
+		except Exception as e:
+			print(f"프런티어 임대 실패 (프런티어 없이 진행): {e}")
+			return cls.CLAIMED, None
+
+		if row and row.state in ('D', 'F'):
+			return cls.DONE, row.published
+		return cls.BUSY, None
+
+	@classmethod
+	def claim(cls, company: str, owner: str, batch_size: int = 20) -> List[Dict[str, Any]]:
+		"""
+		대기 중이거나 임대가 만료된 URL을 우선순위 순으로 최대 batch_size개 임대합니다.
+		다른 워커가 잠근 행은 SKIP LOCKED로 건너뜁니다.
+		"""
+		engine = cls._engine_or_none()
+		if engine is None:
+			return []
+
+		try:
+			with engine.begin() as conn:
+				rows = conn.execute(
+					text(
+						"WITH picked AS ("
+						" SELECT url_id FROM crawl_frontier"
+						" WHERE company = :company"
+						" AND (state = 'P' OR (state = 'L' AND lease_expires < now()))"
+						" ORDER BY priority DESC, url_id"
+						" LIMIT :batch_size"
+						" FOR UPDATE SKIP LOCKED"
+						") "
+						"UPDATE crawl_frontier f SET state = 'L', lease_owner = :owner,"
+						" lease_expires = now() + make_interval(secs => :lease), attempts = f.attempts + 1, updated_at = now() "
+						"FROM picked WHERE f.url_id = picked.url_id "
+						"RETURNING f.url_id, f.news_url, f.company, f.category, f.sub_category, f.attempts"
+					),
+					{"company": company, "owner": owner, "batch_size": batch_size, "lease": cls.lease_seconds}
+				).fetchall()
+		except Exception as e:
+			print(f"프런티어 배치 임대 실패: {e}")
+			return []
+
+		return [dict(row._mapping) for row in rows]
+
+	@classmethod
+	def complete(cls, news_url: str, owner: str, published: Optional[datetime] = None):
+		"""임대한 URL의 처리를 완료(D)로 기록합니다."""
+		engine = cls._engine_or_none()
+		if engine is None:
+			return
+		try:
+			with engine.begin() as conn:
+				conn.execute(
+					text(
+						"UPDATE crawl_frontier SET state = 'D', published = :published,"
+						" lease_owner = NULL, lease_expires = NULL, updated_at = now() "
+						"WHERE news_url = :news_url AND lease_owner = :owner"
+					),
+					{"news_url": news_url, "owner": owner, "published": published}
+				)
+		except Exception as e:
+			print(f"프런티어 완료 기록 실패: {e}")
+
+	@classmethod
+	def release(cls, news_url: str, owner: str):
+		"""
+		처리에 실패한 URL의 임대를 반납합니다.
+		시도 횟수가 max_attempts에 도달하면 실패(F)로, 아니면 다시 대기(P)로 돌립니다.
+		"""
+		engine = cls._engine_or_none()
+		if engine is None:
+			return
+		try:
+			with engine.begin() as conn:
+				conn.execute(
+					text(
+						"UPDATE crawl_frontier SET"
+						" state = CASE WHEN attempts >= :max_attempts THEN 'F' ELSE 'P' END,"
+						" lease_owner = NULL, lease_expires = NULL, updated_at = now() "
+						"WHERE news_url = :news_url AND lease_owner = :owner"
+					),
+					{"news_url": news_url, "owner": owner, "max_attempts": cls.max_attempts}
+				)
+		except Exception as e:
+			print(f"프런티어 임대 반납 실패: {e}")
+
+	@classmethod
+	def _engine_or_none(cls):
+		try:
+			return get_engine()
+		except Exception as e:
+			print(f"프런티어 DB 연결 준비 실패 (프런티어 없이 진행): {e}")
+			return None
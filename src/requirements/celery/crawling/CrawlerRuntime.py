@@ -0,0 +1,156 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+import psutil
+
+
+class CrawlerRuntime(object):
+	"""
+	Celery 워커 프로세스 안에서 태스크 간에 유지되는 크롤러 런타임
+
+	worker_process_init 시점에 회사별 전용 스레드를 만들고 그 스레드에서 Playwright 브라우저를 미리 띄워 두고,
+	매 태스크마다 재사용하여 Playwright 시작/Chromium 실행 비용을 한 번만 지불합니다.
+
+	- Playwright sync API 객체는 생성한 스레드에서만 사용할 수 있으므로
+	  회사마다 스레드 1개짜리 executor를 두고 해당 회사의 크롤링은 항상 그 스레드에서 실행합니다.
+	- 페이지 로드 수가 max_pages를 넘거나 (워커 + 브라우저) RSS가 max_rss_mb를 넘으면
+	  프로세스를 죽이는 대신 해당 브라우저만 닫고 다시 띄웁니다(recycle).
+	- 런타임이 시작되지 않은 경우(스크립트 직접 실행 등)에는 기존처럼 태스크마다 브라우저를 띄우고 닫습니다.
+	"""
+
+	# 브라우저 재시작 기준
+	max_pages = int(os.environ.get('CRAWLER_MAX_PAGES', 500))
+	max_rss_mb = int(os.environ.get('CRAWLER_MAX_RSS_MB', 1500))
+
+	_lock = threading.Lock()
+	_started = False
+	_executors: Dict[str, ThreadPoolExecutor] = {}
+	# 회사별 상주 크롤러 (해당 회사 전용 스레드에서만 접근)
+	_crawlers: Dict[str, object] = {}
+
+	@classmethod
+	def start(cls, companies):
+		"""워커 프로세스 시작 시 회사별 전용 스레드를 만들고 브라우저를 백그라운드에서 미리 띄웁니다."""
+		with cls._lock:
+			if cls._started:
+				return
+			for company in companies:
+				cls._executors[company] = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"crawler-{company}")
+			cls._started = True
+
+		# 예열은 기다리지 않고 각 회사 전용 스레드에 맡김
+		# (prefork 풀은 worker_process_init이 worker_proc_alive_timeout(기본 4초) 안에 끝나지 않으면
+		#  자식 프로세스를 죽이므로 Chromium 실행을 여기서 기다리면 안 됨)
+		# 회사 전용 executor는 스레드가 1개이므로 먼저 도착한 태스크의 크롤링도 예열이 끝난 뒤 순서대로 실행됨
+		futures = {company: executor.submit(cls._warm_up, company) for company, executor in cls._executors.items()}
+		threading.Thread(target=cls._report_warm_up, args=(futures,), name="crawler-warm-up", daemon=True).start()
+
+	@classmethod
+	def stop(cls):
+		"""워커 프로세스 종료 시 모든 브라우저를 각자의 스레드에서 닫습니다."""
+		with cls._lock:
+			if not cls._started:
+				return
+			executors = dict(cls._executors)
+			cls._started = False
+
+		for company, executor in executors.items():
+			try:
+				executor.submit(cls._shutdown_crawler, company).result(timeout=30)
+			except Exception as e:
+				print(f"[{company}] 크롤러 종료 중 오류: {e}")
+			executor.shutdown(wait=False)
+		cls._executors.clear()
+		print("크롤러 런타임 종료")
+
+	@classmethod
+	def executor(cls, company: str) -> Optional[ThreadPoolExecutor]:
+		"""회사 전용 executor (런타임이 시작되지 않았으면 None - 기본 스레드 풀 사용)"""
+		if not cls._started:
+			return None
+		return cls._executors.get(company)
+
+	@classmethod
+	def acquire(cls, company: str):
+		"""
+		현재 스레드에서 사용할 크롤러를 반환합니다.
+		런타임 전용 스레드에서 호출되면 상주 크롤러를, 아니면 새 크롤러를 반환합니다.
+		"""
+		from .NewsCrawler import NewsCrawler
+
+		if cls._is_runtime_thread(company):
+			crawler = cls._crawlers.get(company)
+			if crawler is None:
+				crawler = NewsCrawler(company)
+				crawler.persistent = True
+				cls._crawlers[company] = crawler
+			return crawler
+		return NewsCrawler(company)
+
+	@classmethod
+	def release(cls, crawler):
+		"""태스크가 끝난 크롤러를 반납합니다. 상주 크롤러는 닫지 않고 유지합니다."""
+		if getattr(crawler, 'persistent', False):
+			return
+		crawler._close_driver()
+
+	@classmethod
+	def maybe_recycle(cls, crawler):
+		"""페이지 수/메모리 기준을 넘은 상주 크롤러의 브라우저를 재시작합니다."""
+		if not getattr(crawler, 'persistent', False) or crawler.browser is None:
+			return
+
+		reason = None
+		if cls.max_pages and crawler.pages_loaded >= cls.max_pages:
+			reason = f"페이지 로드 {crawler.pages_loaded}회"
+		else:
+			rss_mb = cls.rss_mb()
+			if cls.max_rss_mb and rss_mb >= cls.max_rss_mb:
+				reason = f"RSS {rss_mb:.0f}MB"
+
+		if reason:
+			print(f"[{crawler.company}] ♻️ 브라우저 재시작 ({reason})")
+			crawler._close_driver()
+			crawler.pages_loaded = 0
+
+	@staticmethod
+	def rss_mb() -> float:
+		"""워커 프로세스와 하위 프로세스(Chromium)의 RSS 합계 (MB)"""
+		try:
+			process = psutil.Process()
+			total = process.memory_info().rss
+			for child in process.children(recursive=True):
+				try:
+					total += child.memory_info().rss
+				except psutil.Error:
+					continue
+			return total / (1024 * 1024)
+		except psutil.Error:
+			return 0.0
+
+	@classmethod
+	def _is_runtime_thread(cls, company: str) -> bool:
+		return cls._started and threading.current_thread().name.startswith(f"crawler-{company}")
+
+	@staticmethod
+	def _report_warm_up(futures):
+		for company, future in futures.items():
+			try:
+				future.result()
+			except Exception as e:
+				# 예열 실패는 치명적이지 않음 - 첫 페이지 로드 때 다시 초기화됨
+				print(f"[{company}] 크롤러 예열 실패: {e}")
+		print(f"🔥 크롤러 런타임 준비 완료: {', '.join(futures.keys())}")
+
+	@classmethod
+	def _warm_up(cls, company: str):
+		crawler = cls.acquire(company)
+		crawler._init_driver()
+
+	@classmethod
+	def _shutdown_crawler(cls, company: str):
+		crawler = cls._crawlers.pop(company, None)
+		if crawler is not None:
+			crawler._close_driver()
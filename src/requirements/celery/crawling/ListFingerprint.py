@@ -0,0 +1,82 @@
+import os
+import hashlib
+import threading
+import requests
+from bs4 import BeautifulSoup
+from typing import List, Optional
+from .utils import load_json_state, save_json_state
+
+
+class ListFingerprint(object):
+	"""
+	하위 카테고리 첫 페이지의 기사 링크 집합을 해시로 저장하고,
+	직전 실행과 비교하여 변경이 없는 하위 카테고리를 건너뛸 수 있게 합니다.
+
+	- 빠른 확인은 Chromium 없이 requests + BeautifulSoup로 수행합니다.
+	- 링크를 하나도 추출하지 못한 경우(JS 렌더링 페이지 등)는 항상 '변경됨'으로 간주합니다.
+	- 지문은 하위 카테고리 크롤링이 끝난 뒤에만 저장하므로, 실패한 실행이 지문을 갱신하지 않습니다.
+	"""
+
+	# 회사별 크롤링이 스레드 풀에서 동시에 실행되므로 파일 접근을 직렬화
+	_lock = threading.Lock()
+
+	# 지문 저장 파일 경로 (워커와 비트가 공유하는 /code 디렉토리 기준)
+	path = os.environ.get('CRAWL_FINGERPRINT_PATH', 'list_fingerprints.json')
+
+	user_agent = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36'
+
+	@staticmethod
+	def key(company: str, category: str, sub_category: str) -> str:
+		return f"{company}|{category}|{sub_category}"
+
+	@staticmethod
+	def digest(links: List[str]) -> str:
+		"""링크 집합의 순서와 무관한 SHA-256 지문을 계산합니다."""
+		joined = "\n".join(sorted(set(links)))
+		return hashlib.sha256(joined.encode('utf-8')).hexdigest()
+
+	@classmethod
+	def fetch_links(cls, page_url: str, article_list_selector: str) -> List[str]:
+		"""목록 페이지를 가볍게 요청하여 기사 링크(href) 목록을 추출합니다."""
+		try:
+			response = requests.get(page_url, headers={'User-Agent': cls.user_agent}, timeout=10)
+			if response.status_code != 200:
+				print(f"목록 지문 확인 실패 - HTTP 상태: {response.status_code} ({page_url})")
+				return []
+			soup = BeautifulSoup(response.content, 'html.parser')
+			return [a.get('href') for a in soup.select(article_list_selector) if a.get('href')]
+		except Exception as e:
+			print(f"목록 지문 확인 중 오류: {e} ({page_url})")
+			return []
+
+	@classmethod
+	def check(cls, company: str, category: str, sub_category: str, page_url: str, article_list_selector: str) -> Optional[str]:
+		"""
+		첫 페이지 링크 집합의 지문을 계산하여 직전 실행과 비교합니다.
+
+		Returns:
+			변경이 없으면 None, 변경되었거나 확인할 수 없으면 새 지문(확인 불가 시 빈 문자열)
+		"""
+		links = cls.fetch_links(page_url, article_list_selector)
+		if not links:
+			return ""
+
+		fingerprint = cls.digest(links)
+		with cls._lock:
+			previous = load_json_state(cls.path).get(cls.key(company, category, sub_category))
+		if previous == fingerprint:
+			return None
+		return fingerprint
+
+	@classmethod
+	def commit(cls, company: str, category: str, sub_category: str, fingerprint: str):
+		"""하위 카테고리 크롤링이 끝난 뒤 지문을 저장합니다."""
+		if not fingerprint:
+			return
+		with cls._lock:
+			data = load_json_state(cls.path)
+			data[cls.key(company, category, sub_category)] = fingerprint
+			try:
+				save_json_state(cls.path, data)
+			except Exception as e:
+				print(f"지문 파일 저장 실패: {e}")
@@ -1,4 +1,5 @@
 import requests
+from requests.adapters import HTTPAdapter
 import bs4
 from bs4 import BeautifulSoup
 
@@ -8,6 +9,20 @@ from datetime import datetime
 import time
 import re  # 정규표현식 사용을 위한 임포트
 
+# 워커 프로세스 수명 동안 재사용하는 HTTP 커넥션 풀 (신문사별 keep-alive 연결 유지)
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=8))
+_session.mount('http://', HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
+# 미리 컴파일한 추출 정규표현식
+VALID_TITLE_PREFIXES = [
+	re.compile(r'^\[\s*속보\s*\]'),
+	re.compile(r'^\[\s*단독\s*\]')
+]
+SEKYE_DATE_PATTERN = re.compile(r'입력\s*:\s*(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})')
+CHOSUN_DATE_PATTERN = re.compile(r'업데이트\s*(\d{4}.\d{2}.\d{2}.\s+\d{2}:\d{2})')
+MUNHWA_DATE_PATTERN = re.compile(r'입력\s*(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})')
+
 class NewsArticleCrawler(object):
 	playwright = None
 	browser = None
@@ -37,13 +52,8 @@ class NewsArticleCrawler(object):
 			return True
 			
 		# [속보], [단독], [ 속보 ], [ 단독 ] 패턴 확인
-		valid_prefixes = [
-			r'^\[\s*속보\s*\]',
-			r'^\[\s*단독\s*\]'
-		]
-		
-		for pattern in valid_prefixes:
-			if re.match(pattern, title_stripped):
+		for pattern in VALID_TITLE_PREFIXES:
+			if pattern.match(title_stripped):
 				return True
 				
 		# 기타 [<텍스트>] 패턴 (유효하지 않음)
@@ -76,7 +86,7 @@ class NewsArticleCrawler(object):
 
 	@classmethod
 	def __get_soup(cls, url):
-		html = requests.get(url)
+		html = _session.get(url, timeout=30)
 		if html.status_code != 200:
 			raise requests.exceptions.HTTPError()
 		soup = BeautifulSoup(html.content, 'html.parser')
@@ -149,8 +159,7 @@ class NewsArticleCrawler(object):
 		date_info = ""
 		if selector2:  # 요소가 존재하는지 확인
 			date_str = [child for child in selector2[0].children][0]
-			pattern = r'입력\s*:\s*(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})'
-			match = re.search(pattern, date_str)
+			match = SEKYE_DATE_PATTERN.search(date_str)
 			if match:
 				date_info = match.group(1)
 		else:
@@ -204,8 +213,7 @@ class NewsArticleCrawler(object):
 
 			if date_select and len(date_select) > 0:
 				date_text = date_select[0].inner_text()
-				pattern3 = r'업데이트\s*(\d{4}.\d{2}.\d{2}.\s+\d{2}:\d{2})'
-				match3 = re.search(pattern3, date_text)
+				match3 = CHOSUN_DATE_PATTERN.search(date_text)
 				if match3:
 					date = match3.group(1)
 			else:
@@ -284,8 +292,7 @@ class NewsArticleCrawler(object):
 		# --- 작성일자 추출 ---
 		if selector2:  # 요소가 존재하는지 확인
 			date_string = selector2[0].text
-			pattern3 = r'입력\s*(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})'
-			match3 = re.search(pattern3, date_string)
+			match3 = MUNHWA_DATE_PATTERN.search(date_string)
 			if match3:
 				date = match3.group(1)
 		else:
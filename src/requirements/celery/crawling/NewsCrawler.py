@@ -1,6 +1,10 @@
 from typing import List, Union, Optional, Dict, Any
-from .company import companys
+from .company import companys, crawl_targets
 from .NewsArticleCrawler import NewsArticleCrawler
+from .ListFingerprint import ListFingerprint
+from .YieldScheduler import YieldScheduler
+from .CrawlFrontier import CrawlFrontier
+from .CrawlerRuntime import CrawlerRuntime
 from .utils import parse_datetime, extract_text
 from playwright.sync_api import sync_playwright, Page, Browser, Playwright
 import datetime
@@ -8,6 +12,10 @@ from time import sleep
 from datetime import datetime
 import asyncio
 import time
+import os
+
+# 새 하위 카테고리를 시작할 수 있는 시간 예산 (초, 소프트 제한 40분보다 여유 있게)
+CRAWL_TIME_BUDGET = float(os.environ.get('CRAWL_TIME_BUDGET', 2100))
 
 class NewsCrawler(object):
 	"""각 인스턴스가 자체 Playwright 브라우저를 가지는 크롤러"""
@@ -18,6 +26,9 @@ class NewsCrawler(object):
 		self.browser = None
 		self.page = None
 		self.company = company
+		# 브라우저 재시작 기준 판단용 페이지 로드 수 / 워커 상주 여부 (CrawlerRuntime)
+		self.pages_loaded = 0
+		self.persistent = False
 
 	def _init_driver(self):
 		"""Playwright 초기화 (인스턴스별로)"""
@@ -81,7 +92,10 @@ class NewsCrawler(object):
 		"""
 		try:
 			print(f"[{self.company}] 페이지 로드 시작: {url}")
+			# 상주 브라우저가 페이지 수/메모리 기준을 넘었으면 재시작
+			CrawlerRuntime.maybe_recycle(self)
 			self._init_driver()
+			self.pages_loaded += 1
 			
 			# 페이지 로드 시도 (최대 5회 재시도)
 			retry_count = 0
@@ -181,10 +195,13 @@ class NewsCrawler(object):
 			raise
 
 	@staticmethod
-	def crawl_sync(company: str) -> Optional[List[Dict[str, Any]]]:
-		"""동기식 크롤링 메서드 - 각각의 회사마다 독립적인 인스턴스와 드라이버 사용"""
+	def crawl_sync(company: str, deadline: Optional[float] = None) -> Optional[List[Dict[str, Any]]]:
+		"""
+		동기식 크롤링 메서드 - 각각의 회사마다 독립적인 인스턴스와 드라이버 사용
+		deadline: 새 하위 카테고리를 시작하지 않을 시각 (time.time() 기준, None이면 제한 없음)
+		"""
 		print(f"[{company}] 크롤링 시작 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-		crawler = NewsCrawler(company)  # 회사별로 독립된 크롤러 인스턴스 생성
+		crawler = CrawlerRuntime.acquire(company)  # 회사별 크롤러 (워커 상주 런타임이 있으면 재사용)
 		try:
 			if not NewsCrawler.check_company(company):
 				raise ValueError("You should request one of limited company => \n \
@@ -203,125 +220,214 @@ class NewsCrawler(object):
 			# 카테고리 요청 사이의 대기 시간을 랜덤하게 설정하기 위한 변수
 			import random
 
-			for category, info in categories.items():
-				# 카테고리 간 랜덤 대기 시간 적용 (3-7초)
-				category_wait = 3 + random.random() * 4
-				print(f"[{company}] 카테고리 '{category}' 크롤링 시작 (대기 시간: {category_wait:.1f}초)")
-				time.sleep(category_wait)
-
-				for sub_category, sub_path in info['sub'].items():
-					# 하위 카테고리 간 랜덤 대기 시간 적용 (1-3초)
-					sub_category_wait = 1 + random.random() * 2
-					print(f"[{company}] 하위 카테고리 '{sub_category}' 크롤링 시작 (대기 시간: {sub_category_wait:.1f}초)")
-					time.sleep(sub_category_wait)
+			# 이전 실행(죽은 워커 포함)에서 남은 대기/만료 임대 URL부터 처리
+			owner = CrawlFrontier.worker_id(company)
+			NewsCrawler._drain_frontier(company, owner, result, deadline)
+
+			# 발행률 기반 실행 계획 - 주기가 도래한 하위 카테고리만, 예상 수확량 내림차순
+			planned_at = time.time()
+			plan = YieldScheduler.plan(company, categories)
+			print(f"[{company}] 실행 계획: {len(plan)}개 하위 카테고리")
+			current_category = None
+
+			for category, sub_category in plan:
+				# 시간 예산을 넘기면 남은(수확량이 낮은) 하위 카테고리는 다음 실행으로 미룸
+				if deadline is not None and time.time() >= deadline:
+					print(f"[{company}] 시간 예산 초과 - 남은 하위 카테고리 건너뜀")
+					break
+
+				info = categories[category]
+				sub_path = info['sub'][sub_category]
+
+				if category != current_category:
+					current_category = category
+					# 카테고리 간 랜덤 대기 시간 적용 (3-7초)
+					category_wait = 3 + random.random() * 4
+					print(f"[{company}] 카테고리 '{category}' 크롤링 시작 (대기 시간: {category_wait:.1f}초)")
+					time.sleep(category_wait)
+
+				# 하위 카테고리 간 랜덤 대기 시간 적용 (1-3초)
+				sub_category_wait = 1 + random.random() * 2
+				print(f"[{company}] 하위 카테고리 '{sub_category}' 크롤링 시작 (대기 시간: {sub_category_wait:.1f}초)")
+				time.sleep(sub_category_wait)
+
+				page_no = 1 - (company == '세계일보')
+				is_today = True
+
+				# 첫 페이지 링크 집합이 직전 실행과 같으면 하위 카테고리 전체를 건너뜀
+				first_page_url = f"{domain}{info['path']}{sub_path}?page={page_no}"
+				fingerprint = ListFingerprint.check(company, category, sub_category, first_page_url, article_list_selector)
+				if fingerprint is None:
+					print(f"[{company}] {category}-{sub_category}: 목록 변경 없음 - 건너뜀")
+					YieldScheduler.mark_crawled(company, category, sub_category, planned_at)
+					continue
+
+				while is_today:
+					# 페이지 요청 전 잠시 대기 (1-2초)
+					page_wait = 1 + random.random()
+					time.sleep(page_wait)
 					
-					page_no = 1 - (company == '세계일보')
-					is_today = True
+					print(f"[{company}] {category}-{sub_category} 카테고리의 page={page_no}")
+					page_url = f"{domain}{info['path']}{sub_path}?page={page_no}"
+					for item_idx in range(items_count):
+						# 페이지 로드 대기
+						crawler._load_page(page_url)
+						sleep(2)
+						# 기사 목록 접근
+						article_list_elements = crawler.page.query_selector_all(article_list_selector)
+
+						if not article_list_elements:
+							print(f"{page_url} 페이지의 CSS 셀렉터 - {article_list_selector} HTML 요소를 접근할 수 없습니다.")
+							continue
+
+						leased_url = None
+						try:
+							# 인덱스가 범위를 벗어나지 않는지 확인
+							if item_idx < len(article_list_elements):
+								item_element = article_list_elements[item_idx]
+							else:
+								print(f"인덱스 {item_idx}가 범위를 벗어납니다. 총 {len(article_list_elements)}개 항목이 있습니다.")
+								continue
+								
+							# href 속성 가져오기
+							href = item_element.get_attribute('href')
 
-					while is_today:
-						# 페이지 요청 전 잠시 대기 (1-2초)
-						page_wait = 1 + random.random()
-						time.sleep(page_wait)
-						
-						print(f"[{company}] {category}-{sub_category} 카테고리의 page={page_no}")
-						page_url = f"{domain}{info['path']}{sub_path}?page={page_no}"
-						for item_idx in range(items_count):
-							# 페이지 로드 대기
-							crawler._load_page(page_url)
-							sleep(2)
-							# 기사 목록 접근
-							article_list_elements = crawler.page.query_selector_all(article_list_selector)
-
-							if not article_list_elements:
-								print(f"{page_url} 페이지의 CSS 셀렉터 - {article_list_selector} HTML 요소를 접근할 수 없습니다.")
+							if not href:
+								print(f"No href found at index {item_element}")
 								continue
 
-							try:
-								# 인덱스가 범위를 벗어나지 않는지 확인
-								if item_idx < len(article_list_elements):
-									item_element = article_list_elements[item_idx]
-								else:
-									print(f"인덱스 {item_idx}가 범위를 벗어납니다. 총 {len(article_list_elements)}개 항목이 있습니다.")
-									continue
-									
-								# href 속성 가져오기
-								href = item_element.get_attribute('href')
-
-								if not href:
-									print(f"No href found at index {item_element}")
-									continue
-
-								# 상대 경로 처리
-								if href.startswith('/'):
-									article_url = f"{domain}{href}"
-								else:
-									article_url = href
-
-								print(f"Found article URL: {article_url}")
-								
-								# 기사 요청 간 랜덤 대기 시간 적용 (3-7초)
-								import random
-								article_wait = 3 + random.random() * 4
-								print(f"[{company}] 기사 접근 전 {article_wait:.1f}초 대기...")
-								sleep(article_wait)
-
-								# ----------------------------------
-								# 😀 여기서 NewsArticleCrawler 활용!
-								# ----------------------------------
-								title, date, content = NewsArticleCrawler.crawl(company, article_url)
-
-								if (title == "" or date == "" or content == ""):
-									continue
-
-								# 날짜가 오늘인지 확인
-								today = datetime.now().date()
-								article_date = None
-
-								# 문자열 형태의 날짜를 datetime 객체로 변환
-								try:
-									# date 문자열을 datetime 객체로 변환 (utils.parse_datetime 함수 활용)
-									article_date = parse_datetime(date).date() if date else None
-								except Exception as e:
-									print(f"날짜 변환 중 오류: {e}")
-
-								# 오늘 날짜가 아닌 경우 출력
-								is_today = article_date == today if article_date else False
-								if not is_today:
-									print(f"⚠️ 오늘 날짜({today})가 아닌 기사입니다: {article_date}")
+							# 상대 경로 처리
+							if href.startswith('/'):
+								article_url = f"{domain}{href}"
+							else:
+								article_url = href
+
+							print(f"Found article URL: {article_url}")
+
+							# 프런티어 임대 - 다른 워커가 처리 중이거나 이미 수집된 URL은 건너뜀
+							lease, done_published = CrawlFrontier.acquire(company, category, sub_category, article_url, owner)
+							if lease == CrawlFrontier.BUSY:
+								print(f"[{company}] 다른 워커가 처리 중인 기사: {article_url}")
+								continue
+							if lease == CrawlFrontier.DONE:
+								# 이미 수집된 기사는 저장된 게시일시로 오늘 기사인지만 판단
+								if done_published and done_published.date() != datetime.now().date():
+									is_today = False
 									break
+								continue
+							leased_url = article_url
+
+							# 기사 요청 간 랜덤 대기 시간 적용 (3-7초)
+							import random
+							article_wait = 3 + random.random() * 4
+							print(f"[{company}] 기사 접근 전 {article_wait:.1f}초 대기...")
+							sleep(article_wait)
+
+							# ----------------------------------
+							# 😀 여기서 NewsArticleCrawler 활용!
+							# ----------------------------------
+							title, date, content = NewsArticleCrawler.crawl(company, article_url)
+
+							if (title == "" or date == "" or content == ""):
+								CrawlFrontier.complete(article_url, owner)
+								leased_url = None
+								continue
 
-								# 결과 객체에 추가
-								article_data = {
-									'title': title,
-									'content': content,
-									'category': category,
-									'sub_category': sub_category,
-									'published': date,
-									'company': company,
-									'news_url': article_url,
-								}
-								print(f"✅ 제목: {title}, 작성일자: {date}, 기사 URL: {article_url}")
-								result.append(article_data)
+							# 날짜가 오늘인지 확인
+							today = datetime.now().date()
+							article_date = None
 
+							# 문자열 형태의 날짜를 datetime 객체로 변환
+							try:
+								# date 문자열을 datetime 객체로 변환 (utils.parse_datetime 함수 활용)
+								article_date = parse_datetime(date).date() if date else None
 							except Exception as e:
-								print(f"기사 {page_url} 처리 중 에러: {e}")
-								continue
-						page_no += 1
-			crawler._close_driver()
+								print(f"날짜 변환 중 오류: {e}")
+
+							# 오늘 날짜가 아닌 경우 출력
+							is_today = article_date == today if article_date else False
+							CrawlFrontier.complete(article_url, owner, parse_datetime(date))
+							leased_url = None
+							if not is_today:
+								print(f"⚠️ 오늘 날짜({today})가 아닌 기사입니다: {article_date}")
+								break
+
+							# 결과 객체에 추가
+							article_data = {
+								'title': title,
+								'content': content,
+								'category': category,
+								'sub_category': sub_category,
+								'published': date,
+								'company': company,
+								'news_url': article_url,
+							}
+							print(f"✅ 제목: {title}, 작성일자: {date}, 기사 URL: {article_url}")
+							result.append(article_data)
+
+						except Exception as e:
+							print(f"기사 {page_url} 처리 중 에러: {e}")
+							# 처리 중 실패한 기사는 임대를 반납하여 재시도 대상으로 되돌림
+							if leased_url:
+								CrawlFrontier.release(leased_url, owner)
+							continue
+					page_no += 1
+
+				# 하위 카테고리 크롤링 완료 후 지문 및 방문 시각 저장
+				ListFingerprint.commit(company, category, sub_category, fingerprint)
+				YieldScheduler.mark_crawled(company, category, sub_category, planned_at)
 			return result
 
 		except ValueError as v_err:
 			print(v_err)
 		except Exception as ex:
 			print(f"크롤링 중 에러: {ex}")
+			# 오류 후 브라우저 상태를 신뢰할 수 없으므로 상주 크롤러도 닫고 다음 로드 때 다시 띄움
+			crawler._close_driver()
 		finally:
-			# 드라이버 종료
+			# 드라이버 반납 (상주 크롤러는 유지, 그 외에는 종료)
 			if (crawler):
-				crawler._close_driver()
+				CrawlerRuntime.release(crawler)
+
+	@staticmethod
+	def _drain_frontier(company: str, owner: str, result: List[Dict[str, Any]], deadline: Optional[float] = None, batch_size: int = 20):
+		"""프런티어에서 대기 중이거나 임대가 만료된 기사 URL을 배치로 임대하여 수집합니다."""
+		while deadline is None or time.time() < deadline:
+			entries = CrawlFrontier.claim(company, owner, batch_size)
+			if not entries:
+				return
+			print(f"[{company}] 프런티어에서 {len(entries)}개 기사 임대")
+
+			for entry in entries:
+				article_url = entry['news_url']
+				try:
+					title, date, content = NewsArticleCrawler.crawl(company, article_url)
+					if (title == "" or date == "" or content == ""):
+						CrawlFrontier.complete(article_url, owner)
+						continue
+
+					CrawlFrontier.complete(article_url, owner, parse_datetime(date))
+					result.append({
+						'title': title,
+						'content': content,
+						'category': entry['category'],
+						'sub_category': entry['sub_category'],
+						'published': date,
+						'company': company,
+						'news_url': article_url,
+					})
+					print(f"✅ (프런티어) 제목: {title}, 작성일자: {date}, 기사 URL: {article_url}")
+				except Exception as e:
+					print(f"프런티어 기사 {article_url} 처리 중 에러: {e}")
+					CrawlFrontier.release(article_url, owner)
 
 	@staticmethod
 	def to_csv_sync(file_path: str, json_data: List[Dict[str, Any]]):
-		"""동기식 CSV 작성 메서드"""
+		"""
+		동기식 CSV 작성 메서드
+		프런티어(POSTGRES_URL)를 사용하면 crawl_sync는 이번 실행에서 새로 수집한 기사만 반환하므로
+		파일에는 누적 목록이 아니라 이번 실행분만 기록됩니다 (이전 실행까지의 기사는 DB의 news 테이블 기준).
+		"""
 		import csv
 		try:
 			with open(file_path, mode='w', newline='', encoding="utf-8-sig") as file:
@@ -353,27 +459,28 @@ class AsyncNewsCrawler:
     """회사별로 별도의 드라이버를 사용하는 비동기 크롤러"""
     
     @staticmethod
-    async def crawl_company(company_name):
+    async def crawl_company(company_name, deadline=None):
         """회사별 크롤링 작업을 비동기적으로 실행"""
         print(f"🚀 {company_name} 크롤링 시작...")
         
         try:
             # 비동기 작업을 이벤트 루프의 스레드 풀에서 실행
             # Playwright sync API는 비동기가 아니므로 run_in_executor로 별도 스레드에서 실행
+            # 워커 상주 런타임이 있으면 브라우저를 띄워 둔 회사 전용 스레드에서 실행
             loop = asyncio.get_running_loop()
             
             print(f"⏳ {company_name}: 스레드 풀 작업 시작...")
             result = await asyncio.wait_for(
                 loop.run_in_executor(
-                    None, 
-                    lambda: NewsCrawler.crawl_sync(company_name)
+                    CrawlerRuntime.executor(company_name),
+                    lambda: NewsCrawler.crawl_sync(company_name, deadline)
                 ),
                 timeout=2700  # 45분 타임아웃 설정
             )
             print(f"✓ {company_name}: 스레드 풀 크롤링 작업 완료")
             
             if result:
-                # CSV 작성도 스레드 풀에서 실행
+                # CSV 작성도 스레드 풀에서 실행 (프런티어 사용 시 이번 실행에서 새로 수집한 기사만 기록)
                 print(f"📝 {company_name}: CSV 파일 작성 시작...")
                 await loop.run_in_executor(
                     None,
@@ -401,16 +508,18 @@ async def crawl_all_company_articles():
     print("==========================================================\n")
     
 	# "조선일보", "중앙일보", "문화일보"
-    companys_name = ["한국경제", "세계일보", "중앙일보", "문화일보"]
+    companys_name = list(crawl_targets)
     print(f"크롤링 대상 회사: {', '.join(companys_name)}")
     
     start_time = time.time()
+
+    deadline = start_time + CRAWL_TIME_BUDGET
     
     try:
         # 각 회사별로 별도의 AsyncNewsCrawler 인스턴스로 비동기 실행
         # gather 대신 as_completed 사용하여 완료되는 순서대로 결과 수집
         tasks = {
-            asyncio.create_task(AsyncNewsCrawler.crawl_company(company_name), name=company_name): company_name
+            asyncio.create_task(AsyncNewsCrawler.crawl_company(company_name, deadline), name=company_name): company_name
             for company_name in companys_name
         }
         
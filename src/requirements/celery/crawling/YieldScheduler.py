@@ -0,0 +1,122 @@
+import os
+import time
+import threading
+from typing import Dict, List, Tuple
+from sqlalchemy import text
+from .db import get_engine
+from .utils import load_json_state, save_json_state
+
+
+class YieldScheduler(object):
+	"""
+	(신문사, 하위 카테고리)별 기사 발행률을 news.published 이력으로부터 학습하여
+	크롤링 주기와 순서를 결정하는 스케줄러
+
+	- 발행률(건/시간)이 높은 섹션은 자주, 낮은 섹션은 드물게 방문합니다.
+	- 실행 계획은 예상 신규 기사 수(발행률 x 마지막 방문 이후 경과 시간) 내림차순으로 정렬되어,
+	  시간 예산이 부족한 실행에서도 수확이 큰 섹션부터 처리됩니다.
+	- DB를 사용할 수 없거나 이력이 없으면 모든 섹션을 매 실행마다 방문합니다(기존 동작).
+	"""
+
+	_lock = threading.Lock()
+
+	# 마지막 방문 시각 저장 파일
+	path = os.environ.get('CRAWL_SCHEDULE_PATH', 'crawl_schedule.json')
+
+	# 발행률 학습에 사용할 기간 (시간)
+	lookback_hours = float(os.environ.get('CRAWL_RATE_LOOKBACK_HOURS', 24 * 7))
+	# 한 번 방문할 때 기대하는 신규 기사 수 - 방문 주기 = target / 발행률
+	target_articles = float(os.environ.get('CRAWL_TARGET_ARTICLES', 3))
+	# 방문 주기 하한/상한 (초) - 하한은 beat 스케줄 간격과 맞춤
+	min_interval = float(os.environ.get('CRAWL_MIN_INTERVAL', 3600))
+	max_interval = float(os.environ.get('CRAWL_MAX_INTERVAL', 86400))
+
+	# 발행률 캐시 (동시에 실행되는 회사별 크롤링이 공유, 10분간 재사용)
+	_rates: Dict[Tuple[str, str, str], float] = {}
+	_rates_loaded_at = 0.0
+
+	@staticmethod
+	def key(company: str, category: str, sub_category: str) -> str:
+		return f"{company}|{category}|{sub_category}"
+
+	@classmethod
+	def load_rates(cls) -> Dict[Tuple[str, str, str], float]:
+		"""최근 lookback_hours 동안의 (신문사, 카테고리, 하위 카테고리)별 시간당 발행 건수를 조회합니다."""
+		with cls._lock:
+			if cls._rates and time.time() - cls._rates_loaded_at < 600:
+				return cls._rates
+
+			engine = get_engine()
+			if engine is None:
+				return {}
+
+			try:
+				with engine.connect() as conn:
+					rows = conn.execute(
+						text(
+							"SELECT company, category, sub_category, count(*) AS cnt "
+							"FROM news "
+							"WHERE published >= now() - make_interval(hours => :hours) "
+							"GROUP BY company, category, sub_category"
+						),
+						{"hours": int(cls.lookback_hours)}
+					).fetchall()
+			except Exception as e:
+				print(f"발행률 조회 실패 (고정 주기로 동작): {e}")
+				return {}
+
+			cls._rates = {(row.company, row.category, row.sub_category): row.cnt / cls.lookback_hours for row in rows}
+			cls._rates_loaded_at = time.time()
+			return cls._rates
+
+	@classmethod
+	def interval(cls, rate: float) -> float:
+		"""발행률(건/시간)에 따른 방문 주기(초)를 계산합니다."""
+		if rate <= 0:
+			return cls.max_interval
+		seconds = cls.target_articles / rate * 3600
+		return min(max(seconds, cls.min_interval), cls.max_interval)
+
+	@classmethod
+	def plan(cls, company: str, categories: dict) -> List[Tuple[str, str]]:
+		"""
+		이번 실행에서 방문할 (카테고리, 하위 카테고리) 목록을 예상 수확량 내림차순으로 반환합니다.
+		"""
+		rates = cls.load_rates()
+		with cls._lock:
+			last_crawled = load_json_state(cls.path)
+		now = time.time()
+
+		# 이력이 전혀 없으면 모든 섹션을 사전 순서대로 방문
+		if not rates:
+			return [(category, sub_category) for category, info in categories.items() for sub_category in info['sub']]
+
+		scored = []
+		for category, info in categories.items():
+			for sub_category in info['sub']:
+				rate = rates.get((company, category, sub_category), 0.0)
+				last = last_crawled.get(cls.key(company, category, sub_category))
+				elapsed = now - last if last else cls.max_interval
+				# 발행률 주기가 아직 지나지 않은 섹션은 건너뜀
+				# (실행 간격은 beat 주기 단위이므로 beat 주기의 절반까지는 앞당겨 방문 - 시작 지연/대기열 대기 흡수)
+				if elapsed < cls.interval(rate) - cls.min_interval / 2:
+					continue
+				scored.append((rate * elapsed / 3600, category, sub_category))
+
+		scored.sort(key=lambda item: item[0], reverse=True)
+		return [(category, sub_category) for _, category, sub_category in scored]
+
+	@classmethod
+	def mark_crawled(cls, company: str, category: str, sub_category: str, crawled_at: float):
+		"""
+		하위 카테고리 방문 시각을 기록합니다.
+		crawled_at은 이번 실행 계획을 세운 시각으로, 완료 시각을 쓰면 실행 후반에 끝난 섹션이
+		다음 실행에서 아직 주기가 안 된 것으로 판단되어 한 번씩 건너뛰게 됩니다.
+		"""
+		with cls._lock:
+			data = load_json_state(cls.path)
+			data[cls.key(company, category, sub_category)] = crawled_at
+			try:
+				save_json_state(cls.path, data)
+			except Exception as e:
+				print(f"스케줄 파일 저장 실패: {e}")
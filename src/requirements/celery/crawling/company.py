@@ -1,3 +1,5 @@
+import os
+
 company_to_idx = {
 	'한국경제': 0,
 	'세계일보': 1,
@@ -7,6 +9,9 @@ company_to_idx = {
 	'문화일보': 5
 }
 
+# 크롤링 대상 신문사 (조선일보는 보류)
+crawl_targets = ['한국경제', '세계일보', '중앙일보', '문화일보']
+
 companys = {
 	'한국경제': {
 		'domain': 'https://www.hankyung.com',
@@ -235,4 +240,20 @@ companys = {
 			}
 		}
 	}
-}
\ No newline at end of file
+}
+
+# 모의 뉴스 서버 경로에 사용하는 신문사별 식별자
+company_slugs = {
+	'한국경제': 'hankyung',
+	'세계일보': 'segye',
+	'조선일보': 'chosun',
+	'중앙일보': 'joongang',
+	'문화일보': 'munhwa'
+}
+
+# 크롤링 대상 도메인 재정의 (로컬 모의 뉴스 서버 부하 테스트용)
+# 예) CRAWL_BASE_URL=http://localhost:8088 -> 한국경제 도메인은 http://localhost:8088/hankyung
+_base_url = os.environ.get('CRAWL_BASE_URL')
+if _base_url:
+	for _company, _slug in company_slugs.items():
+		companys[_company]['domain'] = f"{_base_url.rstrip('/')}/{_slug}"
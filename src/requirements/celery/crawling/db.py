@@ -0,0 +1,24 @@
+import os
+import threading
+from typing import Optional
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+# 백엔드와 같은 PostgreSQL을 사용 (docker-compose .env의 POSTGRES_URL)
+SQLALCHEMY_DATABASE_URL = os.environ.get('POSTGRES_URL')
+
+_engine: Optional[Engine] = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> Optional[Engine]:
+    """
+    크롤러용 SQLAlchemy 엔진을 지연 생성하여 반환합니다.
+    POSTGRES_URL이 설정되지 않은 경우 None을 반환합니다.
+    """
+    global _engine
+    if _engine is None and SQLALCHEMY_DATABASE_URL:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_engine(SQLALCHEMY_DATABASE_URL, pool_pre_ping=True)
+    return _engine
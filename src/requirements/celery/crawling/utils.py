@@ -1,5 +1,7 @@
 from typing import List
+import os
 import re
+import json
 from datetime import datetime
 
 def extract_text(element, all_texts):
@@ -74,6 +76,31 @@ def parse_datetime(datetime_string: str) -> datetime:
     return datetime.now()
 
 
+def load_json_state(path: str) -> dict:
+    """
+    크롤러 상태 JSON 파일을 읽습니다.
+    파일이 없거나 손상된 경우 빈 딕셔너리를 반환합니다.
+    """
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, mode='r', encoding='utf-8') as file:
+            return json.load(file)
+    except Exception as e:
+        print(f"상태 파일 읽기 실패 (무시하고 새로 작성): {path} - {e}")
+        return {}
+
+
+def save_json_state(path: str, data: dict):
+    """
+    크롤러 상태 JSON 파일을 원자적으로(임시 파일 후 교체) 저장합니다.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, mode='w', encoding='utf-8') as file:
+        json.dump(data, file, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
 if __name__ == "__main__":
     dt = parse_datetime("2025.05.23. 12:34")
     dt_now = datetime.now().date()
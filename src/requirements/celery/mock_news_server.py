@@ -0,0 +1,321 @@
+"""
+로컬 모의 뉴스 사이트 서버 (크롤러 종단간 부하 테스트용)
+
+실제 신문사에 요청하지 않고 crawl_all_company_articles를 끝까지 실행해 보기 위한 서버입니다.
+crawling/company.py의 각 신문사를 /<slug> 경로 아래에 실제와 같은 URL 형태로 제공합니다.
+
+- 목록 페이지: /<slug><카테고리 path><하위 path>?page=N
+- 기사 페이지: /hankyung/article/<id>, /segye/newsView/<id>, /joongang/article/<id>, /munhwa/article/<id>
+
+페이지는 기본적으로 각 신문사의 CSS 셀렉터 구조를 그대로 따르는 합성 HTML이며,
+--record-dir를 지정하면 녹화된 페이지를 우선 제공합니다(--record 모드에서는 실제 사이트를 한 번 받아 저장).
+
+사용 예:
+    python mock_news_server.py --port 8088 --latency-ms 80 --error-rate 0.01 --rate-429 0.02
+    CRAWL_BASE_URL=http://localhost:8088 python -m crawling.NewsCrawler
+
+통계: GET /__stats (요청 수, 상태 코드별 응답 수, 경과 시간, 초당 요청 수)
+"""
+import os
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+import urllib.request
+from urllib.parse import urlsplit, parse_qs
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from crawling.company import companys, company_slugs, crawl_targets
+
+# 기사 URL 경로 접두사 (실제 사이트와 동일)
+ARTICLE_PREFIX = {
+    'hankyung': '/article/',
+    'segye': '/newsView/',
+    'joongang': '/article/',
+    'munhwa': '/article/',
+}
+
+# 하위 카테고리 하나에 허용하는 최대 기사 수 (기사 id = 섹션 번호 * SECTION_SPAN + 순번)
+SECTION_SPAN = 100000
+
+# 원본 도메인 (CRAWL_BASE_URL 재정의와 무관하게 녹화 모드에서 사용)
+REAL_DOMAINS = {
+    'hankyung': 'https://www.hankyung.com',
+    'segye': 'https://www.segye.com',
+    'joongang': 'https://www.joongang.co.kr',
+    'munhwa': 'https://www.munhwa.com',
+}
+
+
+class MockConfig(object):
+    latency_ms = 50.0
+    jitter_ms = 50.0
+    error_rate = 0.0
+    rate_429 = 0.0
+    articles_per_day = 15
+    record_dir = None
+    record = False
+
+
+class Stats(object):
+    _lock = threading.Lock()
+    started_at = time.time()
+    requests = 0
+    by_status = {}
+
+    @classmethod
+    def add(cls, status):
+        with cls._lock:
+            cls.requests += 1
+            cls.by_status[status] = cls.by_status.get(status, 0) + 1
+
+    @classmethod
+    def snapshot(cls):
+        with cls._lock:
+            elapsed = time.time() - cls.started_at
+            return {
+                'requests': cls.requests,
+                'by_status': {str(k): v for k, v in sorted(cls.by_status.items())},
+                'elapsed_seconds': round(elapsed, 2),
+                'requests_per_second': round(cls.requests / elapsed, 2) if elapsed else 0.0,
+            }
+
+
+def build_sections():
+    """slug별로 (목록 경로 -> (섹션 번호, 카테고리, 하위 카테고리)) 매핑을 만듭니다."""
+    sections = {}
+    for company in crawl_targets:
+        slug = company_slugs[company]
+        routes = {}
+        index = 0
+        for category, info in companys[company]['categories'].items():
+            for sub_category, sub_path in info['sub'].items():
+                routes[f"{info['path']}{sub_path}"] = (index, category, sub_category)
+                index += 1
+        sections[slug] = routes
+    return sections
+
+
+SECTIONS = build_sections()
+SLUG_TO_COMPANY = {slug: company for company, slug in company_slugs.items()}
+
+
+def published_at(item_no):
+    """
+    섹션 내 순번에 따른 게시일시
+    앞의 articles_per_day개는 오늘, 나머지는 어제 기사로 만들어 크롤러의 '오늘 기사' 종료 조건이 동작하게 합니다.
+    """
+    now = datetime.now().replace(microsecond=0)
+    today_start = now.replace(hour=0, minute=0, second=0)
+    per_day = max(MockConfig.articles_per_day, 1)
+    if item_no < per_day:
+        published = now - timedelta(minutes=item_no * (1440 // per_day))
+        return max(published, today_start + timedelta(seconds=per_day - item_no))
+    return today_start - timedelta(hours=1, minutes=item_no)
+
+
+def render_list(slug, section_no, page_no):
+    company = SLUG_TO_COMPANY[slug]
+    items = companys[company]['items']
+    first_page = 0 if slug == 'segye' else 1
+    start = (page_no - first_page) * items
+    links = []
+    for item_no in range(start, start + items):
+        article_id = section_no * SECTION_SPAN + item_no
+        href = f"{ARTICLE_PREFIX[slug]}{article_id}"
+        title = f"모의 기사 {article_id}"
+        if slug == 'hankyung':
+            links.append(f'<li><div class="news-item"><div class="text-cont"><h2 class="news-tit"><a href="{href}">{title}</a></h2></div></div></li>')
+        elif slug == 'segye':
+            links.append(f'<li><a href="{href}">{title}</a></li>')
+        elif slug == 'joongang':
+            links.append(f'<li class="card"><div class="card_body"><h2 class="headline"><a href="{href}">{title}</a></h2></div></li>')
+        else:
+            links.append(f'<div class="card-body"><h4 class="headline"><a href="{href}">{title}</a></h4></div>')
+
+    body = "".join(links)
+    if slug == 'hankyung':
+        body = f'<ul class="news-list">{body}</ul>'
+    elif slug == 'segye':
+        body = f'<div id="wps_layout1_box1"><ul>{body}</ul></div>'
+    elif slug == 'joongang':
+        body = f'<ul id="story_list">{body}</ul>'
+    else:
+        body = f'<div id="tab01">{body}</div>'
+    return f'<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"></head><body>{body}</body></html>'
+
+
+def render_article(slug, article_id):
+    item_no = article_id % SECTION_SPAN
+    published = published_at(item_no)
+    title = f"모의 기사 {article_id}"
+    paragraphs = [f"{title}의 {n + 1}번째 문단입니다. 정책 인사이트 부하 테스트용 본문입니다." for n in range(8)]
+    p_tags = "".join(f"<p>{p}</p>" for p in paragraphs)
+
+    if slug == 'hankyung':
+        text_nodes = "<br>".join(paragraphs)
+        body = (
+            f'<h1 class="headline">{title}</h1>'
+            f'<div class="datetime"><span class="item"><span class="txt-date">{published.strftime("%Y.%m.%d %H:%M")}</span></span></div>'
+            f'<div class="article-body-wrap"><div id="articletxt">{text_nodes}</div></div>'
+        )
+    elif slug == 'segye':
+        body = (
+            f'<section id="contTitle"><h3 id="title_sns">{title}</h3></section>'
+            f'<p class="viewInfo">입력 : {published.strftime("%Y-%m-%d %H:%M:%S")}<span> 수정 : -</span></p>'
+            f'<article class="viewBox2">{p_tags}</article>'
+        )
+    elif slug == 'joongang':
+        body = (
+            '<div id="container"><section><article><header>'
+            f'<h1>{title}</h1>'
+            f'<div class="datetime"><div><p><time datetime="{published.isoformat()}">{published.strftime("%Y.%m.%d %H:%M")}</time></p></div></div>'
+            '</header></article></section></div>'
+            f'<div id="article_body">{p_tags}</div>'
+        )
+    else:
+        body = (
+            f'<header class="article-header"><h1 class="title">{title}</h1></header>'
+            f'<p class="date-publish">입력 {published.strftime("%Y-%m-%d %H:%M")}</p>'
+            + "".join(f'<p class="text-l">{p}</p>' for p in paragraphs)
+        )
+    return f'<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"></head><body>{body}</body></html>'
+
+
+def recording_path(slug, path_and_query):
+    digest = hashlib.sha1(path_and_query.encode('utf-8')).hexdigest()
+    return os.path.join(MockConfig.record_dir, slug, f"{digest}.html")
+
+
+def load_recording(slug, path_and_query, host):
+    """녹화된 페이지를 반환합니다. --record 모드에서는 없으면 실제 사이트에서 받아 저장합니다."""
+    if not MockConfig.record_dir:
+        return None
+    path = recording_path(slug, path_and_query)
+    if not os.path.exists(path):
+        if not MockConfig.record:
+            return None
+        request = urllib.request.Request(f"{REAL_DOMAINS[slug]}{path_and_query}", headers={'User-Agent': 'Mozilla/5.0'})
+        with urllib.request.urlopen(request, timeout=30) as response:
+            content = response.read()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as file:
+            file.write(content)
+    with open(path, 'rb') as file:
+        content = file.read().decode('utf-8', errors='replace')
+    # 실제 도메인의 절대 링크를 모의 서버로 돌림
+    return content.replace(REAL_DOMAINS[slug], f"http://{host}/{slug}")
+
+
+class MockNewsHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        # 부하 테스트 중 요청 로그는 생략 (통계는 /__stats)
+        pass
+
+    def _send(self, status, body, content_type='text/html; charset=utf-8', headers=None):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+        Stats.add(status)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == '/__stats':
+            self._send(200, json.dumps(Stats.snapshot()), 'application/json')
+            return
+
+        # 지연 및 장애 주입
+        delay = MockConfig.latency_ms + random.random() * MockConfig.jitter_ms
+        time.sleep(delay / 1000.0)
+        roll = random.random()
+        if roll < MockConfig.rate_429:
+            self._send(429, 'Too Many Requests', 'text/plain; charset=utf-8', {'Retry-After': '5'})
+            return
+        if roll < MockConfig.rate_429 + MockConfig.error_rate:
+            self._send(random.choice([500, 502, 503]), 'Server Error', 'text/plain; charset=utf-8')
+            return
+
+        parts = url.path.split('/', 2)
+        slug = parts[1] if len(parts) > 1 else ''
+        rest = f"/{parts[2]}" if len(parts) > 2 else '/'
+        if slug not in SECTIONS:
+            self._send(404, 'Not Found', 'text/plain; charset=utf-8')
+            return
+
+        path_and_query = f"{rest}?{url.query}" if url.query else rest
+        try:
+            recorded = load_recording(slug, path_and_query, self.headers.get('Host', 'localhost'))
+        except Exception as e:
+            self._send(502, f'Recording failed: {e}', 'text/plain; charset=utf-8')
+            return
+        if recorded is not None:
+            self._send(200, recorded)
+            return
+
+        prefix = ARTICLE_PREFIX[slug]
+        if rest.startswith(prefix):
+            article_id = rest[len(prefix):].strip('/')
+            if not article_id.isdigit():
+                self._send(404, 'Not Found', 'text/plain; charset=utf-8')
+                return
+            self._send(200, render_article(slug, int(article_id)))
+            return
+
+        section = SECTIONS[slug].get(rest)
+        if section is None:
+            self._send(404, 'Not Found', 'text/plain; charset=utf-8')
+            return
+        try:
+            page_no = int(parse_qs(url.query).get('page', ['1'])[0])
+        except ValueError:
+            page_no = 1
+        self._send(200, render_list(slug, section[0], page_no))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤러 부하 테스트용 로컬 모의 뉴스 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8088)
+    parser.add_argument('--latency-ms', type=float, default=50.0, help="응답 기본 지연 (ms)")
+    parser.add_argument('--jitter-ms', type=float, default=50.0, help="응답 지연 랜덤 추가분 최대값 (ms)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="5xx 응답 비율 (0-1)")
+    parser.add_argument('--rate-429', type=float, default=0.0, help="429 응답 비율 (0-1)")
+    parser.add_argument('--articles-per-day', type=int, default=15, help="하위 카테고리별 오늘 기사 수")
+    parser.add_argument('--record-dir', default=None, help="녹화된 페이지 디렉토리")
+    parser.add_argument('--record', action='store_true', help="녹화본이 없으면 실제 사이트에서 받아 저장")
+    args = parser.parse_args()
+
+    MockConfig.latency_ms = args.latency_ms
+    MockConfig.jitter_ms = args.jitter_ms
+    MockConfig.error_rate = args.error_rate
+    MockConfig.rate_429 = args.rate_429
+    MockConfig.articles_per_day = args.articles_per_day
+    MockConfig.record_dir = args.record_dir
+    MockConfig.record = args.record
+
+    server = ThreadingHTTPServer((args.host, args.port), MockNewsHandler)
+    print(f"🧪 모의 뉴스 서버 시작: http://{args.host}:{args.port} ({', '.join(SECTIONS.keys())})")
+    print(f"   크롤러 연결: CRAWL_BASE_URL=http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"통계: {json.dumps(Stats.snapshot(), ensure_ascii=False)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -6,78 +6,94 @@ import pytz
 from tzlocal import get_localzone
 import sys
 import os
-from crawling.NewsCrawler import crawl_all_company_articles
+from crawling.company import crawl_targets
+from crawling.NewsCrawler import AsyncNewsCrawler, CRAWL_TIME_BUDGET
 
-@app.task(name='tasks.scheduled_crawling')
-def scheduled_crawling():
-    """
-    1시간마다 실행되는 뉴스 크롤링 태스크
-    모든 회사의 크롤링을 비동기적으로 실행
-    """
-    # 현재 시간 기록
-    start_time = time.time()
-    
+def _current_time() -> str:
     # 시스템의 로컬 타임존 가져오기
     try:
         local_tz = get_localzone()
     except Exception:
         # 타임존을 가져올 수 없는 경우 'Asia/Seoul' 사용
         local_tz = pytz.timezone('Asia/Seoul')
-    
-    # 현재 시간 표시
+
     utc_now = datetime.now(pytz.utc)
-    local_now = utc_now.astimezone(local_tz)
-    current_time = local_now.strftime("%Y-%m-%d %H:%M:%S")
-    print(f"📅 뉴스 크롤링 작업 시작 - {current_time}")
-    
+    return utc_now.astimezone(local_tz).strftime("%Y-%m-%d %H:%M:%S")
+
+@app.task(name='tasks.scheduled_crawling', bind=True)
+def scheduled_crawling(self):
+    """
+    1시간마다 실행되는 뉴스 크롤링 태스크
+    회사별 크롤링 태스크(tasks.crawl_company)로 나누어 큐에 넣습니다.
+    각 회사는 서로 다른 워커 프로세스/컨테이너가 가져가 동시에 처리하므로
+    CELERY_WORKER_CONCURRENCY나 크롤러 컨테이너를 늘리면 그만큼 병렬로 수집됩니다
+    (같은 회사의 기사 URL은 crawl_frontier의 SKIP LOCKED 임대로 중복 없이 나뉨).
+    """
+    current_time = _current_time()
+    print(f"📅 뉴스 크롤링 작업 분배 - {current_time}")
+
+    # 모든 회사 태스크가 공유하는 시간 예산 (대기열에서 기다린 시간도 포함)
+    deadline = time.time() + CRAWL_TIME_BUDGET
+    # 이 태스크가 전달된 큐(beat 설정의 crawling 큐)로 회사별 태스크도 보냄
+    queue = (self.request.delivery_info or {}).get('routing_key')
+
+    for company in crawl_targets:
+        crawl_company.apply_async(
+            args=[company, deadline],
+            queue=queue,
+            expires=CRAWL_TIME_BUDGET,  # 예산 안에 시작하지 못한 태스크는 버림 (다음 실행에서 처리)
+            time_limit=2700,  # 시간 제한 (45분)
+            soft_time_limit=2400,  # 소프트 시간 제한 (40분)
+        )
+    print(f"🚀 회사별 크롤링 태스크 {len(crawl_targets)}개 발송: {', '.join(crawl_targets)}")
+
+    return {
+        "message": f"뉴스 크롤링 작업 분배 완료: {len(crawl_targets)}개 회사",
+        "timestamp": current_time,
+        "companies": list(crawl_targets)
+    }
+
+@app.task(name='tasks.crawl_company')
+def crawl_company(company: str, deadline: float):
+    """
+    한 회사의 뉴스 크롤링 태스크
+    프런티어에 남은 기사 URL을 먼저 임대(claim)하여 처리한 뒤 주기가 도래한 하위 카테고리를 수집합니다.
+    """
+    start_time = time.time()
+    current_time = _current_time()
+    print(f"📅 [{company}] 뉴스 크롤링 작업 시작 - {current_time}")
+
     try:
-        print("환경 설정 확인...")
-        print(f"현재 작업 디렉토리: {os.getcwd()}")
-        print(f"파일 목록: {os.listdir('.')}")
-        print(f"크롤링 디렉토리 확인: {os.listdir('./crawling') if os.path.exists('./crawling') else '크롤링 디렉토리 없음'}")
-        
-        print("🚀 NewsCrawler를 사용한 비동기 크롤링 시작...")
-        
         # asyncio.run은 기존 이벤트 루프가 있으면 에러가 발생하므로 직접 루프를 관리
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
-        
-        # NewsCrawler를 사용한 크롤링 실행
+
         try:
-            print("크롤링 작업 시작 중...")
-            results = loop.run_until_complete(crawl_all_company_articles())
-            print("크롤링 작업 완료")
+            result = loop.run_until_complete(AsyncNewsCrawler.crawl_company(company, deadline))
         finally:
             # 항상 이벤트 루프를 닫아줍니다
             try:
                 loop.close()
-                print("이벤트 루프 종료됨")
             except Exception as e:
                 print(f"이벤트 루프 종료 중 오류: {e}")
-        
-        # 성공적으로 크롤링된 회사 수 계산
-        successful_crawls = sum(1 for r in results if r and not isinstance(r, Exception))
-        total_companies = len(["한국경제", "세계일보", "중앙일보", "문화일보"])  # 크롤링 대상 회사 수
+
         execution_time = time.time() - start_time
-        
-        # 결과 출력
-        print(f"\n🏁 총 {total_companies}개 회사 중 {successful_crawls}개 크롤링 완료!")
-        print(f"✅ 총 소요 시간: {execution_time:.2f}초")
-        
-        # 결과 반환
+        article_count = len(result) if result else 0
+        print(f"🏁 [{company}] 기사 {article_count}건 수집, 소요 시간: {execution_time:.2f}초")
+
         return {
-            "message": f"뉴스 크롤링 작업 완료: {successful_crawls}/{total_companies}개 회사",
+            "message": f"{company} 뉴스 크롤링 완료: {article_count}건",
             "timestamp": current_time,
             "execution_time_seconds": execution_time,
-            "successful_crawls": successful_crawls
+            "article_count": article_count
         }
     except Exception as e:
         import traceback
-        print(f"크롤링 작업 중 오류 발생: {e}")
+        print(f"[{company}] 크롤링 작업 중 오류 발생: {e}")
         print(f"상세 오류: {traceback.format_exc()}")
         return {
-            "message": f"크롤링 작업 실패: {str(e)}",
+            "message": f"{company} 크롤링 작업 실패: {str(e)}",
             "timestamp": current_time,
             "execution_time_seconds": time.time() - start_time,
-            "successful_crawls": 0
-        }
\ No newline at end of file
+            "article_count": 0
+        }